@@ -34,6 +34,10 @@ from src.utils.http import (
     json_response,
     translate_exceptions,
 )
+from src.utils.llm_analysis import warm_bedrock_client
+
+# Ingestion scores artifacts with Bedrock; build the client during Lambda INIT
+warm_bedrock_client()
 
 # =============================================================================
 # Lambda Handler: POST /artifact/{artifact_type}
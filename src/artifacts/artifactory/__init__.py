@@ -10,17 +10,23 @@ This module provides the core artifact management functionality for ModelGuard:
 Public API (used by Lambda handlers):
     create_artifact() - Create new artifact with metadata fetching and S3 upload
     save_artifact_metadata() - Save artifact to DynamoDB
+    save_artifact_metadata_bulk() - Save several artifacts to DynamoDB in batches
     load_artifact_metadata() - Load single artifact by ID
+    load_artifacts_metadata() - Load several artifacts by ID in batches
     load_all_artifacts() - Load all artifacts from DynamoDB
     load_all_artifacts_by_fields() - Filter artifacts by field values
+    load_artifacts_by_names() - Resolve several artifacts by type and name in one pass
 """
 
 from .factory import create_artifact
 from .persistence import (
     save_artifact_metadata,
+    save_artifact_metadata_bulk,
     load_artifact_metadata,
+    load_artifacts_metadata,
     load_all_artifacts,
     load_all_artifacts_by_fields,
+    load_artifacts_by_names,
 )
 from .rejection import scores_below_threshold
 from .js_programs import run_js_program
@@ -28,9 +34,12 @@ from .js_programs import run_js_program
 __all__ = [
     "create_artifact",
     "save_artifact_metadata",
+    "save_artifact_metadata_bulk",
     "load_artifact_metadata",
+    "load_artifacts_metadata",
     "load_all_artifacts",
     "load_all_artifacts_by_fields",
+    "load_artifacts_by_names",
     "scores_below_threshold",
     "run_js_program",
 ]
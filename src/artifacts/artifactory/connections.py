@@ -13,20 +13,26 @@ Model Artifacts are rescored when connections are made;
 this may result in rejected artifacts being promoted to accepted status.
 """
 
+import concurrent.futures
 from functools import singledispatch
-from typing import List
+from typing import Dict, List, Optional
 
 from src.artifacts.base_artifact import BaseArtifact
 from src.artifacts.model_artifact import ModelArtifact
 from src.artifacts.code_artifact import CodeArtifact
 from src.artifacts.dataset_artifact import DatasetArtifact
+from src.artifacts.types import ArtifactType
 from src.logutil import clogger
+from src.metrics import Metric
 from .discovery import _find_connected_artifact_names
 from .persistence import (
     load_all_artifacts,
     load_all_artifacts_by_fields,
+    load_artifacts_by_names,
     load_artifact_metadata,
+    load_artifacts_metadata,
     save_artifact_metadata,
+    save_artifact_metadata_bulk,
 )
 from .rejection import scores_below_threshold, promote
 
@@ -62,8 +68,9 @@ def _(artifact: ModelArtifact) -> None:
     Connect model artifact to related artifacts (code, dataset, parent/child models).
 
     This function:
-    1. Uses LLM to extract connected artifact names from model files
-    2. Searches for matching code/dataset/parent model artifacts by name
+    1. Uses LLM to extract connected artifact names from model files (while the
+       artifact tables are scanned concurrently)
+    2. Resolves matching code/dataset/parent model artifacts by name in one lookup
     3. Links them by setting artifact IDs (code_artifact_id, dataset_artifact_id, etc.)
     4. Handles bidirectional parent-child relationships
     5. Triggers metric recomputation for affected models
@@ -77,50 +84,48 @@ def _(artifact: ModelArtifact) -> None:
     Args:
         artifact: The model artifact to connect
     """
-    # Step 1: Extract connected artifact names using LLM
-    _find_connected_artifact_names(artifact)
+    # Steps 1-2: Extract connected artifact names using LLM while both artifact tables
+    # are scanned in the background; the scans don't depend on the discovered names,
+    # so their DynamoDB latency hides behind the S3 download and LLM call.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        # Only names and lineage fields are needed here; children are reloaded in full
+        all_artifacts_future = executor.submit(
+            load_all_artifacts, fields=("parent_model_name", "parent_model_id")
+        )
+        all_rejected_artifacts_future = executor.submit(load_all_artifacts, rejected=True)
 
-    # Step 2: Load all artifacts once (optimization - reuse for multiple searches)
-    all_artifacts: List[BaseArtifact] = load_all_artifacts()
+        _find_connected_artifact_names(artifact)
 
-    # Step 3: Connect to code artifact if name was found
-    if artifact.code_name and not artifact.code_artifact_id:
-        code_artifacts = load_all_artifacts_by_fields(
-            fields={"name": artifact.code_name},
-            artifact_type="code",
-            artifact_list=all_artifacts,
-        )
-        if code_artifacts:
-            code_artifact = code_artifacts[0]
-            if isinstance(code_artifact, CodeArtifact):
-                artifact.code_artifact_id = code_artifact.artifact_id
+        # Load all artifacts once (optimization - reuse for multiple searches)
+        all_artifacts: List[BaseArtifact] = all_artifacts_future.result()
+        all_rejected_artifacts: List[BaseArtifact] = all_rejected_artifacts_future.result()
 
-    # Step 4: Connect to dataset artifact if name was found
+    # Step 3: Resolve code, dataset and parent model names in a single indexed lookup
+    wanted: Dict[ArtifactType, Optional[str]] = {}
+    if artifact.code_name and not artifact.code_artifact_id:
+        wanted["code"] = artifact.code_name
     if artifact.dataset_name and not artifact.dataset_artifact_id:
-        dataset_artifacts = load_all_artifacts_by_fields(
-            fields={"name": artifact.dataset_name},
-            artifact_type="dataset",
-            artifact_list=all_artifacts,
-        )
-        if dataset_artifacts:
-            dataset_artifact = dataset_artifacts[0]
-            if isinstance(dataset_artifact, DatasetArtifact):
-                artifact.dataset_artifact_id = dataset_artifact.artifact_id
-
-    # Step 5: Connect to parent model if name was found
-    parent_model_artifact: BaseArtifact | None = None
+        wanted["dataset"] = artifact.dataset_name
     if artifact.parent_model_name and not artifact.parent_model_id:
-        parent_model_artifacts = load_all_artifacts_by_fields(
-            fields={"name": artifact.parent_model_name},
-            artifact_type="model",
-            artifact_list=all_artifacts,
-        )
-        if parent_model_artifacts:
-            parent_model_artifact = parent_model_artifacts[0]
-            if isinstance(parent_model_artifact, ModelArtifact):
-                artifact.parent_model_id = parent_model_artifact.artifact_id
+        wanted["model"] = artifact.parent_model_name
+    resolved = load_artifacts_by_names(wanted, artifact_list=all_artifacts)
+
+    # Step 4: Link the artifacts that were found
+    code_artifact = resolved.get(("code", artifact.code_name or ""))
+    if isinstance(code_artifact, CodeArtifact):
+        artifact.code_artifact_id = code_artifact.artifact_id
+
+    dataset_artifact = resolved.get(("dataset", artifact.dataset_name or ""))
+    if isinstance(dataset_artifact, DatasetArtifact):
+        artifact.dataset_artifact_id = dataset_artifact.artifact_id
+
+    parent_model_artifact: BaseArtifact | None = resolved.get(
+        ("model", artifact.parent_model_name or "")
+    )
+    if isinstance(parent_model_artifact, ModelArtifact):
+        artifact.parent_model_id = parent_model_artifact.artifact_id
 
-    # Step 6: Check if this model is the parent of any existing models
+    # Step 5: Check if this model is the parent of any existing models
     def update_child_models(artifact_list: List[BaseArtifact]) -> List[BaseArtifact]:
         if artifact.child_model_ids is None:
             artifact.child_model_ids = []
@@ -133,6 +138,11 @@ def _(artifact: ModelArtifact) -> None:
 
             # Update child model artifacts to link to this parent model
             for model_artifact in model_artifacts:
+                if getattr(model_artifact, "parent_model_id", None) == artifact.artifact_id:
+                    # Already linked (idempotent re-connect): nothing to rescore or save
+                    artifact.child_model_ids.append(model_artifact.artifact_id)
+                    continue
+
                 child_model_artifact: BaseArtifact | None = load_artifact_metadata(
                     model_artifact.artifact_id
                 )
@@ -160,7 +170,6 @@ def _(artifact: ModelArtifact) -> None:
 
     # Do the same, but for rejected artifacts.
     # If scores valid, ingest.
-    all_rejected_artifacts: List[BaseArtifact] = load_all_artifacts(rejected=True)
     rejected_child_models = update_child_models(all_rejected_artifacts)
 
     for child_model in rejected_child_models:
@@ -187,7 +196,7 @@ def _(artifact: CodeArtifact) -> None:
     Side Effects:
         - Modifies linked model artifacts to set code_artifact_id
         - Triggers CODE_METRICS recomputation for linked models
-        - Saves updated model artifacts to DynamoDB
+        - Saves updated model artifacts to DynamoDB in one batched write per table
 
     Args:
         artifact: The code artifact to connect
@@ -195,22 +204,26 @@ def _(artifact: CodeArtifact) -> None:
 
     def update_connected_models(artifacts: List[BaseArtifact], rejected: bool = False) -> None:
         # Update linked model artifacts to reference this code artifact
+        linked: List[ModelArtifact] = []
         for model_artifact in artifacts:
             if not isinstance(model_artifact, ModelArtifact) or model_artifact.code_artifact_id:
                 clogger.debug(f" Skipping ModelArtifact {model_artifact.artifact_id} ")
                 continue
             model_artifact.code_artifact_id = artifact.artifact_id
+            linked.append(model_artifact)
 
-            from src.metrics.registry import (
-                CODE_METRICS,
-            )  # Lazy import to avoid circular dependency
+        from src.metrics.registry import (
+            CODE_METRICS,
+        )  # Lazy import to avoid circular dependency
 
-            model_artifact.compute_scores(CODE_METRICS)  # Recompute scores
+        _rescore_models(linked, CODE_METRICS)  # Recompute scores
 
+        to_save: List[BaseArtifact] = []
+        for model_artifact in linked:
             if not rejected:
                 # Save updated model
                 clogger.debug(f" Updating connected ModelArtifact {model_artifact.artifact_id} ")
-                save_artifact_metadata(model_artifact)
+                to_save.append(model_artifact)
             elif not scores_below_threshold(model_artifact):
                 # Promote if scores valid
                 clogger.debug(f" Promoting connected ModelArtifact {model_artifact.artifact_id} ")
@@ -220,11 +233,18 @@ def _(artifact: CodeArtifact) -> None:
                 clogger.debug(
                     f" Updating connected Rejected ModelArtifact {model_artifact.artifact_id} "
                 )
-                save_artifact_metadata(model_artifact, rejected=True)
+                to_save.append(model_artifact)
 
-    # Get all models (both accepted and rejected)
-    model_artifacts: List[BaseArtifact] = load_all_artifacts()
-    rejected_model_artifacts: List[BaseArtifact] = load_all_artifacts(rejected=True)
+        # One batched write for every updated model instead of a round-trip per model
+        if to_save:
+            save_artifact_metadata_bulk(to_save, rejected=rejected)
+
+    # Get all models (both accepted and rejected), reading only the fields matching needs
+    match_fields = ("code_name", "code_artifact_id")
+    model_artifacts: List[BaseArtifact] = load_all_artifacts(fields=match_fields)
+    rejected_model_artifacts: List[BaseArtifact] = load_all_artifacts(
+        rejected=True, fields=match_fields
+    )
 
     # Find all models that reference this code by name (both accepted and rejected)
     connected_model_artifacts: List[BaseArtifact] = load_all_artifacts_by_fields(
@@ -233,7 +253,7 @@ def _(artifact: CodeArtifact) -> None:
         artifact_list=model_artifacts,
         match_threshold=CONNECTION_MATCH_THRESHOLD,
     )
-    update_connected_models(connected_model_artifacts)
+    update_connected_models(_load_unlinked_models(connected_model_artifacts, "code_artifact_id"))
 
     connected_rejected_model_artifacts: List[BaseArtifact] = load_all_artifacts_by_fields(
         fields={"code_name": artifact.name},
@@ -241,7 +261,12 @@ def _(artifact: CodeArtifact) -> None:
         artifact_list=rejected_model_artifacts,
         match_threshold=CONNECTION_MATCH_THRESHOLD,
     )
-    update_connected_models(connected_rejected_model_artifacts, rejected=True)
+    update_connected_models(
+        _load_unlinked_models(
+            connected_rejected_model_artifacts, "code_artifact_id", rejected=True
+        ),
+        rejected=True,
+    )
 
     clogger.info(
         f"Connected artifact {artifact.artifact_id} ({artifact.artifact_type}) "
@@ -261,7 +286,7 @@ def _(artifact: DatasetArtifact) -> None:
     Side Effects:
         - Modifies linked model artifacts to set dataset_artifact_id
         - Triggers DATASET_METRICS recomputation for linked models
-        - Saves updated model artifacts to DynamoDB
+        - Saves updated model artifacts to DynamoDB in one batched write per table
 
     Args:
         artifact: The dataset artifact to connect
@@ -269,22 +294,26 @@ def _(artifact: DatasetArtifact) -> None:
 
     def update_connected_models(artifacts: List[BaseArtifact], rejected: bool = False) -> None:
         # Update linked model artifacts to reference this dataset artifact
+        linked: List[ModelArtifact] = []
         for model_artifact in artifacts:
             if not isinstance(model_artifact, ModelArtifact) or model_artifact.dataset_artifact_id:
                 clogger.debug(f" Skipping ModelArtifact {model_artifact.artifact_id} ")
                 continue
             model_artifact.dataset_artifact_id = artifact.artifact_id
+            linked.append(model_artifact)
 
-            from src.metrics.registry import (
-                DATASET_METRICS,
-            )  # Lazy import to avoid circular dependency
+        from src.metrics.registry import (
+            DATASET_METRICS,
+        )  # Lazy import to avoid circular dependency
 
-            model_artifact.compute_scores(DATASET_METRICS)  # Recompute scores
+        _rescore_models(linked, DATASET_METRICS)  # Recompute scores
 
+        to_save: List[BaseArtifact] = []
+        for model_artifact in linked:
             if not rejected:
                 # save updated model
                 clogger.debug(f" Updating connected ModelArtifact {model_artifact.artifact_id} ")
-                save_artifact_metadata(model_artifact)
+                to_save.append(model_artifact)
             elif not scores_below_threshold(model_artifact):
                 # promote if scores valid
                 clogger.debug(f" Promoting connected ModelArtifact {model_artifact.artifact_id} ")
@@ -294,11 +323,18 @@ def _(artifact: DatasetArtifact) -> None:
                 clogger.debug(
                     f" Updating connected Rejected ModelArtifact {model_artifact.artifact_id} "
                 )
-                save_artifact_metadata(model_artifact, rejected=True)
+                to_save.append(model_artifact)
 
-    # Get all models (both accepted and rejected)
-    model_artifacts: List[BaseArtifact] = load_all_artifacts()
-    rejected_model_artifacts: List[BaseArtifact] = load_all_artifacts(rejected=True)
+        # One batched write for every updated model instead of a round-trip per model
+        if to_save:
+            save_artifact_metadata_bulk(to_save, rejected=rejected)
+
+    # Get all models (both accepted and rejected), reading only the fields matching needs
+    match_fields = ("dataset_name", "dataset_artifact_id")
+    model_artifacts: List[BaseArtifact] = load_all_artifacts(fields=match_fields)
+    rejected_model_artifacts: List[BaseArtifact] = load_all_artifacts(
+        rejected=True, fields=match_fields
+    )
 
     # Find all models that reference this dataset by name (both accepted and rejected)
     connected_model_artifacts: List[BaseArtifact] = load_all_artifacts_by_fields(
@@ -307,7 +343,7 @@ def _(artifact: DatasetArtifact) -> None:
         artifact_list=model_artifacts,
         match_threshold=CONNECTION_MATCH_THRESHOLD,
     )
-    update_connected_models(connected_model_artifacts)
+    update_connected_models(_load_unlinked_models(connected_model_artifacts, "dataset_artifact_id"))
 
     connected_rejected_model_artifacts: List[BaseArtifact] = load_all_artifacts_by_fields(
         fields={"dataset_name": artifact.name},
@@ -315,6 +351,72 @@ def _(artifact: DatasetArtifact) -> None:
         artifact_list=rejected_model_artifacts,
         match_threshold=CONNECTION_MATCH_THRESHOLD,
     )
-    update_connected_models(connected_rejected_model_artifacts, rejected=True)
+    update_connected_models(
+        _load_unlinked_models(
+            connected_rejected_model_artifacts, "dataset_artifact_id", rejected=True
+        ),
+        rejected=True,
+    )
 
     clogger.info(f"Connected artifact {artifact.artifact_id} ({artifact.artifact_type}) ")
+
+
+# =============================================================================
+# Helper Functions (Internal)
+# =============================================================================
+
+
+# Linked models rescored at once. Each compute_scores() call already runs up to 8
+# metrics on its own pool, so this stays small to bound the total thread count.
+RESCORE_MAX_WORKERS = 4
+
+
+def _rescore_models(models: List[ModelArtifact], metrics: List[Metric]) -> None:
+    """
+    Recompute the given metrics for several models concurrently.
+
+    Metric computation is mostly I/O (Bedrock, S3, upstream hubs), so linking a
+    popular code/dataset artifact to K models takes roughly K / RESCORE_MAX_WORKERS
+    rounds instead of K. Exceptions from compute_scores() propagate.
+
+    Args:
+        models: Models to rescore (modified in place)
+        metrics: Metrics to recompute
+    """
+    if len(models) <= 1:
+        for model in models:
+            model.compute_scores(metrics)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(RESCORE_MAX_WORKERS, len(models))
+    ) as executor:
+        for _ in executor.map(lambda model: model.compute_scores(metrics), models):
+            pass
+
+
+def _load_unlinked_models(
+    artifacts: List[BaseArtifact], link_field: str, rejected: bool = False
+) -> List[BaseArtifact]:
+    """
+    Load, in full, the matched models that are not linked through link_field yet.
+
+    The catalog scans above only read the fields needed for matching, so the models
+    that are about to be rescored and saved are fetched in one batched read.
+
+    Args:
+        artifacts: Partially loaded artifacts that matched by name
+        link_field: Connection id field to check (e.g. "code_artifact_id")
+        rejected: Load from the rejected artifacts table
+
+    Returns:
+        Fully loaded ModelArtifacts that still need linking
+    """
+    artifact_ids = [
+        a.artifact_id
+        for a in artifacts
+        if isinstance(a, ModelArtifact) and not getattr(a, link_field)
+    ]
+    if not artifact_ids:
+        return []
+    return load_artifacts_metadata(artifact_ids, rejected=rejected)
@@ -9,13 +9,11 @@ configuration files, and other metadata to discover relationships like:
 - Parent models (if this is a fine-tuned model)
 """
 
-import os
-import tempfile
 from typing import Any, Dict, Optional, Union
 
 from src.artifacts.model_artifact import ModelArtifact
 from src.logutil import clogger
-from src.storage.s3_utils import download_artifact_from_s3
+from src.storage.s3_utils import stream_artifact_from_s3
 from src.storage.file_extraction import extract_relevant_files
 from src.utils.llm_analysis import (
     build_extract_fields_from_files_prompt,
@@ -48,11 +46,9 @@ def _find_connected_artifact_names(artifact: ModelArtifact) -> None:
     Args:
         artifact: The model artifact to analyze
     """
-    tmp_path: Optional[str] = None
-
     try:
-        # Step 1: Download artifact and extract relevant files
-        tmp_path, files = _download_and_extract_files(artifact)
+        # Step 1: Stream artifact from S3 and extract relevant files
+        files = _download_and_extract_files(artifact)
 
         # Step 2: Use LLM to extract connection fields from files
         extracted_data = _llm_extract_fields(artifact, files)
@@ -71,16 +67,6 @@ def _find_connected_artifact_names(artifact: ModelArtifact) -> None:
         )
     except Exception as e:
         clogger.error(f"Failed to extract connected artifact names for {artifact.artifact_id}: {e}")
-    finally:
-        # Clean up temp file
-        if tmp_path and os.path.exists(tmp_path):
-            try:
-                os.unlink(tmp_path)
-                clogger.debug(f"[discovery] Cleaned up temp file: {tmp_path}")
-            except Exception as cleanup_err:
-                clogger.warning(
-                    f"[discovery] Failed to clean up temp file {tmp_path}: {cleanup_err}"
-                )
 
 
 # =============================================================================
@@ -88,52 +74,39 @@ def _find_connected_artifact_names(artifact: ModelArtifact) -> None:
 # =============================================================================
 
 
-def _download_and_extract_files(
-    artifact: ModelArtifact,
-) -> tuple[str, Dict[str, str]]:
+def _download_and_extract_files(artifact: ModelArtifact) -> Dict[str, str]:
     """
-    Download artifact from S3 and extract relevant files for analysis.
+    Stream artifact from S3 and extract relevant files for analysis.
 
-    Downloads the artifact tar file from S3 to a temporary location and
-    extracts relevant files (README, JSON configs, etc.) for LLM analysis.
+    The tarball is decompressed straight from the S3 response body, so it is never
+    written to (or read back from) local disk. Relevant files (README, JSON configs,
+    etc.) are kept for LLM analysis.
 
     Args:
         artifact: The model artifact to download
 
     Returns:
-        Tuple of (temp_file_path, files_dict) where:
-        - temp_file_path: Path to the downloaded temp file (caller must clean up)
-        - files_dict: Dictionary mapping filenames to their contents (limited to 10 files)
+        Dictionary mapping filenames to their contents (limited to 10 files)
 
     Raises:
-        Exception: If download or extraction fails
+        Exception: If the S3 request fails or the stream breaks mid-archive
     """
-    # Create a unique temp file for this artifact
-    tmp_file = tempfile.NamedTemporaryFile(
-        delete=False,
-        suffix=".tar.gz",
-        prefix=f"discovery_{artifact.artifact_id}_",
-        dir="/tmp",
-    )
-    tmp_path = tmp_file.name
-    tmp_file.close()  # Close so download_artifact_from_s3 can write to it
-
-    # Download artifact from S3 to temp location
-    download_artifact_from_s3(
+    body = stream_artifact_from_s3(
         artifact_id=artifact.artifact_id,
         s3_key=artifact.s3_key,
-        local_path=tmp_path,
-    )
-
-    # Extract relevant files for analysis
-    files: Dict[str, str] = extract_relevant_files(
-        tar_path=tmp_path,
-        include_ext={".json", ".md", ".txt"},
-        max_files=10,
-        prioritize_readme=True,
     )
+    try:
+        # Extract relevant files for analysis
+        files: Dict[str, str] = extract_relevant_files(
+            fileobj=body,
+            include_ext={".json", ".md", ".txt"},
+            max_files=10,
+            prioritize_readme=True,
+        )
+    finally:
+        body.close()
 
-    return tmp_path, files
+    return files
 
 
 def _llm_extract_fields(artifact: ModelArtifact, files: Dict[str, str]) -> Optional[Dict[str, Any]]:
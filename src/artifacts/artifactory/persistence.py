@@ -2,20 +2,33 @@
 Artifact persistence functions for DynamoDB storage and retrieval.
 
 This module contains functions for:
-- Saving artifacts to DynamoDB
-- Loading single artifacts by ID
+- Saving artifacts to DynamoDB (singly or in bulk)
+- Loading single artifacts by ID (or several in one batch)
 - Loading all artifacts (full table scan)
 - Filtering artifacts by field values with case-insensitive matching
+- Resolving several (artifact_type, name) pairs in one pass
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from difflib import SequenceMatcher
 
 from src.artifacts.base_artifact import BaseArtifact
 from src.artifacts.types import ArtifactType
 from src.logutil import clogger
 from src.settings import ARTIFACTS_TABLE, REJECTED_ARTIFACTS_TABLE
-from src.storage.dynamo_utils import save_item_to_table, load_item_from_key, scan_table
+from src.storage.dynamo_utils import (
+    batch_get_items,
+    batch_save_items,
+    load_item_from_key,
+    save_item_to_table,
+    scan_table,
+)
+
+
+# Attributes every partial load_all_artifacts(fields=...) scan reads; enough to rebuild
+# an artifact object and match it by id, type and name. s3_key must be included or
+# create_artifact() would treat the partial item as a brand-new upload.
+ARTIFACT_INDEX_FIELDS = ("artifact_id", "artifact_type", "name", "source_url", "s3_key")
 
 
 # =============================================================================
@@ -40,6 +53,26 @@ def save_artifact_metadata(artifact: BaseArtifact, rejected: bool = False) -> No
     save_item_to_table(table_name, artifact.to_dict())
 
 
+def save_artifact_metadata_bulk(artifacts: List[BaseArtifact], rejected: bool = False) -> None:
+    """
+    Store metadata for several artifacts in DynamoDB with batched writes.
+
+    Args:
+        artifacts: The artifact instances to save
+        rejected: Save to the rejected artifacts table instead of the main one
+
+    Raises:
+        ClientError: If DynamoDB operation fails
+    """
+    if not artifacts:
+        return
+    if rejected:
+        table_name = REJECTED_ARTIFACTS_TABLE
+    else:
+        table_name = ARTIFACTS_TABLE
+    batch_save_items(table_name, (artifact.to_dict() for artifact in artifacts))
+
+
 def load_artifact_metadata(artifact_id: str, rejected: bool = False) -> Optional[BaseArtifact]:
     """
     Retrieve artifact metadata from DynamoDB and reconstruct the artifact instance.
@@ -81,7 +114,56 @@ def load_artifact_metadata(artifact_id: str, rejected: bool = False) -> Optional
     return artifact
 
 
-def load_all_artifacts(rejected: bool = False) -> List[BaseArtifact]:
+def load_artifacts_metadata(artifact_ids: List[str], rejected: bool = False) -> List[BaseArtifact]:
+    """
+    Retrieve several artifacts from DynamoDB in batched reads.
+
+    Like calling load_artifact_metadata() for each id, but with one BatchGetItem
+    request per 100 ids instead of a GetItem per artifact.
+
+    Args:
+        artifact_ids: UUIDs of the artifacts to load
+        rejected: Load from the rejected artifacts table instead of the main one
+
+    Returns:
+        The artifacts that were found, in the order their ids were given
+    """
+    from .factory import create_artifact  # Lazy import to avoid circular dependency
+
+    if not artifact_ids:
+        return []
+
+    if rejected:
+        table_name = REJECTED_ARTIFACTS_TABLE
+    else:
+        table_name = ARTIFACTS_TABLE
+
+    items_by_id = {
+        item.get("artifact_id"): item
+        for item in batch_get_items(table_name, "artifact_id", artifact_ids)
+    }
+
+    artifacts: List[BaseArtifact] = []
+    for artifact_id in dict.fromkeys(artifact_ids):
+        item = items_by_id.get(artifact_id)
+        if not item:
+            clogger.warning(f"Artifact {artifact_id} not found")
+            continue
+        artifact_type = item.get("artifact_type")
+        if not artifact_type:
+            clogger.warning(f"Artifact {artifact_id} missing artifact_type field")
+            continue
+
+        kwargs = dict(item)
+        kwargs.pop("artifact_type", None)
+        artifacts.append(create_artifact(artifact_type, **kwargs))
+
+    return artifacts
+
+
+def load_all_artifacts(
+    rejected: bool = False, fields: Optional[Iterable[str]] = None
+) -> List[BaseArtifact]:
     """
     Load all artifacts from the DynamoDB table.
 
@@ -89,6 +171,14 @@ def load_all_artifacts(rejected: bool = False) -> List[BaseArtifact]:
     for large tables. Consider using load_all_artifacts_by_fields() with artifact_list
     parameter if you already have artifacts loaded.
 
+    Args:
+        rejected: Scan the rejected artifacts table instead of the main one
+        fields: Optional extra attributes to read. When given, only these plus
+            ARTIFACT_INDEX_FIELDS are fetched and the returned artifacts are partial:
+            fine for matching by name/type/field, but reload them with
+            load_artifact_metadata() or load_artifacts_metadata() before modifying
+            or saving.
+
     Returns:
         List of BaseArtifact instances
 
@@ -105,7 +195,10 @@ def load_all_artifacts(rejected: bool = False) -> List[BaseArtifact]:
         table_name = ARTIFACTS_TABLE
 
     try:
-        items = scan_table(table_name)
+        if fields is None:
+            items = scan_table(table_name)
+        else:
+            items = scan_table(table_name, attributes=(*ARTIFACT_INDEX_FIELDS, *fields))
 
         for item in items:
             artifact_id = item.get("artifact_id")
@@ -139,7 +232,8 @@ def load_all_artifacts_by_fields(
     Load artifacts matching specific field criteria.
 
     This function filters artifacts by field values with case-insensitive string matching.
-    If artifact_list is provided, searches within it. Otherwise loads all artifacts.
+    If artifact_list is provided (even empty), searches within it. Otherwise loads
+    all artifacts.
 
     Args:
         fields: Dictionary of field names and their expected values
@@ -163,8 +257,9 @@ def load_all_artifacts_by_fields(
             fields={"name": "bert-base-uncased"}
         )
     """
-    # Get candidate artifacts (from provided list or load all)
-    candidates = artifact_list if artifact_list else load_all_artifacts()
+    # Get candidate artifacts (from provided list or load all); an empty pre-loaded
+    # list means nothing matches, not "scan the table instead"
+    candidates = artifact_list if artifact_list is not None else load_all_artifacts()
 
     # Filter by artifact type if specified
     if artifact_type:
@@ -177,6 +272,52 @@ def load_all_artifacts_by_fields(
     return filtered_artifacts
 
 
+def load_artifacts_by_names(
+    names: Dict[ArtifactType, Optional[str]],
+    artifact_list: Optional[List[BaseArtifact]] = None,
+) -> Dict[Tuple[ArtifactType, str], BaseArtifact]:
+    """
+    Resolve several artifacts by exact (case-insensitive) name in a single pass.
+
+    Equivalent to one load_all_artifacts_by_fields(fields={"name": name},
+    artifact_type=type) call per entry, but the candidates are loaded (or walked)
+    once and matched against an index keyed on (artifact_type, lowercased name).
+
+    Args:
+        names: Artifact type -> name to look up. Entries with no name are ignored.
+            Example: {"code": "my-code", "dataset": "wikitext", "model": "bert-base"}
+        artifact_list: Optional pre-loaded artifact list to search within. Unlike
+            load_all_artifacts_by_fields(), an empty list is searched as-is rather
+            than triggering a table scan.
+
+    Returns:
+        Dict mapping (artifact_type, requested name) to the first matching artifact.
+        Names with no match are absent.
+    """
+    wanted: Dict[Tuple[str, str], Tuple[ArtifactType, str]] = {
+        (artifact_type, name.lower()): (artifact_type, name)
+        for artifact_type, name in names.items()
+        if name
+    }
+    if not wanted:
+        return {}
+
+    candidates = artifact_list if artifact_list is not None else load_all_artifacts()
+
+    found: Dict[Tuple[ArtifactType, str], BaseArtifact] = {}
+    for candidate in candidates:
+        if not isinstance(candidate.name, str):
+            continue
+        key = wanted.get((candidate.artifact_type, candidate.name.lower()))
+        if key is not None and key not in found:
+            found[key] = candidate
+            if len(found) == len(wanted):
+                break
+
+    clogger.debug(f"Resolved artifacts by names {names}: {len(found)} of {len(wanted)} found")
+    return found
+
+
 # =============================================================================
 # Helper Functions (Internal)
 # =============================================================================
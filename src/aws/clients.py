@@ -11,17 +11,50 @@ Provides cached access to:
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import boto3
-from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
-from mypy_boto3_cognito_idp.client import CognitoIdentityProviderClient
-from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
-from mypy_boto3_secretsmanager.client import SecretsManagerClient
-from mypy_boto3_s3 import S3Client
+from botocore.config import Config
 
 from src.settings import AWS_REGION
 
+if TYPE_CHECKING:
+    # Stub packages are type-only; importing them at runtime adds ~200ms to cold start
+    from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
+    from mypy_boto3_cognito_idp.client import CognitoIdentityProviderClient
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+    from mypy_boto3_secretsmanager.client import SecretsManagerClient
+    from mypy_boto3_s3 import S3Client
+
+# =====================================================================================
+# Client configuration
+# =====================================================================================
+# All clients keep TCP connections alive so warm Lambda containers reuse
+# sockets across invocations, and use adaptive retries so throttling
+# (ProvisionedThroughputExceeded, S3 SlowDown/503) is backed off client-side.
+DEFAULT_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+# S3 is used for concurrent multipart transfers and pooled bulk deletes, so it
+# also gets a larger connection pool than botocore's default of 10 and
+# explicit timeouts. The read timeout must cover 64 MB multipart parts,
+# 1000-key DeleteObjects batches and streamed GetObject bodies that are read
+# only as fast as the tar is decompressed.
+S3_CLIENT_CONFIG = DEFAULT_CLIENT_CONFIG.merge(
+    Config(
+        max_pool_connections=64,
+        connect_timeout=3,
+        read_timeout=30,
+    )
+)
+
+# Bedrock calls are slow and made concurrently from the compute_scores metric
+# threads, which share one client per region. The larger pool lets those calls
+# reuse warm TLS connections rather than queueing on botocore's default of 10.
+BEDROCK_CLIENT_CONFIG = DEFAULT_CLIENT_CONFIG.merge(Config(max_pool_connections=32))
+
 # =====================================================================================
 # Lazy-initialized client caches
 # =====================================================================================
@@ -29,7 +62,7 @@ from src.settings import AWS_REGION
 _dynamodb_resource: Optional[DynamoDBServiceResource] = None
 _s3_client: Optional[S3Client] = None
 _cognito_client: Optional[CognitoIdentityProviderClient] = None
-_bedrock_runtime: Optional[BedrockRuntimeClient] = None
+_bedrock_runtimes: Dict[str, BedrockRuntimeClient] = {}
 _secrets_manager_client: Optional[SecretsManagerClient] = None
 _lambda_client: Optional[Any] = None
 
@@ -49,7 +82,9 @@ def get_dynamodb() -> DynamoDBServiceResource:
         raise RuntimeError("boto3 is not available in this environment")
 
     if _dynamodb_resource is None:
-        _dynamodb_resource = boto3.resource("dynamodb", region_name=AWS_REGION)  # type: ignore
+        _dynamodb_resource = boto3.resource(  # type: ignore
+            "dynamodb", region_name=AWS_REGION, config=DEFAULT_CLIENT_CONFIG
+        )
 
     return _dynamodb_resource
 
@@ -78,7 +113,7 @@ def get_s3() -> S3Client:
         raise RuntimeError("boto3 is not available in this environment")
 
     if _s3_client is None:
-        _s3_client = boto3.client("s3", region_name=AWS_REGION)
+        _s3_client = boto3.client("s3", region_name=AWS_REGION, config=S3_CLIENT_CONFIG)
 
     return _s3_client
 
@@ -98,7 +133,9 @@ def get_cognito() -> CognitoIdentityProviderClient:
         raise RuntimeError("boto3 is not available in this environment")
 
     if _cognito_client is None:
-        _cognito_client = boto3.client("cognito-idp", region_name=AWS_REGION)
+        _cognito_client = boto3.client(
+            "cognito-idp", region_name=AWS_REGION, config=DEFAULT_CLIENT_CONFIG
+        )
 
     return _cognito_client
 
@@ -110,22 +147,25 @@ def get_cognito() -> CognitoIdentityProviderClient:
 
 def get_bedrock_runtime(region: Optional[str] = None) -> BedrockRuntimeClient:
     """
-    Return a cached AWS Bedrock Runtime client.
+    Return a cached AWS Bedrock Runtime client for the given region.
 
-    Bedrock does not yet have stable boto3-stubs, so this is typed as `Any`.
+    Bedrock is often called cross-region, so one client is cached per region
+    instead of a single global that would ignore later region arguments.
     """
-    global _bedrock_runtime
-
     if boto3 is None:
         raise RuntimeError("boto3 is not available in this environment")
 
-    if _bedrock_runtime is None:
-        _bedrock_runtime = boto3.client(
+    region_name = region or AWS_REGION
+    client = _bedrock_runtimes.get(region_name)
+    if client is None:
+        client = boto3.client(
             "bedrock-runtime",
-            region_name=region or AWS_REGION,
+            region_name=region_name,
+            config=BEDROCK_CLIENT_CONFIG,
         )
+        _bedrock_runtimes[region_name] = client
 
-    return _bedrock_runtime
+    return client
 
 
 # ====================================================================================
@@ -143,7 +183,9 @@ def get_secrets_manager() -> SecretsManagerClient:
         raise RuntimeError("boto3 is not available in this environment")
 
     if _secrets_manager_client is None:
-        _secrets_manager_client = boto3.client("secretsmanager", region_name=AWS_REGION)
+        _secrets_manager_client = boto3.client(
+            "secretsmanager", region_name=AWS_REGION, config=DEFAULT_CLIENT_CONFIG
+        )
 
     return _secrets_manager_client
 
@@ -162,7 +204,9 @@ def get_lambda_client() -> Any:
     if boto3 is None:
         raise RuntimeError("boto3 is not available in this environment")
     if _lambda_client is None:
-        _lambda_client = boto3.client("lambda", region_name=AWS_REGION)
+        _lambda_client = boto3.client(
+            "lambda", region_name=AWS_REGION, config=DEFAULT_CLIENT_CONFIG
+        )
 
     return _lambda_client
 
@@ -180,11 +224,11 @@ def reset_clients() -> None:
     production code.
     """
     global _dynamodb_resource, _s3_client, _cognito_client
-    global _bedrock_runtime, _secrets_manager_client, _lambda_client
+    global _secrets_manager_client, _lambda_client
 
     _dynamodb_resource = None
     _s3_client = None
     _cognito_client = None
-    _bedrock_runtime = None
+    _bedrock_runtimes.clear()
     _secrets_manager_client = None
     _lambda_client = None
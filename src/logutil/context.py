@@ -38,6 +38,9 @@ request_start_time: ContextVar[Optional[float]] = ContextVar("request_start_time
 
 __all__ = ["correlation_id", "request_start_time", "ContextualLogger", "clogger"]
 
+# loguru's numeric severity for DEBUG
+_DEBUG_LEVEL = 10
+
 
 # -----------------------------------------------------------------------------
 # Contextual Logger with Correlation ID Support
@@ -68,10 +71,22 @@ class ContextualLogger:
 
         return ctx
 
+    def is_debug_enabled(self) -> bool:
+        """
+        True if any sink will emit DEBUG records.
+
+        Use this to guard debug messages that are expensive to build (large
+        payloads, serialization), since f-string arguments are evaluated even
+        when the record is then dropped.
+        """
+        return bool(logger._core.min_level <= _DEBUG_LEVEL)  # type: ignore[attr-defined]
+
     def info(self, msg: str, extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
         logger.bind(**self._add_context(extra)).info(self._enrich_message(msg), **kwargs)
 
     def debug(self, msg: str, extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+        if not self.is_debug_enabled():
+            return  # skip building context and binding for records no sink will keep
         logger.bind(**self._add_context(extra)).debug(self._enrich_message(msg), **kwargs)
 
     def warning(self, msg: str, extra: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
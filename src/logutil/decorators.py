@@ -14,7 +14,6 @@ import uuid
 from functools import wraps
 from typing import Any, Callable, Dict, TypeVar
 
-from src.logutil.config import logger
 from src.logutil.context import clogger, correlation_id, request_start_time
 from src.logutil.masking import mask_sensitive_data
 
@@ -93,7 +92,7 @@ def log_lambda_handler(
             clogger.info(f"Incoming request: {http_method} {path}", extra=request_log)
 
             # Log detailed request at DEBUG level
-            if logger._core.min_level <= 10:  # type: ignore[attr-defined]  # DEBUG = 10
+            if clogger.is_debug_enabled():
                 detailed_request = {
                     "event_type": "request_details",
                     "endpoint": endpoint_name,
@@ -138,7 +137,7 @@ def log_lambda_handler(
                 )
 
                 # Log detailed response at DEBUG level
-                if logger._core.min_level <= 10 and log_response_body:  # type: ignore[attr-defined]
+                if clogger.is_debug_enabled() and log_response_body:
                     try:
                         body_dict = json.loads(result.get("body", "{}"))
                         detailed_response = {
@@ -165,7 +164,6 @@ def log_lambda_handler(
                             http_method,
                             headers,
                             query_params,
-                            path_params,
                             event.get("body"),
                         )
                         if not is_valid_req:
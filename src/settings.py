@@ -61,6 +61,10 @@ BEDROCK_MODEL_ID: str = os.environ.get(
 # BEDROCK_REGION defaults to AWS_REGION if not explicitly defined.
 BEDROCK_REGION: str = os.environ.get("BEDROCK_REGION", "us-east-1")
 
+# Opt-in: set MODELGUARD_LLM_CACHE=1 to reuse responses for byte-identical
+# temperature-0 prompts within a warm container.
+LLM_RESPONSE_CACHE_ENABLED: bool = os.environ.get("MODELGUARD_LLM_CACHE") == "1"
+
 
 # -----------------------------------------------------------------------------
 # Default Admin User Settings for /reset Endpoint
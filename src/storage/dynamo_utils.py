@@ -5,18 +5,20 @@ This module centralizes ALL DynamoDB interactions:
 - Scanning tables
 - Searching by fields
 - Saving items to tables
-- Loading items by key
+- Batch saving items
+- Loading items by key (singly or in batches)
 - Batch deletes
 - Clearing/resetting tables
 """
 
 from __future__ import annotations
 
+import time
 from decimal import Decimal
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from botocore.exceptions import ClientError
-from src.aws.clients import get_ddb_table
+from src.aws.clients import get_ddb_table, get_dynamodb
 from src.logutil import clogger
 
 
@@ -54,19 +56,28 @@ def _convert_floats_to_decimal(obj: Any) -> Any:
 # =============================================================================
 # Generic DynamoDB Table Utilities
 # =============================================================================
-def scan_table(table_name: str) -> List[Dict[str, Any]]:
+def scan_table(table_name: str, attributes: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
     """
     Scan an entire DynamoDB table and return all items.
     Handles automatic pagination.
+
+    If attributes is given, only those attributes are read (ProjectionExpression),
+    which keeps large fields such as scores and metadata off the wire.
     """
     table = get_ddb_table(table_name)
 
+    scan_kwargs: Dict[str, Any] = {}
+    if attributes is not None:
+        names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+        scan_kwargs["ProjectionExpression"] = ", ".join(names)
+        scan_kwargs["ExpressionAttributeNames"] = names
+
     results: List[Dict[str, Any]] = []
-    response = table.scan()
+    response = table.scan(**scan_kwargs)
     results.extend(response.get("Items", []))
 
     while "LastEvaluatedKey" in response:
-        response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
+        response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"], **scan_kwargs)
         results.extend(response.get("Items", []))
 
     return results
@@ -91,16 +102,14 @@ def search_table_by_fields(
         rows = scan_table(table_name=table_name)
     else:
         rows = item_list
-    matches: List[Dict[str, Any]] = []
-
-    for row in rows:
-        for field_name, field_value in fields.items():
-            if row.get(field_name) != field_value:
-                break
-        else:
-            matches.append(row)
+    # Hoist the predicate out of the per-row loop; single-field lookups (the
+    # common case) avoid the inner generator entirely.
+    criteria = tuple(fields.items())
+    if len(criteria) == 1:
+        ((field_name, field_value),) = criteria
+        return [row for row in rows if row.get(field_name) == field_value]
 
-    return matches
+    return [row for row in rows if all(row.get(k) == v for k, v in criteria)]
 
 
 def save_item_to_table(table_name: str, item: Dict[str, Any]) -> None:
@@ -120,6 +129,28 @@ def save_item_to_table(table_name: str, item: Dict[str, Any]) -> None:
         raise
 
 
+def batch_save_items(table_name: str, items: Iterable[Dict[str, Any]]) -> int:
+    """
+    Batch save items to a DynamoDB table.
+
+    The batch writer groups puts into BatchWriteItem calls of up to 25 items and
+    resubmits unprocessed items, so N saves cost roughly N/25 round-trips instead of N.
+    Floats are converted to Decimal as in save_item_to_table().
+    """
+    table = get_ddb_table(table_name)
+    count = 0
+    try:
+        with table.batch_writer() as batch:
+            for item in items:
+                batch.put_item(Item=_convert_floats_to_decimal(item))
+                count += 1
+        clogger.info(f"[DDB] Saved {count} items to {table_name}")
+    except ClientError as e:
+        clogger.error(f"[DDB] Failed to batch save items to {table_name}: {e}")
+        raise
+    return count
+
+
 def load_item_from_key(table_name: str, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Load a generic item from a DynamoDB table by its key.
@@ -138,6 +169,60 @@ def load_item_from_key(table_name: str, key: Dict[str, Any]) -> Optional[Dict[st
         raise
 
 
+# BatchGetItem accepts at most this many keys per request
+BATCH_GET_MAX_KEYS = 100
+
+# UnprocessedKeys signal throttling: retry them with exponential backoff
+# (0.05 s, 0.1 s, 0.2 s, ...) and give up after this many retries per request.
+BATCH_GET_MAX_RETRIES = 5
+BATCH_GET_BASE_DELAY_SECONDS = 0.05
+
+
+def batch_get_items(
+    table_name: str, key_name: str, key_values: Iterable[Any]
+) -> List[Dict[str, Any]]:
+    """
+    Load several items from a DynamoDB table by key with BatchGetItem.
+
+    Keys are de-duplicated and sent in requests of up to 100; unprocessed keys are
+    retried with exponential backoff. Items come back in no particular order and
+    missing keys are skipped.
+
+    Raises:
+        RuntimeError: If keys are still unprocessed after BATCH_GET_MAX_RETRIES
+    """
+    keys = [{key_name: value} for value in dict.fromkeys(key_values)]
+    dynamodb = get_dynamodb()
+    results: List[Dict[str, Any]] = []
+
+    try:
+        for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+            request: Dict[str, Any] = {
+                table_name: {"Keys": keys[start : start + BATCH_GET_MAX_KEYS]}
+            }
+            for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+                if attempt:
+                    time.sleep(BATCH_GET_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+                response = dynamodb.batch_get_item(RequestItems=request)
+                results.extend(response.get("Responses", {}).get(table_name, []))
+                request = dict(response.get("UnprocessedKeys") or {})
+                if not request:
+                    break
+            else:
+                remaining = len(request.get(table_name, {}).get("Keys", []))
+                clogger.error(
+                    f"[DDB] {remaining} keys still unprocessed in {table_name} "
+                    f"after {BATCH_GET_MAX_RETRIES} retries"
+                )
+                raise RuntimeError(f"Batch load from {table_name} throttled; keys unprocessed")
+    except ClientError as e:
+        clogger.error(f"[DDB] Failed to batch load items from {table_name}: {e}")
+        raise
+
+    clogger.info(f"[DDB] Loaded {len(results)} of {len(keys)} items from {table_name}")
+    return results
+
+
 def batch_delete(
     table_name: str,
     items: Iterable[Dict[str, Any]],
@@ -159,13 +244,37 @@ def batch_delete(
     return count
 
 
+def _iter_table_keys(table_name: str, key_name: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily scan a DynamoDB table, yielding only the key attribute of each item.
+
+    Pages are fetched on demand, so consumers can act on one page while the
+    rest of the table has not been read yet.
+    """
+    table = get_ddb_table(table_name)
+    scan_kwargs: Dict[str, Any] = {
+        "ProjectionExpression": "#k",
+        "ExpressionAttributeNames": {"#k": key_name},
+    }
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        yield from response.get("Items", [])
+
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
 def clear_table(table_name: str, key_name: str) -> int:
     """
     Delete all items in a DynamoDB table.
     Returns number of items deleted.
+
+    Keys are streamed page by page straight into the batch writer, so deletes
+    start as soon as the first scan page arrives and no full item list is held.
     """
-    items = scan_table(table_name)
-    return batch_delete(table_name, items, key_name)
+    return batch_delete(table_name, _iter_table_keys(table_name, key_name), key_name)
 
 
 def delete_item(table_name: str, key_name: str, key_value: str) -> bool:
@@ -7,9 +7,13 @@ artifact's code, documentation, or dataset contents.
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 import tarfile
-from typing import Dict, Iterable, List, Tuple
+import threading
+from collections import OrderedDict
+from typing import IO, Dict, Iterable, List, Optional, Tuple, cast
 
 from src.logutil import clogger
 
@@ -26,19 +30,35 @@ from src.logutil import clogger
 
 
 def extract_files_from_tar(
-    tar_path: str,
+    tar_path: Optional[str] = None,
     max_chars: int = 4000,
+    *,
+    fileobj: Optional[IO[bytes]] = None,
 ) -> Dict[str, str]:
     """
     Extract all text-like files from the tar archive, truncated to max_chars.
+
+    Reads from tar_path, or sequentially from fileobj (e.g. an S3 response body)
+    so the archive never has to be written to disk.
+
+    A path is read best-effort: unreadable members or archives are logged and
+    skipped. A stream cannot be re-read, so any error part-way through (truncated
+    or reset connection, corrupt data) is re-raised rather than returning only
+    the members read so far.
     """
     files: Dict[str, str] = {}
 
     try:
-        with tarfile.open(tar_path, "r:gz") as tar:
-            members = [m for m in tar.getmembers() if m.isfile()]
-
-            for m in members:
+        if fileobj is not None:
+            tar = tarfile.open(fileobj=fileobj, mode="r|gz")
+        else:
+            tar = tarfile.open(tar_path, "r:gz")
+
+        with tar:
+            # Iterating (rather than getmembers()) works for both seekable and stream mode
+            for m in tar:
+                if not m.isfile():
+                    continue
                 try:
                     f = tar.extractfile(m)
                     if not f:
@@ -49,9 +69,14 @@ def extract_files_from_tar(
                     files[m.name] = text[:max_chars]
 
                 except Exception as e:
+                    if fileobj is not None:
+                        raise
                     clogger.warning(f"[file_extraction] Failed to extract {m.name}: {e}")
 
     except Exception as e:
+        if fileobj is not None:
+            clogger.warning(f"[file_extraction] Streamed tar ended before completion: {e}")
+            raise
         clogger.error(f"[file_extraction] Failed to open tar: {e}")
 
     return files
@@ -183,6 +208,120 @@ def select_relevant_files(
     return selected
 
 
+# ====================================================================================
+# EXTRACTION CACHE
+# ====================================================================================
+# Discovery, the ramp-up metric and regex search can all read the same artifact
+# tarball, each from its own temp download (discovery streams it straight from
+# S3). Selected results are cached by an archive fingerprint plus the selection
+# arguments, so repeat calls skip gzip decompression and filtering. Only the small
+# selected result is kept, never every member of the archive.
+#
+# The fingerprint hashes the archive size and its first and last MiB. The tail
+# holds the gzip trailer (CRC-32 and length of the uncompressed data), so any
+# content change alters it, without paying for a full pass over multi-GB tarballs.
+# ------------------------------------------------------------------------------------
+
+EXTRACTION_CACHE_MAX_ENTRIES = 32
+_FINGERPRINT_EDGE_BYTES = 1024 * 1024
+
+_ExtractionKey = Tuple[str, Tuple[str, ...], int, int, bool]
+_extraction_cache: "OrderedDict[_ExtractionKey, Dict[str, str]]" = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+
+def _fingerprint(size: int, head: bytes, tail: bytes) -> str:
+    """Hash the archive size and its leading and trailing bytes."""
+    digest = hashlib.sha256(str(size).encode("ascii"))
+    digest.update(head)
+    digest.update(tail)
+    return digest.hexdigest()
+
+
+def _fingerprint_tar(tar_path: str) -> Optional[str]:
+    """
+    Return the archive fingerprint, or None if it cannot be read.
+    """
+    try:
+        with open(tar_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            head = f.read(_FINGERPRINT_EDGE_BYTES)
+            f.seek(max(len(head), size - _FINGERPRINT_EDGE_BYTES))
+            tail = f.read()
+    except OSError as e:
+        clogger.debug(f"[file_extraction] Could not fingerprint {tar_path} for caching: {e}")
+        return None
+    return _fingerprint(size, head, tail)
+
+
+class _FingerprintingReader:
+    """
+    Read-only wrapper that fingerprints a stream as the tar reader consumes it.
+
+    Keeps only the first and last MiB, so a streamed archive can share cache
+    entries with path-based callers.
+    """
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        self._fileobj = fileobj
+        self._size = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+
+    def read(self, size: Optional[int] = None) -> bytes:
+        chunk = self._fileobj.read() if size is None else self._fileobj.read(size)
+        self._size += len(chunk)
+        room = _FINGERPRINT_EDGE_BYTES - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk_tail = chunk[room:]
+        else:
+            chunk_tail = chunk
+        if chunk_tail:
+            self._tail += chunk_tail
+            del self._tail[:-_FINGERPRINT_EDGE_BYTES]
+        return chunk
+
+    def fingerprint(self) -> Optional[str]:
+        """
+        Drain whatever the tar reader left unread and return the archive fingerprint.
+        """
+        try:
+            for _ in iter(lambda: self.read(_FINGERPRINT_EDGE_BYTES), b""):
+                pass
+        except Exception as e:
+            clogger.debug(f"[file_extraction] Could not fingerprint stream for caching: {e}")
+            return None
+        return _fingerprint(self._size, bytes(self._head), bytes(self._tail))
+
+
+def _get_cached_extraction(key: _ExtractionKey) -> Optional[Dict[str, str]]:
+    """Return a copy of a cached selection (refreshing its LRU position), or None."""
+    with _extraction_cache_lock:
+        cached = _extraction_cache.get(key)
+        if cached is None:
+            return None
+        _extraction_cache.move_to_end(key)
+        return dict(cached)
+
+
+def _store_cached_extraction(key: _ExtractionKey, selected: Dict[str, str]) -> None:
+    """Cache a selection, evicting the least recently used entry if full."""
+    with _extraction_cache_lock:
+        _extraction_cache[key] = dict(selected)
+        _extraction_cache.move_to_end(key)
+        if len(_extraction_cache) > EXTRACTION_CACHE_MAX_ENTRIES:
+            _extraction_cache.popitem(last=False)
+
+
+def clear_extraction_cache() -> None:
+    """
+    Drop all cached extraction results. Primarily used by tests.
+    """
+    with _extraction_cache_lock:
+        _extraction_cache.clear()
+
+
 # ====================================================================================
 # HIGH-LEVEL ENTRY POINT
 # ====================================================================================
@@ -195,11 +334,13 @@ def select_relevant_files(
 
 
 def extract_relevant_files(
-    tar_path: str,
-    include_ext: Iterable[str],
+    tar_path: Optional[str] = None,
+    include_ext: Iterable[str] = (),
     max_files: int = 5,
     max_chars: int = 4000,
     prioritize_readme: bool = True,
+    *,
+    fileobj: Optional[IO[bytes]] = None,
 ) -> Dict[str, str]:
     """
     High-level helper to extract and select relevant files from a .tar.gz archive.
@@ -208,14 +349,50 @@ def extract_relevant_files(
         - extract_files_from_tar()
         - select_relevant_files()
 
+    Pass either tar_path or fileobj. A fileobj is read once, sequentially, so
+    streamed archives (e.g. an S3 response body) skip the round-trip through disk.
+    Errors while reading a stream propagate, so a partial archive is never
+    selected from or cached.
+
+    Selected results are cached by archive fingerprint and selection arguments,
+    so repeated calls against the same tarball (even under a different temp path)
+    skip re-extraction. Streamed archives are not looked up, but their results
+    seed the cache.
+
     Returns:
         Mapping of filename -> truncated text content.
     """
-    all_files = extract_files_from_tar(tar_path, max_chars=max_chars)
-
-    return select_relevant_files(
+    if (tar_path is None) == (fileobj is None):
+        raise ValueError("Pass exactly one of tar_path or fileobj")
+
+    # Sorted so that set ordering cannot split otherwise identical keys
+    include_ext = tuple(sorted(include_ext))
+    selection = (include_ext, max_files, max_chars, prioritize_readme)
+
+    if fileobj is not None:
+        # A stream can only be fingerprinted by reading it, so there is nothing to
+        # look up beforehand; the result is still cached for later path-based callers.
+        reader = _FingerprintingReader(fileobj)
+        all_files = extract_files_from_tar(fileobj=cast(IO[bytes], reader), max_chars=max_chars)
+        fingerprint = reader.fingerprint()
+    else:
+        assert tar_path is not None
+        fingerprint = _fingerprint_tar(tar_path)
+        if fingerprint is not None:
+            cached = _get_cached_extraction((fingerprint, *selection))
+            if cached is not None:
+                clogger.debug(f"[file_extraction] Cache hit for {tar_path}")
+                return cached
+        all_files = extract_files_from_tar(tar_path, max_chars=max_chars)
+
+    selected = select_relevant_files(
         all_files,
         include_ext=include_ext,
         max_files=max_files,
         prioritize_readme=prioritize_readme,
     )
+
+    if fingerprint is not None:
+        _store_cached_extraction((fingerprint, *selection), selected)
+
+    return selected
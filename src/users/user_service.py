@@ -14,8 +14,9 @@ implementing the Security Track requirements:
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
 from src.aws.clients import get_cognito, get_ddb_table
@@ -28,6 +29,9 @@ from src.permissions import (
 )
 from src.settings import TOKENS_TABLE, USER_POOL_ID
 
+# GSI on the tokens table keyed by username (see TokensTable in template.yaml)
+TOKENS_USERNAME_INDEX = "username-index"
+
 
 # =============================================================================
 # User Creation
@@ -159,6 +163,30 @@ def delete_user(username: str) -> None:
     )
 
 
+def _iter_user_tokens(table: Any, username: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield token items belonging to a user, following query pagination.
+
+    Queries the username GSI so reads scale with this user's tokens rather
+    than the whole table.
+    """
+    query_kwargs: Dict[str, Any] = {
+        "IndexName": TOKENS_USERNAME_INDEX,
+        "KeyConditionExpression": Key("username").eq(username),
+        # Only the primary key is needed to delete; skip returning the username
+        "ProjectionExpression": "#t",
+        "ExpressionAttributeNames": {"#t": "token"},
+    }
+
+    while True:
+        response = table.query(**query_kwargs)
+        yield from response.get("Items", [])
+
+        if "LastEvaluatedKey" not in response:
+            break
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
 def _invalidate_user_tokens(username: str) -> int:
     """
     Delete all tokens for a user from the tokens table.
@@ -174,28 +202,10 @@ def _invalidate_user_tokens(username: str) -> int:
     """
     table = get_ddb_table(TOKENS_TABLE)
 
-    # Scan for tokens belonging to this user
-    # Note: This requires a full scan, but the tokens table should be small
-    # and tokens have TTL so old ones are automatically removed
-    response = table.scan(
-        FilterExpression="username = :u",
-        ExpressionAttributeValues={":u": username},
-    )
-
     count = 0
-    for item in response.get("Items", []):
-        table.delete_item(Key={"token": item["token"]})
-        count += 1
-
-    # Handle pagination for large token sets
-    while "LastEvaluatedKey" in response:
-        response = table.scan(
-            FilterExpression="username = :u",
-            ExpressionAttributeValues={":u": username},
-            ExclusiveStartKey=response["LastEvaluatedKey"],
-        )
-        for item in response.get("Items", []):
-            table.delete_item(Key={"token": item["token"]})
+    with table.batch_writer() as batch:
+        for item in _iter_user_tokens(table, username):
+            batch.delete_item(Key={"token": item["token"]})
             count += 1
 
     clogger.debug(f"[user_service] Invalidated {count} tokens for user {username}")
@@ -18,11 +18,11 @@ Future responsibilities:
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
-import boto3
 from botocore.exceptions import ClientError
-from mypy_boto3_cognito_idp.client import CognitoIdentityProviderClient
 
+from src.aws.clients import get_cognito
 from src.logutil import clogger
 from src.permissions import UserPermissions, save_user_permissions
 from src.settings import (
@@ -32,6 +32,9 @@ from src.settings import (
 )
 from src.aws.secrets import get_secret_value
 
+if TYPE_CHECKING:
+    from mypy_boto3_cognito_idp.client import CognitoIdentityProviderClient
+
 
 # =====================================================================================
 # Helpers
@@ -138,7 +141,7 @@ def bootstrap_system() -> None:
     """
     clogger.info("[bootstrap] Running system bootstrap initialization...")
 
-    cognito = boto3.client("cognito-idp")
+    cognito = get_cognito()
 
     # Ensure group exists
     _ensure_cognito_group_exists(cognito, DEFAULT_ADMIN_GROUP)
@@ -11,6 +11,11 @@ from typing import Any, Callable, Dict, Optional, TypedDict, TypeVar, Union, Lis
 
 from src.logutil import clogger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -25,6 +30,10 @@ class LambdaResponse(TypedDict):
 
 # -----------------------------------------------------------------------------
 # Default CORS headers (shared by all responses)
+#
+# Responses without extra headers reference this dict directly instead of a
+# copy, so it must be treated as read-only. It stays a plain dict (not a
+# MappingProxyType) because the Lambda runtime serializes it with json.
 # -----------------------------------------------------------------------------
 DEFAULT_HEADERS: Dict[str, str] = {
     "Content-Type": "application/json",
@@ -49,17 +58,31 @@ def json_response(
     Build a standardized JSON response object for API Gateway.
     Body may be a dict (usual case) or a raw JSON string (as required by some spec responses).
     """
-    combined_headers = DEFAULT_HEADERS.copy()
-    if headers:
-        combined_headers.update(headers)
+    combined_headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS
 
     return LambdaResponse(
         statusCode=status_code,
         headers=combined_headers,
-        body=json.dumps(body),
+        body=_dumps(body),
     )
 
 
+def _dumps(body: Any) -> str:
+    """
+    Serialize a response body to a JSON string.
+
+    Uses orjson when installed (several times faster on nested score payloads);
+    anything orjson rejects (e.g. Decimal) falls back to json.dumps so behaviour
+    matches the stdlib exactly.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(body)
+
+
 # -----------------------------------------------------------------------------
 # Error Response
 # -----------------------------------------------------------------------------
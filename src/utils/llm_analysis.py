@@ -3,6 +3,9 @@ LLM analysis utilities using AWS Bedrock Runtime.
 
 Provides:
 - ask_llm(): unified function for Bedrock inference
+- ask_llm_batch(): run several prompts through ask_llm() concurrently
+- warm_bedrock_client(): create the Bedrock client during Lambda INIT
+- clear_llm_response_cache(): drop responses cached by ask_llm()
 - build_llm_prompt(): generic structured prompt builder
 - build_file_analysis_prompt(): helper for metrics analyzing code/dataset files
 - extract_llm_score_field(): safely extract a numeric score field from LLM JSON output
@@ -10,16 +13,40 @@ Provides:
 
 from __future__ import annotations
 
+import concurrent.futures
+import copy
+import functools
+import hashlib
 import json
 import re
-from typing import Any, Dict, List, Optional, Union
+import threading
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from botocore.exceptions import ClientError
-from mypy_boto3_bedrock_runtime.client import BedrockRuntimeClient
 
 from src.aws.clients import get_bedrock_runtime
 from src.logutil import clogger
-from src.settings import BEDROCK_MODEL_ID, BEDROCK_REGION
+from src.settings import BEDROCK_MODEL_ID, BEDROCK_REGION, LLM_RESPONSE_CACHE_ENABLED
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from mypy_boto3_bedrock_runtime.client import BedrockRuntimeClient
 
 
 # ====================================================================================
@@ -31,6 +58,55 @@ from src.settings import BEDROCK_MODEL_ID, BEDROCK_REGION
 MAX_INPUT_TOKENS = 10000  # Increased from 3500 - Nova Lite has 300K context
 CHARS_PER_TOKEN = 3  # Rough estimate for token counting
 
+# Nova Messages API request body. Everything except the prompt and the two
+# sampling parameters is constant, so only the prompt goes through json.dumps
+# (for escaping) instead of serializing a freshly built dict on every call.
+# Optional fields left at their defaults (e.g. an empty stopSequences) are omitted.
+_NOVA_REQUEST_TEMPLATE = (
+    '{"messages": [{"role": "user", "content": [{"text": %s}]}], '
+    '"inferenceConfig": {"max_new_tokens": %d, "temperature": %s}}'
+)
+
+# Built file prompts, keyed by metric parameters plus per-file content digests.
+# Re-scoring an unchanged repository skips section sizing and trimming entirely.
+PROMPT_CACHE_MAX_ENTRIES = 128
+
+# Tool the model is forced to call when ask_llm() is given a json_schema
+_JSON_TOOL_NAME = "emit_json"
+
+# Upper bound on concurrent Bedrock calls issued by ask_llm_batch()
+LLM_BATCH_MAX_WORKERS = 8
+
+# In-process cache of successful responses, keyed by a prompt digest so large
+# prompts are not retained. Only temperature-0 requests are cached, so repeats of
+# a deterministic prompt in a warm container skip Bedrock entirely.
+LLM_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+_ResponseKey = Tuple[bytes, str, int, bool, float]
+_response_cache: "OrderedDict[_ResponseKey, Union[str, Dict[str, Any]]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# File-section ordering tiers after README (tier 0): project manifests carry the
+# most signal per token. Any other file sorts after every listed tier.
+_SECTION_PRIORITY_TIERS: Tuple[Tuple[str, ...], ...] = (
+    ("pyproject.toml", "setup.py", "setup.cfg", "package.json"),
+    ("requirements.txt", "environment.yml", "dataset_infos.json"),
+)
+_SECTION_PRIORITY: Dict[str, int] = {
+    name: tier for tier, names in enumerate(_SECTION_PRIORITY_TIERS, start=1) for name in names
+}
+
+# Characters _format_section() adds around a section's title and content
+_SECTION_FRAME_CHARS = len("===  ===\n\n")
+
+# Plain decimal/scientific numbers as the LLM writes them, e.g. "0.8", " -1e-3 ", ".5"
+_NUMERIC_STRING_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*\Z")
+
+# JSON extraction helpers, compiled once since every LLM response goes through them
+_JSON_DECODER = json.JSONDecoder()
+_THINK_BLOCK_RE = re.compile(r"<think>.*?(?:</think>|\Z)", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+
 
 # ====================================================================================
 # PUBLIC API - LLM INVOCATION
@@ -52,6 +128,7 @@ CHARS_PER_TOKEN = 3  # Rough estimate for token counting
 # Usage:
 #     response = ask_llm("Explain this code")
 #     data = ask_llm(prompt, return_json=True)
+#     data = ask_llm(prompt, json_schema={"type": "object", "properties": {...}})
 # ------------------------------------------------------------------------------------
 
 
@@ -60,66 +137,115 @@ def ask_llm(
     max_tokens: int = 200,
     return_json: bool = False,
     temperature: float = 0.7,
+    stream: bool = False,
+    json_schema: Optional[Dict[str, Any]] = None,
 ) -> Optional[Union[str, Dict[str, Any]]]:
-    """Invoke a Bedrock LLM and return text or parsed JSON."""
+    """Invoke a Bedrock LLM and return text or parsed JSON.
+
+    With stream=True the response is consumed as an event stream; when
+    return_json is also set, reading stops as soon as a complete JSON object
+    has been generated instead of waiting for the model to finish.
+
+    json_schema implies return_json. The model is forced to answer through a
+    single tool whose input must match the schema, so the JSON arrives already
+    structured; free-text extraction is only used if the model ignores the tool.
+    Schema requests are never streamed.
+    """
 
     model_id = BEDROCK_MODEL_ID
+    if json_schema is not None:
+        return_json = True
+        stream = False
+
+    # Only deterministic (temperature 0) answers are reused; a sampled answer
+    # cached here would freeze one draw for every later call with the same prompt.
+    cache_key: Optional[_ResponseKey] = None
+    if temperature == 0:
+        prompt_digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16)
+        if json_schema is not None:
+            prompt_digest.update(json.dumps(json_schema, sort_keys=True).encode("utf-8"))
+        cache_key = (prompt_digest.digest(), model_id, max_tokens, return_json, temperature)
+        cached = _get_cached_response(cache_key)
+        if cached is not None:
+            clogger.debug("[llm] Returning cached response for identical prompt")
+            return cached
+
+    # Computed once for every log line below, including the failure path
+    estimated_input_tokens = _estimate_token_count(prompt)
 
     try:
         client: BedrockRuntimeClient = get_bedrock_runtime(region=BEDROCK_REGION)
 
-        # Log input characteristics for visibility
-        estimated_input_tokens = _estimate_token_count(prompt)
-        clogger.debug(
-            f"[llm] Preparing request: model={model_id}, "
-            f"input_tokens~{estimated_input_tokens}, max_output_tokens={max_tokens}, "
-            f"temperature={temperature}"
-        )
-
         # Nova models use Messages API format
-        request_body = {
-            "messages": [{"role": "user", "content": [{"text": prompt}]}],
-            "inferenceConfig": {
-                "max_new_tokens": max_tokens,
-                "temperature": temperature,
-                "stopSequences": [],
-            },
-        }
-
-        clogger.debug(
-            f"[llm] Invoking Bedrock model '{model_id}'"
-            f" with request body: {json.dumps(request_body)}"
-        )
-
-        response = client.invoke_model(
-            modelId=model_id,
-            body=json.dumps(request_body),
-        )
-
-        raw_bytes = response["body"].read()
-        raw_text = raw_bytes.decode("utf-8")
+        if json_schema is not None:
+            request_body = _encode_tool_request_body(prompt, max_tokens, temperature, json_schema)
+        else:
+            request_body = _encode_request_body(prompt, max_tokens, temperature)
 
-        if not raw_text:
-            clogger.error("[llm] Empty raw response body from Bedrock")
+        # The body embeds the whole prompt; only format it if DEBUG is actually emitted
+        if clogger.is_debug_enabled():
             clogger.debug(
-                f"[llm] Request summary: input_tokens~{estimated_input_tokens}, "
-                f"max_output_tokens={max_tokens}, temperature={temperature}"
+                f"[llm] Preparing request: model={model_id}, "
+                f"input_tokens~{estimated_input_tokens}, max_output_tokens={max_tokens}, "
+                f"temperature={temperature}"
+            )
+            clogger.debug(
+                f"[llm] Invoking Bedrock model '{model_id}' with request body: {request_body}"
             )
-            return None
 
-        parsed = json.loads(raw_text)
-        # Nova response format: output.message.content[0].text
-        try:
-            content = parsed["output"]["message"]["content"][0]["text"]
-            stop_reason = parsed.get("stopReason", "unknown")
-        except (KeyError, IndexError, TypeError) as e:
-            clogger.error(
-                f"[llm] Unexpected response schema; expected Nova format with "
-                f"'output.message.content[0].text': {e}"
+        if stream:
+            streamed = client.invoke_model_with_response_stream(
+                modelId=model_id,
+                body=request_body,
             )
-            clogger.debug(f"[llm] Raw parsed keys: {list(parsed.keys())}")
-            clogger.debug(f"[llm] Raw text (first 500 chars):\n{raw_text[:500]}")
-            return None
+            content, stop_reason = _read_response_stream(streamed, stop_at_json=return_json)
+            raw_bytes = b""
+        else:
+            response = client.invoke_model(
+                modelId=model_id,
+                body=request_body,
+            )
+
+            # Output size is already bounded by maxTokens in the request; the body is
+            # closed right away so the connection goes back to the pool on every path
+            body = response["body"]
+            try:
+                raw_bytes = body.read()
+            finally:
+                body.close()
+
+            if not raw_bytes:
+                clogger.error("[llm] Empty raw response body from Bedrock")
+                clogger.debug(
+                    f"[llm] Request summary: input_tokens~{estimated_input_tokens}, "
+                    f"max_output_tokens={max_tokens}, temperature={temperature}"
+                )
+                return None
+
+            # Parsed straight from bytes; the body is only decoded on the log paths below
+            parsed = _json_loads(raw_bytes)
+            if json_schema is not None:
+                tool_input = _decode_tool_use_input(parsed)
+                if tool_input is not None:
+                    result = _sanitize_json_value(tool_input)
+                    _store_cached_response(cache_key, result)
+                    return result
+                clogger.warning("[llm] Model did not answer through the JSON tool")
+
+            try:
+                content, stop_reason = _decode_response_body(parsed)
+            except (KeyError, IndexError, TypeError) as e:
+                clogger.error(
+                    f"[llm] Unexpected response schema; expected Nova format with "
+                    f"'output.message.content[0].text': {e}"
+                )
+                if clogger.is_debug_enabled():
+                    clogger.debug(f"[llm] Raw parsed keys: {list(parsed.keys())}")
+                    clogger.debug(
+                        f"[llm] Raw text (first 500 chars):\n"
+                        f"{raw_bytes[:500].decode('utf-8', errors='replace')}"
+                    )
+                return None
 
         # Log if content is unexpectedly empty or short
         if not content or len(content.strip()) < 10:
@@ -128,17 +254,26 @@ def ask_llm(
                 f"stripped={len(content.strip() if content else '')} chars, "
                 f"stopReason={stop_reason}"
             )
-            clogger.debug(f"[llm] Full Bedrock response:\n{raw_text}")
+            if raw_bytes and clogger.is_debug_enabled():
+                clogger.debug(
+                    f"[llm] Full Bedrock response:\n{raw_bytes.decode('utf-8', errors='replace')}"
+                )
 
         if return_json:
             result = _extract_json_from_response(content)
             if result is None:
                 # Log what the LLM actually output when JSON extraction fails
-                clogger.debug(f"[llm] Raw output (first 500 chars):\n{content[:500]}")
-            else:
+                if clogger.is_debug_enabled():
+                    clogger.debug(f"[llm] Raw output (first 500 chars):\n{content[:500]}")
+                return None
+
+            if clogger.is_debug_enabled():
                 clogger.debug(f"[llm] Extracted JSON from response: {result}")
+            _store_cached_response(cache_key, result)
             return result
 
+        if content:
+            _store_cached_response(cache_key, content)
         return content
 
     except (ClientError, KeyError, json.JSONDecodeError) as e:
@@ -146,12 +281,71 @@ def ask_llm(
         # Provide more context where possible
         clogger.debug(
             f"[llm] Failure context: "
-            f"model={model_id}, input_tokens~{_estimate_token_count(prompt)}, "
+            f"model={model_id}, input_tokens~{estimated_input_tokens}, "
             f"max_output_tokens={max_tokens}, temperature={temperature}"
         )
         return None
 
 
+# ====================================================================================
+# ASK LLM (BATCH)
+# ====================================================================================
+# Run several independent prompts concurrently. Bedrock calls are network-bound,
+# so threads overlap the round-trips; the per-region client is thread-safe and
+# its adaptive retry mode backs off if the batch hits throttling.
+# ------------------------------------------------------------------------------------
+
+
+def ask_llm_batch(
+    prompts: Sequence[str],
+    max_tokens: int = 200,
+    return_json: bool = False,
+    temperature: float = 0.7,
+    json_schema: Optional[Dict[str, Any]] = None,
+) -> List[Optional[Union[str, Dict[str, Any]]]]:
+    """Invoke ask_llm() for each prompt concurrently; results keep the input order."""
+    if not prompts:
+        return []
+
+    def run(prompt: str) -> Optional[Union[str, Dict[str, Any]]]:
+        return ask_llm(
+            prompt,
+            max_tokens=max_tokens,
+            return_json=return_json,
+            temperature=temperature,
+            json_schema=json_schema,
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(LLM_BATCH_MAX_WORKERS, len(prompts))
+    ) as executor:
+        return list(executor.map(run, prompts))
+
+
+def warm_bedrock_client() -> None:
+    """
+    Create the cached Bedrock client ahead of the first ask_llm() call.
+
+    Intended to be called at module level by Lambdas that run LLM analysis, so
+    botocore's model loading happens during INIT rather than on the first request.
+    Failures are logged and ignored; ask_llm() will retry client creation lazily.
+    """
+    try:
+        get_bedrock_runtime(region=BEDROCK_REGION)
+    except Exception as e:
+        clogger.warning(f"[llm] Could not pre-initialize Bedrock client: {e}")
+
+
+def clear_llm_response_cache() -> None:
+    """
+    Drop all cached LLM responses and built prompts. Primarily used by tests.
+    """
+    with _response_cache_lock:
+        _response_cache.clear()
+    with _prompt_cache_lock:
+        _prompt_cache.clear()
+
+
 # ====================================================================================
 # PUBLIC API - PROMPT BUILDERS
 # ====================================================================================
@@ -188,7 +382,8 @@ def build_llm_prompt(
     """
 
     token_budget = MAX_INPUT_TOKENS
-    important = important_terms or []
+    # Hashable once per prompt, so every section hits the same cached matcher
+    important = tuple(important_terms or ())
 
     # Assemble header (always preserved)
     header_text = instructions.strip() + "\n\n"
@@ -204,39 +399,42 @@ def build_llm_prompt(
         )
         return final
 
-    # Build raw sections
-    raw_sections = [f"=== {title} ===\n{content}\n" for title, content in section_items]
-
     header_tokens = _estimate_token_count(header_text)
     remaining = max(1, token_budget - header_tokens)
 
-    section_tokens = [max(1, _estimate_token_count(s)) for s in raw_sections]
-    total_tokens = sum(section_tokens)
+    # Size sections from their lengths; the formatted section strings are only
+    # materialized if they need trimming
+    section_chars = [
+        len(title) + len(content) + _SECTION_FRAME_CHARS for title, content in section_items
+    ]
+    section_tokens = [_estimate_tokens_for_length(n) for n in section_chars]
 
-    # If sections fit, finalize directly
-    if total_tokens <= remaining:
-        prompt = header_text + "\n" + "\n".join(raw_sections)
-        prompt = _truncate_to_token_limit(prompt, max_tokens=token_budget)
+    # The assembled prompt's exact length is known up front (header, sections and one
+    # separating newline each), so a prompt that fits is returned without a truncation pass
+    prompt_tokens = _estimate_tokens_for_length(
+        len(header_text) + sum(section_chars) + len(section_items)
+    )
+    if prompt_tokens <= token_budget:
+        prompt = _assemble_sections(header_text, section_items)
         clogger.debug(
-            f"[llm_prompt_builder] Built prompt with {1 + len(raw_sections)} block(s), "
-            f"estimated {_estimate_token_count(prompt)} tokens"
+            f"[llm_prompt_builder] Built prompt with {1 + len(section_items)} block(s), "
+            f"estimated {prompt_tokens} tokens"
         )
         return prompt
 
     # Otherwise, allocate budgets and trim each section
     # Dynamic floor prevents overallocation with many sections
     min_floor = max(10, min(50, remaining // max(1, len(section_items))))
-    total = max(1, sum(section_tokens))
-    provisional = [max(min_floor, int((t / total) * remaining)) for t in section_tokens]
-    scale = remaining / max(1, sum(provisional))
-    budgets = [max(min_floor, int(p * scale)) for p in provisional]
+    budgets = _allocate_section_budgets(section_tokens, remaining, min_floor)
 
-    # Trim each section to its budget, preserving important lines
+    # Trim each section to its budget, preserving important lines. Sections are
+    # formatted one at a time so each untrimmed copy is freed once it is trimmed.
     trimmed_sections = [
-        _trim_section_to_budget(s, b, important) for s, b in zip(raw_sections, budgets)
+        _trim_section_to_budget(_format_section(title, content), budget, important)
+        for (title, content), budget in zip(section_items, budgets)
     ]
 
-    prompt = header_text + "\n" + "\n".join(trimmed_sections)
+    prompt = _assemble_prompt(header_text, trimmed_sections)
     prompt = _truncate_to_token_limit(prompt, max_tokens=token_budget)
     clogger.debug(
         f"[llm_prompt_builder] Built prompt with {1 + len(trimmed_sections)} block(s), "
@@ -269,44 +467,25 @@ def build_file_analysis_prompt(
     """Construct a structured prompt for LLM-based multi-file analysis with an
     optional detailed metric description."""
 
-    metric_details = ""
-    if metric_description:
-        metric_details = f"""
-
-Metric Details:
-{metric_description.strip()}
-"""
-
-    instructions = f"""
-You are an expert evaluator for the metric: "{metric_name}".{metric_details}
-
-Your task: Analyze repository files and produce a quality score in range {score_range}.
-
-IMPORTANT: Repository files are provided below. You MUST read ALL files before responding.
-Do NOT generate output until you have examined every file.
-
-Instructions:
-1. Read each file completely
-2. Analyze code quality, structure, documentation, and characteristics
-3. Evaluate against the "{metric_name}" metric criteria
-4. After reading ALL files, calculate a single numeric score
-5. Generate JSON response with your score
-
-Output requirements:
-- Format: {{ "{score_name}": <float value> }}
-- Score must be in range {score_range}
-- Do not include any additional text, explanations, or commentary
-- Ensure valid JSON format
-
-Begin reading the files now:
-    """.strip()
-
-    sections = {f"FILE: {fname}": content for fname, content in files.items()}
+    def build() -> str:
+        instructions = _file_analysis_instructions(
+            metric_name, score_name, score_range, metric_description
+        )
+        sections = _file_sections(files)
+        return build_llm_prompt(
+            instructions=instructions,
+            sections=sections,
+        )
 
-    return build_llm_prompt(
-        instructions=instructions,
-        sections=sections,
+    key = (
+        "file_analysis",
+        metric_name,
+        score_name,
+        score_range,
+        metric_description,
+        _files_fingerprint(files),
     )
+    return _cached_prompt(key, build)
 
 
 # ====================================================================================
@@ -332,6 +511,12 @@ def build_extract_fields_from_files_prompt(
     files: Dict[str, str],
 ) -> str:
     """Construct a structured prompt for extracting fields from files."""
+    key = ("extract_fields", tuple(fields.items()), _files_fingerprint(files))
+    return _cached_prompt(key, lambda: _build_extract_fields_prompt(fields, files))
+
+
+def _build_extract_fields_prompt(fields: Dict[str, str], files: Dict[str, str]) -> str:
+    """Uncached body of build_extract_fields_from_files_prompt()."""
 
     # Use fields dict directly or convert to placeholder format
     fields_json: Dict[str, str] = {
@@ -362,7 +547,7 @@ Output requirements:
 Begin reading the files now:
     """
 
-    sections = {f"FILE: {fname}": content for fname, content in files.items()}
+    sections = _file_sections(files)
 
     return build_llm_prompt(
         instructions=instructions,
@@ -421,11 +606,94 @@ def extract_llm_score_field(
     if isinstance(value, (int, float)):
         return float(value)
 
-    # Attempt to parse numeric strings
-    try:
+    # Parse numeric strings; anything else (None, lists, prose) is rejected up
+    # front instead of paying for a raised-and-caught float() error
+    if isinstance(value, str) and _NUMERIC_STRING_RE.match(value):
         return float(value)
-    except (TypeError, ValueError):
-        return None
+    return None
+
+
+# ====================================================================================
+# PRIVATE HELPERS - PROMPT TEMPLATES
+# ====================================================================================
+
+
+@functools.lru_cache(maxsize=64)
+def _file_analysis_instructions(
+    metric_name: str,
+    score_name: str,
+    score_range: str,
+    metric_description: Optional[str],
+) -> str:
+    """Instruction block for build_file_analysis_prompt(), rendered once per metric."""
+
+    metric_details = ""
+    if metric_description:
+        metric_details = f"""
+
+Metric Details:
+{metric_description.strip()}
+"""
+
+    instructions = f"""
+You are an expert evaluator for the metric: "{metric_name}".{metric_details}
+
+Your task: Analyze repository files and produce a quality score in range {score_range}.
+
+IMPORTANT: Repository files are provided below. You MUST read ALL files before responding.
+Do NOT generate output until you have examined every file.
+
+Instructions:
+1. Read each file completely
+2. Analyze code quality, structure, documentation, and characteristics
+3. Evaluate against the "{metric_name}" metric criteria
+4. After reading ALL files, calculate a single numeric score
+5. Generate JSON response with your score
+
+Output requirements:
+- Format: {{ "{score_name}": <float value> }}
+- Score must be in range {score_range}
+- Do not include any additional text, explanations, or commentary
+- Ensure valid JSON format
+
+Begin reading the files now:
+    """.strip()
+
+    return instructions
+
+
+# ====================================================================================
+# PRIVATE HELPERS - PROMPT CACHE
+# ====================================================================================
+
+_PromptKey = Tuple[Any, ...]
+_prompt_cache: "OrderedDict[_PromptKey, str]" = OrderedDict()
+_prompt_cache_lock = threading.Lock()
+
+
+def _files_fingerprint(files: Dict[str, str]) -> Tuple[Tuple[str, bytes], ...]:
+    """Order-preserving (name, content digest) pairs, so cache keys never hold file bodies."""
+    return tuple(
+        (name, hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest())
+        for name, content in files.items()
+    )
+
+
+def _cached_prompt(key: _PromptKey, build: Callable[[], str]) -> str:
+    """Return the prompt cached under key, building (and caching) it on a miss."""
+    with _prompt_cache_lock:
+        cached = _prompt_cache.get(key)
+        if cached is not None:
+            _prompt_cache.move_to_end(key)
+            return cached
+
+    prompt = build()
+
+    with _prompt_cache_lock:
+        _prompt_cache[key] = prompt
+        if len(_prompt_cache) > PROMPT_CACHE_MAX_ENTRIES:
+            _prompt_cache.popitem(last=False)
+    return prompt
 
 
 # ====================================================================================
@@ -433,58 +701,135 @@ def extract_llm_score_field(
 # ====================================================================================
 
 
-def _trim_section_to_budget(text: str, token_budget: int, important_terms: List[str]) -> str:
+def _file_section_priority(fname: str) -> int:
+    """Rank a file by how much signal it carries per token (lower is better)."""
+    basename = fname.rsplit("/", 1)[-1].lower()
+    if basename.startswith("readme"):
+        return 0
+    return _SECTION_PRIORITY.get(basename, len(_SECTION_PRIORITY_TIERS) + 1)
+
+
+def _file_sections(files: Dict[str, str]) -> Dict[str, str]:
+    """
+    Title files as prompt sections, most informative first.
+
+    README and project manifests lead, then everything else from smallest to
+    largest, so when the assembled prompt is cut in the middle the large,
+    often boilerplate files are the ones that lose content.
+    """
+    ordered = sorted(
+        files.items(), key=lambda item: (_file_section_priority(item[0]), len(item[1]))
+    )
+    return {f"FILE: {fname}": content for fname, content in ordered}
+
+
+def _allocate_section_budgets(
+    section_tokens: List[int], remaining: int, min_floor: int
+) -> List[int]:
+    """
+    Split `remaining` tokens across sections proportionally to their size.
+
+    Pure integer arithmetic: each section first gets its floor-clamped share,
+    then shares are rescaled so the floors do not push the total over budget.
+    """
+    total = max(1, sum(section_tokens))
+    provisional = [max(min_floor, t * remaining // total) for t in section_tokens]
+    provisional_total = max(1, sum(provisional))
+    return [max(min_floor, p * remaining // provisional_total) for p in provisional]
+
+
+def _format_section(title: str, content: str) -> str:
+    """Render one titled prompt section."""
+    return f"=== {title} ===\n{content}\n"
+
+
+def _assemble_prompt(header_text: str, sections: List[str]) -> str:
+    """Join header and sections with newlines in a single allocation."""
+    return "\n".join([header_text, *sections])
+
+
+def _assemble_sections(header_text: str, section_items: List[Tuple[str, str]]) -> str:
+    """
+    Same output as _assemble_prompt over _format_section() strings, but joins the
+    raw titles and contents directly so no per-section copy is made.
+    """
+    pieces = [header_text]
+    for title, content in section_items:
+        pieces += ("\n=== ", title, " ===\n", content, "\n")
+    return "".join(pieces)
+
+
+def _trim_section_to_budget(text: str, token_budget: int, important_terms: Sequence[str]) -> str:
     """Trim section to budget: keep important lines + head lines, preserving original order."""
     if _estimate_token_count(text) <= token_budget:
         return text
 
     lines = text.splitlines()
+    is_important = _compile_important_terms(tuple(important_terms))
 
-    # Validate and compile regex patterns
-    patterns = []
-    for p in important_terms:
-        try:
-            patterns.append(re.compile(p, re.IGNORECASE))
-        except re.error as e:
-            clogger.warning(f"[llm] Invalid regex pattern '{p}': {e}. Skipping.")
-            continue
-
-    def is_important(line: str) -> bool:
-        return any(p.search(line) for p in patterns)
+    # Per-line cost (estimate + 1 for the newline), computed once for both passes
+    line_costs = [max(1, len(line) // CHARS_PER_TOKEN) + 1 for line in lines]
 
-    # Collect important line indices
-    important_indices = {i for i, ln in enumerate(lines) if is_important(ln)}
-
-    # Add important lines up to budget (prioritize by original order)
-    selected_indices = set()
+    # Packed per-line keep mask (one byte per line) avoids building and sorting index sets
+    keep = bytearray(len(lines))
     running_tokens = 0
 
-    for i in sorted(important_indices):
-        line_tokens = _estimate_token_count(lines[i])
-        if running_tokens + line_tokens + 1 > token_budget:  # +1 for newline
-            clogger.debug(
-                f"[llm] Important lines exceed budget ({running_tokens}/{token_budget} tokens). "
-                f"Truncating at line {i}."
-            )
-            break
-        selected_indices.add(i)
-        running_tokens += line_tokens + 1
-
-    # Add head lines from the beginning until budget would be exceeded
-    for i in range(len(lines)):
-        if i not in selected_indices:
-            # Check BEFORE adding to avoid exceeding budget
-            line_tokens = _estimate_token_count(lines[i])
-            if running_tokens + line_tokens + 1 > token_budget:  # +1 for newline
+    # Add important lines up to budget (prioritize by original order)
+    if is_important is not None:
+        for i, line in enumerate(lines):
+            if not is_important(line):
                 continue
+            line_tokens = line_costs[i]
+            if running_tokens + line_tokens > token_budget:
+                clogger.debug(
+                    f"[llm] Important lines exceed budget ({running_tokens}/{token_budget} "
+                    f"tokens). Truncating at line {i}."
+                )
+                break
+            keep[i] = 1
+            running_tokens += line_tokens
 
-            selected_indices.add(i)
-            running_tokens += line_tokens + 1
+    # Add head lines from the beginning until budget would be exceeded
+    for i, line_tokens in enumerate(line_costs):
+        if keep[i]:
+            continue
+        # Check BEFORE adding to avoid exceeding budget
+        if running_tokens + line_tokens > token_budget:
+            continue
+        keep[i] = 1
+        running_tokens += line_tokens
 
     # Extract lines in original order
-    final_indices = sorted(selected_indices)
-    trimmed_lines = [lines[i] for i in final_indices]
-    return "\n".join(trimmed_lines)
+    return "\n".join([line for line, kept in zip(lines, keep) if kept])
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_important_terms(terms: Tuple[str, ...]) -> Optional[Callable[[str], Any]]:
+    """
+    Build a case-insensitive line matcher for the given regex terms, or None if none are valid.
+
+    Terms are merged into one alternation so each line is scanned once. Terms with
+    capture groups keep separate patterns, since merging would renumber backreferences.
+    """
+    patterns = []
+    for p in terms:
+        try:
+            patterns.append(re.compile(p, re.IGNORECASE))
+        except re.error as e:
+            clogger.warning(f"[llm] Invalid regex pattern '{p}': {e}. Skipping.")
+
+    if not patterns:
+        return None
+    if len(patterns) == 1:
+        return patterns[0].search
+
+    if not any(p.groups for p in patterns):
+        try:
+            alternation = "|".join(f"(?:{p.pattern})" for p in patterns)
+            return re.compile(alternation, re.IGNORECASE).search
+        except re.error:
+            pass  # e.g. inline flags that are only legal at the start of a pattern
+    return lambda line: any(p.search(line) for p in patterns)
 
 
 # ====================================================================================
@@ -531,10 +876,14 @@ def _extract_json_from_response(content: str) -> Optional[Dict[str, Any]]:
     """
     Extract JSON from LLM response, even if embedded in explanatory text.
 
-    Tries multiple strategies:
+    Tries, in order:
     1. Direct JSON parsing
-    2. Extract JSON block using regex
-    3. Extract first {...} or [...] structure
+    2. A raw_decode sweep for the first embedded {...} object, which also covers
+       ```json fenced blocks and prose-wrapped answers
+    3. Retry 2 after dropping trailing commas (a common LLM formatting slip)
+
+    Any <think>...</think> reasoning preamble is removed first so JSON-like
+    fragments inside it are not mistaken for the answer.
 
     Also sanitizes the extracted JSON to convert string "None" to actual None.
 
@@ -552,33 +901,204 @@ def _extract_json_from_response(content: str) -> Optional[Dict[str, Any]]:
         clogger.error("[llm] Response content is empty or whitespace-only")
         return None
 
+    if "<think>" in content:
+        content = _THINK_BLOCK_RE.sub("", content)
+
     # Strategy 1: Direct parse
     try:
-        parsed = json.loads(content)
+        parsed = _json_loads(content)
         return _sanitize_json_value(parsed)
     except json.JSONDecodeError:
         pass
 
-    # Strategy 2: Extract JSON code block (```json ... ```)
-    match = re.search(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", content, re.DOTALL)
-    if match:
-        try:
-            parsed = json.loads(match.group(1))
-            return _sanitize_json_value(parsed)
-        except json.JSONDecodeError:
-            pass
+    # Strategy 2: First embedded {...} object (fenced or surrounded by prose)
+    embedded = _find_embedded_json_object(content)
+    if embedded is not None:
+        return _sanitize_json_value(embedded)
 
-    # Strategy 3: Extract first {...} structure
-    match = re.search(r"\{[^{}]*\}", content, re.DOTALL)
-    if match:
+    # Strategy 3: Repair trailing commas ({"a": 1,}) and retry the embedded scan
+    repaired = _TRAILING_COMMA_RE.sub(r"\1", content)
+    if repaired != content:
+        embedded = _find_embedded_json_object(repaired)
+        if embedded is not None:
+            return _sanitize_json_value(embedded)
+
+    # All strategies failed
+    clogger.error("[llm] Failed to extract JSON from LLM output")
+    return None
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson when installed, else the stdlib.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch a
+    single exception type either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _find_embedded_json_object(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the first JSON object embedded in free text, or None.
+
+    Each "{" is handed to the C-accelerated raw_decode, which consumes exactly one
+    balanced value (nested objects and braces inside strings included) or fails
+    fast, so no regex backtracking is involved.
+    """
+    start = content.find("{")
+    while start != -1:
         try:
-            parsed = json.loads(match.group(0))
-            return _sanitize_json_value(parsed)
+            parsed, _ = _JSON_DECODER.raw_decode(content, start)
         except json.JSONDecodeError:
             pass
+        else:
+            if isinstance(parsed, dict):
+                return parsed
+        start = content.find("{", start + 1)
+    return None
 
-    # All strategies failed
-    clogger.error("[llm] Failed to extract JSON from LLM output")
+
+# ====================================================================================
+# PRIVATE HELPERS - RESPONSE CACHE
+# ====================================================================================
+
+
+def _get_cached_response(key: _ResponseKey) -> Optional[Union[str, Dict[str, Any]]]:
+    """Return a deep copy of a cached response (refreshing its LRU position), or None."""
+    if not LLM_RESPONSE_CACHE_ENABLED:
+        return None
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is None:
+            return None
+        _response_cache.move_to_end(key)
+    return copy.deepcopy(cached)
+
+
+def _store_cached_response(key: Optional[_ResponseKey], value: Union[str, Dict[str, Any]]) -> None:
+    """Cache a successful response, evicting the least recently used entry if full.
+
+    A None key marks an uncacheable (sampled) request and is ignored.
+    """
+    if key is None or not LLM_RESPONSE_CACHE_ENABLED:
+        return
+    # Deep copy so nested lists/dicts the caller later mutates stay out of the cache
+    value = copy.deepcopy(value)
+    with _response_cache_lock:
+        _response_cache[key] = value
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > LLM_RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+
+# ====================================================================================
+# PRIVATE HELPERS - RESPONSE STREAMING
+# ====================================================================================
+
+
+def _read_response_stream(response: Any, stop_at_json: bool = False) -> Tuple[str, str]:
+    """
+    Collect generated text from an invoke_model_with_response_stream() response.
+
+    Returns (content, stop_reason). With stop_at_json, the stream is closed once the
+    text starting at the first "{" outside any <think> block decodes as a complete
+    JSON object.
+    """
+    event_stream = response["body"]
+    parts: List[str] = []
+    stop_reason = "unknown"
+
+    for event in event_stream:
+        chunk = event.get("chunk")
+        if chunk is None:
+            continue
+
+        payload = _json_loads(chunk["bytes"])
+        if "contentBlockDelta" in payload:
+            text = payload["contentBlockDelta"]["delta"].get("text", "")
+            parts.append(text)
+            if stop_at_json and "}" in text and _starts_complete_json_object("".join(parts)):
+                stop_reason = "json_complete"
+                event_stream.close()
+                break
+        elif "messageStop" in payload:
+            stop_reason = payload["messageStop"].get("stopReason", stop_reason)
+
+    return "".join(parts), stop_reason
+
+
+def _starts_complete_json_object(text: str) -> bool:
+    """True if the text from the first "{" onwards already holds a full JSON object.
+
+    <think> blocks (including one still open) are skipped, as in
+    _extract_json_from_response(), so a brace inside the reasoning cannot end
+    the stream before the real answer arrives.
+    """
+    if "<think>" in text:
+        text = _THINK_BLOCK_RE.sub("", text)
+    start = text.find("{")
+    if start == -1:
+        return False
+    try:
+        parsed, _ = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(parsed, dict)
+
+
+# ====================================================================================
+# PRIVATE HELPERS - REQUEST / RESPONSE ENCODING
+# ====================================================================================
+
+
+def _encode_request_body(prompt: str, max_tokens: int, temperature: float) -> str:
+    """Serialize a Nova Messages API request body from the precomputed template."""
+    return _NOVA_REQUEST_TEMPLATE % (json.dumps(prompt), max_tokens, json.dumps(temperature))
+
+
+def _decode_response_body(parsed: Dict[str, Any]) -> Tuple[str, str]:
+    """Return (text, stop_reason) from a Nova response: output.message.content[0].text."""
+    return parsed["output"]["message"]["content"][0]["text"], parsed.get("stopReason", "unknown")
+
+
+def _encode_tool_request_body(
+    prompt: str, max_tokens: int, temperature: float, json_schema: Dict[str, Any]
+) -> str:
+    """Serialize a Nova request that forces the answer through the JSON tool."""
+    return json.dumps(
+        {
+            "messages": [{"role": "user", "content": [{"text": prompt}]}],
+            "inferenceConfig": {"max_new_tokens": max_tokens, "temperature": temperature},
+            "toolConfig": {
+                "tools": [
+                    {
+                        "toolSpec": {
+                            "name": _JSON_TOOL_NAME,
+                            "description": "Return the answer as JSON matching the input schema.",
+                            "inputSchema": {"json": json_schema},
+                        }
+                    }
+                ],
+                "toolChoice": {"tool": {"name": _JSON_TOOL_NAME}},
+            },
+        }
+    )
+
+
+def _decode_tool_use_input(parsed: Any) -> Optional[Dict[str, Any]]:
+    """Return the JSON tool's input from a Nova response, or None if it was not used."""
+    if not isinstance(parsed, dict):
+        return None
+    blocks = parsed.get("output", {}).get("message", {}).get("content", [])
+    for block in blocks:
+        tool_use = block.get("toolUse") if isinstance(block, dict) else None
+        if tool_use and tool_use.get("name") == _JSON_TOOL_NAME:
+            tool_input = tool_use.get("input")
+            if isinstance(tool_input, dict):
+                return tool_input
     return None
 
 
@@ -589,15 +1109,26 @@ def _extract_json_from_response(content: str) -> Optional[Dict[str, Any]]:
 
 def _estimate_token_count(text: str) -> int:
     """Token estimate (1 token ≈ CHARS_PER_TOKEN characters to account for tokenizer variance)."""
-    return max(1, len(text) // CHARS_PER_TOKEN)
+    return _estimate_tokens_for_length(len(text))
+
+
+def _estimate_tokens_for_length(length: int) -> int:
+    """Token estimate for a string of the given length, without needing the string."""
+    return max(1, length // CHARS_PER_TOKEN)
 
 
-def _truncate_to_token_limit(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
+def _truncate_to_token_limit(
+    text: str,
+    max_tokens: int = MAX_INPUT_TOKENS,
+    strategy: Literal["head", "head_tail"] = "head_tail",
+) -> str:
     """
     Truncate text to fit within token limit.
 
-    Uses a rough heuristic: 1 token ≈ 4 characters.
-    Adds ellipsis if truncation occurs.
+    Uses a rough heuristic: 1 token ≈ CHARS_PER_TOKEN characters.
+    "head_tail" keeps the first and last half of the budget so both the task
+    instructions and the closing content survive; "head" keeps only the start.
+    Marks the cut with an ellipsis.
     """
     estimated = _estimate_token_count(text)
 
@@ -606,11 +1137,21 @@ def _truncate_to_token_limit(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> s
 
     # Calculate approximate character limit
     char_limit = max_tokens * CHARS_PER_TOKEN
-    truncated = text[:char_limit].rstrip()
 
+    if strategy == "head":
+        result = text[:char_limit].rstrip() + "..."
+        clogger.warning(
+            f"[llm] Truncating prompt to fit token limit "
+            f"({estimated} → {_estimate_token_count(result)} estimated tokens)"
+        )
+        return result
+
+    half = max(1, char_limit // 2)
+    head = text[:half].rstrip()
+    tail = text[-half:].lstrip()
     clogger.warning(
-        f"[llm] Truncating prompt to fit token limit "
-        f"({estimated} → {_estimate_token_count(truncated + '...')} estimated tokens)"
+        f"[llm] Truncating prompt middle to fit token limit ({estimated} → "
+        f"head {_estimate_token_count(head)} + tail {_estimate_token_count(tail)} "
+        f"estimated tokens)"
     )
-
-    return truncated + "..."
+    return f"{head}\n...\n{tail}"
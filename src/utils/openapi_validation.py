@@ -3,24 +3,81 @@ OpenAPI schema validation utilities for logging.
 
 Validates requests/responses against OpenAPI spec for compliance tracking.
 This module is used by the @log_lambda_handler decorator to detect API spec drift.
+
+The spec is authored in YAML. Run `python -m src.utils.openapi_validation` before
+packaging to render it to JSON alongside the YAML; cold starts then load the JSON
+with the C parser instead of running PyYAML.
 """
 
-from pathlib import Path
-from typing import Any, Dict, List, Tuple
+import functools
+import json
+import os
+import sys
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 import yaml
 
-# Load OpenAPI spec at module level (cold start once per Lambda instance)
-SPEC_PATH = Path(__file__).parent.parent.parent / "ece461_fall_2025_openapi_spec.yaml"
-
+# libyaml's C loader when PyYAML was built with it (the manylinux wheels are)
 try:
-    with open(SPEC_PATH) as f:
-        OPENAPI_SPEC = yaml.safe_load(f)
-except FileNotFoundError:
-    # Graceful fallback if spec file not found
-    OPENAPI_SPEC = {}
-
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
+# Load OpenAPI spec at module level (cold start once per Lambda instance)
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SPEC_PATH = os.path.join(_REPO_ROOT, "ece461_fall_2025_openapi_spec.yaml")
+SPEC_JSON_PATH = os.path.join(_REPO_ROOT, "ece461_fall_2025_openapi_spec.json")
+
+
+def _load_spec() -> Dict[str, Any]:
+    """Load the spec, preferring the pre-rendered JSON copy over parsing the YAML."""
+    try:
+        with open(SPEC_JSON_PATH, "rb") as f:
+            return json.loads(f.read())
+    except FileNotFoundError:
+        pass
+
+    try:
+        # Bytes let the YAML reader detect the encoding itself, skipping text decoding
+        with open(SPEC_PATH, "rb") as f:
+            return yaml.load(f, Loader=_YamlLoader) or {}
+    except FileNotFoundError:
+        # Graceful fallback if spec file not found
+        return {}
+
+
+def render_spec_json() -> str:
+    """Write the YAML spec to SPEC_JSON_PATH (a build step) and return that path."""
+    with open(SPEC_PATH, "rb") as f:
+        spec = yaml.load(f, Loader=_YamlLoader)
+    # default=str covers YAML-only scalars such as dates; int keys become strings
+    with open(SPEC_JSON_PATH, "w") as f:
+        json.dump(spec, f, default=str)
+    return SPEC_JSON_PATH
+
+
+OPENAPI_SPEC = _load_spec()
+
+
+# Path normalization tables. API Gateway paths map onto OpenAPI templates by their
+# segment count, root segment, and (for sub-resources) their last segment:
+#   /artifact/model                    -> /artifact/{artifact_type}
+#   /artifacts/model/abc-123           -> /artifacts/{artifact_type}/{id}
+#   /artifact/byName/MyModel           -> /artifact/byName/{name}
+#   /artifact/dataset/abc-123/cost     -> /artifact/{artifact_type}/{id}/cost
+#   /artifact/model/abc-123/rate       -> /artifact/model/{id}/rate
+_ARTIFACT_TYPES = frozenset({"model", "dataset", "code"})
+_MODEL_SUBRESOURCE_PATHS = {
+    "rate": "/artifact/model/{id}/rate",
+    "lineage": "/artifact/model/{id}/lineage",
+    "license-check": "/artifact/model/{id}/license-check",
+}
+
+# Both validate_request() and validate_response() normalize the same path per request
+NORMALIZED_PATH_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=NORMALIZED_PATH_CACHE_SIZE)
 def _normalize_path(path: str) -> str:
     """
     Normalize API Gateway path to OpenAPI path format.
@@ -34,44 +91,137 @@ def _normalize_path(path: str) -> str:
     Returns:
         Normalized path matching OpenAPI spec format
     """
-    # Common path normalizations
-    # /artifact/model/abc-123 -> /artifact/{artifact_type}/{id}
-    # /artifacts/model/abc-123 -> /artifacts/{artifact_type}/{id}
-    # /artifact/byName/MyModel -> /artifact/byName/{name}
-    # /artifact/model/abc-123/rate -> /artifact/model/{id}/rate
-
     path = path.rstrip("/")
-
-    # Map of path patterns to OpenAPI spec paths
-    path_patterns = [
-        (r"/artifacts/(model|dataset|code)/[^/]+$", "/artifacts/{artifact_type}/{id}"),
-        (
-            r"/artifact/(model|dataset|code)/[^/]+/cost$",
-            "/artifact/{artifact_type}/{id}/cost",
-        ),
-        (r"/artifact/model/[^/]+/rate$", "/artifact/model/{id}/rate"),
-        (r"/artifact/model/[^/]+/lineage$", "/artifact/model/{id}/lineage"),
-        (r"/artifact/model/[^/]+/license-check$", "/artifact/model/{id}/license-check"),
-        (r"/artifact/byName/[^/]+$", "/artifact/byName/{name}"),
-        (r"/artifact/(model|dataset|code)$", "/artifact/{artifact_type}"),
-    ]
-
-    import re
-
-    for pattern, openapi_path in path_patterns:
-        if re.match(pattern, path):
-            return openapi_path
+    parts = path.split("/")
+    if len(parts) < 3 or parts[0]:
+        return path
+
+    root, kind = parts[1], parts[2]
+    if len(parts) == 3:
+        if root == "artifact" and kind in _ARTIFACT_TYPES:
+            return "/artifact/{artifact_type}"
+    elif len(parts) == 4 and parts[3]:
+        if root == "artifacts" and kind in _ARTIFACT_TYPES:
+            return "/artifacts/{artifact_type}/{id}"
+        if root == "artifact" and kind == "byName":
+            return "/artifact/byName/{name}"
+    elif len(parts) == 5 and root == "artifact" and parts[3]:
+        action = parts[4]
+        if action == "cost" and kind in _ARTIFACT_TYPES:
+            return "/artifact/{artifact_type}/{id}/cost"
+        if kind == "model" and action in _MODEL_SUBRESOURCE_PATHS:
+            return _MODEL_SUBRESOURCE_PATHS[action]
 
     return path
 
 
+# ====================================================================================
+# ENDPOINT INDEX
+# ====================================================================================
+# Everything the validators need from the spec, flattened once per loaded spec into
+# (path, method) -> requirements, so per-request validation is dict and set lookups.
+# ------------------------------------------------------------------------------------
+
+
+class _EndpointSpec(NamedTuple):
+    required_headers: Tuple[Tuple[str, str], ...]  # (lowercased name, spec name)
+    required_header_names: FrozenSet[str]  # lowercased, for one subset check
+    required_query: Tuple[str, ...]
+    required_query_names: FrozenSet[str]
+    body_required: bool
+    response_codes: FrozenSet[int]
+    has_default_response: bool
+
+
+class _EndpointIndex(NamedTuple):
+    paths: FrozenSet[str]
+    endpoints: Dict[Tuple[str, str], _EndpointSpec]
+
+
+# API Gateway sends upper-case methods; the index is keyed by the spec's lower-case ones.
+# Both sides are interned so the tuple-key comparison short-circuits on identity.
+_METHOD_KEYS = {
+    m: sys.intern(m.lower()) for m in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+}
+
+_endpoint_index: Optional[_EndpointIndex] = None
+_indexed_spec: Optional[Dict[str, Any]] = None
+
+
+def _build_endpoint_index(spec: Dict[str, Any]) -> _EndpointIndex:
+    """Flatten spec["paths"] into per-(path, method) validation requirements."""
+    paths = spec.get("paths", {})
+    endpoints: Dict[Tuple[str, str], _EndpointSpec] = {}
+
+    for path, path_spec in paths.items():
+        for method, method_spec in (path_spec or {}).items():
+            if not isinstance(method_spec, dict):
+                continue
+            parameters = method_spec.get("parameters", [])
+            request_body_spec = method_spec.get("requestBody") or {}
+            responses = method_spec.get("responses", {})
+            required_headers = tuple(
+                (param["name"].lower(), param["name"])
+                for param in parameters
+                if param.get("in") == "header" and param.get("required")
+            )
+            required_query = tuple(
+                param["name"]
+                for param in parameters
+                if param.get("in") == "query" and param.get("required")
+            )
+            endpoints[(path, sys.intern(method.lower()))] = _EndpointSpec(
+                required_headers=required_headers,
+                required_header_names=frozenset(lower for lower, _ in required_headers),
+                required_query=required_query,
+                required_query_names=frozenset(required_query),
+                body_required=bool(request_body_spec.get("required")),
+                response_codes=frozenset(int(code) for code in responses if str(code).isdigit()),
+                has_default_response="default" in responses,
+            )
+
+    return _EndpointIndex(paths=frozenset(paths), endpoints=endpoints)
+
+
+def _get_endpoint_index() -> _EndpointIndex:
+    """Return the index for the current OPENAPI_SPEC, rebuilding it if the spec changed."""
+    global _endpoint_index, _indexed_spec
+
+    if _endpoint_index is None or _indexed_spec is not OPENAPI_SPEC:
+        _endpoint_index = _build_endpoint_index(OPENAPI_SPEC)
+        _indexed_spec = OPENAPI_SPEC
+    return _endpoint_index
+
+
+def _resolve_endpoint(endpoint: str, method: str) -> Optional[_EndpointSpec]:
+    """Spec entry for a request: normalized template first, exact path as fallback."""
+    endpoints = _get_endpoint_index().endpoints
+    method_key = _METHOD_KEYS.get(method) or method.lower()
+    endpoint_spec = endpoints.get((_normalize_path(endpoint), method_key))
+    if endpoint_spec is None:
+        endpoint_spec = endpoints.get((endpoint, method_key))
+    return endpoint_spec
+
+
+def _is_known_path(endpoint: str) -> bool:
+    """Whether the spec defines the request path at all (used to word violations)."""
+    paths = _get_endpoint_index().paths
+    return _normalize_path(endpoint) in paths or endpoint in paths
+
+
+# ====================================================================================
+# VALIDATION
+# ====================================================================================
+
+
 def validate_request(
     endpoint: str,
     method: str,
     headers: Dict[str, Any],
     query_params: Dict[str, Any],
-    path_params: Dict[str, Any],
     body: Any,
+    *,
+    path_params: Optional[Dict[str, Any]] = None,
 ) -> Tuple[bool, List[str]]:
     """
     Validate request against OpenAPI spec.
@@ -81,8 +231,9 @@ def validate_request(
         method: HTTP method (GET, POST, PUT, DELETE)
         headers: Request headers dict
         query_params: Query string parameters
-        path_params: Path parameters
         body: Request body (string or dict)
+        path_params: Path parameters (accepted but not validated; path templates
+            are matched through the endpoint itself)
 
     Returns:
         Tuple of (is_valid, list_of_violations)
@@ -92,49 +243,49 @@ def validate_request(
 
     violations = []
 
-    # Normalize path to OpenAPI format
-    normalized_path = _normalize_path(endpoint)
-
-    # Find endpoint in spec
-    paths = OPENAPI_SPEC.get("paths", {})
-    path_spec = paths.get(normalized_path)
-
-    if not path_spec:
-        # Try exact match as fallback
-        path_spec = paths.get(endpoint)
-
-    if not path_spec:
-        violations.append(f"Endpoint {endpoint} not found in OpenAPI spec")
+    # Find endpoint and method in spec
+    endpoint_spec = _resolve_endpoint(endpoint, method)
+    if endpoint_spec is None:
+        if not _is_known_path(endpoint):
+            violations.append(f"Endpoint {endpoint} not found in OpenAPI spec")
+        else:
+            violations.append(f"Method {method} not defined for {endpoint} in OpenAPI spec")
         return False, violations
 
-    # Find method spec
-    method_spec = path_spec.get(method.lower())
-    if not method_spec:
-        violations.append(f"Method {method} not defined for {endpoint} in OpenAPI spec")
-        return False, violations
-
-    # Validate required headers
-    parameters = method_spec.get("parameters", [])
-    for param in parameters:
-        if param.get("in") == "header" and param.get("required"):
-            param_name = param["name"]
-            # Headers are case-insensitive, normalize to lowercase for comparison
-            headers_lower = {k.lower(): v for k, v in headers.items()}
-            if param_name.lower() not in headers_lower:
-                violations.append(f"Missing required header: {param_name}")
+    # Endpoints with no required headers, query params or body have nothing left to check
+    if not (
+        endpoint_spec.required_headers
+        or endpoint_spec.required_query
+        or endpoint_spec.body_required
+    ):
+        return True, violations
+
+    # Validate required headers (case-insensitive, so compare lowercased names)
+    # A single subset check covers the usual all-present case; only a failing request
+    # walks the ordered names, so violations keep the spec's parameter order.
+    # HTTP/2 clients already send lower-case header names, so the raw keys are tried
+    # before lowercasing every header.
+    required_headers = endpoint_spec.required_header_names
+    if required_headers and not headers.keys() >= required_headers:
+        headers_lower = {k.lower() for k in headers}
+        if not required_headers <= headers_lower:
+            violations.extend(
+                f"Missing required header: {param_name}"
+                for name_lower, param_name in endpoint_spec.required_headers
+                if name_lower not in headers_lower
+            )
 
     # Validate required query params
-    for param in parameters:
-        if param.get("in") == "query" and param.get("required"):
-            param_name = param["name"]
-            if param_name not in query_params:
-                violations.append(f"Missing required query param: {param_name}")
-
-    # Validate request body if present
-    request_body_spec = method_spec.get("requestBody")
-    if request_body_spec:
-        if request_body_spec.get("required") and not body:
-            violations.append("Missing required request body")
+    if not query_params.keys() >= endpoint_spec.required_query_names:
+        violations.extend(
+            f"Missing required query param: {param_name}"
+            for param_name in endpoint_spec.required_query
+            if param_name not in query_params
+        )
+
+    # Validate request body if required
+    if endpoint_spec.body_required and not body:
+        violations.append("Missing required request body")
 
     return len(violations) == 0, violations
 
@@ -162,37 +313,20 @@ def validate_response(
 
     violations = []
 
-    # Normalize path to OpenAPI format
-    normalized_path = _normalize_path(endpoint)
-
-    # Find endpoint in spec
-    paths = OPENAPI_SPEC.get("paths", {})
-    path_spec = paths.get(normalized_path)
-
-    if not path_spec:
-        # Try exact match as fallback
-        path_spec = paths.get(endpoint)
-
-    if not path_spec:
-        return True, []  # Can't validate unknown endpoint
+    # Find endpoint and method in spec
+    endpoint_spec = _resolve_endpoint(endpoint, method)
+    if endpoint_spec is None:
+        return True, []  # Can't validate unknown endpoint or method
 
-    # Find method spec
-    method_spec = path_spec.get(method.lower())
-    if not method_spec:
-        return True, []  # Can't validate unknown method
-
-    # Check if status code is defined
-    responses = method_spec.get("responses", {})
-    status_str = str(status_code)
-
-    if status_str not in responses:
-        # Check for default response
-        if "default" not in responses:
-            violations.append(
-                f"Status code {status_code} not defined in spec for {method} {endpoint}"
-            )
+    # Check if status code (or a default response) is defined
+    if status_code not in endpoint_spec.response_codes and not endpoint_spec.has_default_response:
+        violations.append(f"Status code {status_code} not defined in spec for {method} {endpoint}")
 
     # Could add deeper schema validation here using jsonschema library
     # For now, we only validate that the status code is documented
 
     return len(violations) == 0, violations
+
+
+if __name__ == "__main__":
+    print(f"Wrote {render_spec_json()}")
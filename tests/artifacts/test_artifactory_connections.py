@@ -3,6 +3,8 @@
 # - UnknownArtifact test now expects ValueError
 # - Child-model tests now explicitly set parent.child_model_ids = None
 
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -74,6 +76,9 @@ def test_connect_model_loads_all_artifacts_once(
 
     # Called twice: once for regular artifacts, once for rejected artifacts
     assert mock_load_all.call_count == 2
+    # The accepted table is only needed for matching, so just its index fields are read
+    assert any(c.kwargs.get("fields") for c in mock_load_all.call_args_list)
+    assert any(c.kwargs == {"rejected": True} for c in mock_load_all.call_args_list)
 
 
 @patch("src.artifacts.artifactory.connections.save_artifact_metadata")
@@ -81,8 +86,35 @@ def test_connect_model_loads_all_artifacts_once(
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 @patch("src.artifacts.artifactory.connections._find_connected_artifact_names")
-def test_connect_model_links_to_code_artifact(
+def test_connect_model_scans_tables_while_discovering_names(
     mock_find_names, mock_load_all, mock_load_by_fields, mock_load_meta, mock_save
+):
+    artifact = ModelArtifact(name="test-model", source_url="https://example.com")
+    scans_started = threading.Barrier(3, timeout=5)
+
+    def scan(rejected=False, fields=None):
+        scans_started.wait()
+        return []
+
+    # Discovery only gets past the barrier if both scans are running alongside it
+    mock_load_all.side_effect = scan
+    mock_find_names.side_effect = lambda a: scans_started.wait()
+    mock_load_by_fields.return_value = []
+
+    connect_artifact(artifact)
+
+    assert mock_load_all.call_count == 2
+    mock_find_names.assert_called_once_with(artifact)
+
+
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.load_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
+@patch("src.artifacts.artifactory.connections.load_artifacts_by_names")
+@patch("src.artifacts.artifactory.connections.load_all_artifacts")
+@patch("src.artifacts.artifactory.connections._find_connected_artifact_names")
+def test_connect_model_links_to_code_artifact(
+    mock_find_names, mock_load_all, mock_lookup, mock_load_by_fields, mock_load_meta, mock_save
 ):
     artifact = ModelArtifact(
         name="test-model",
@@ -97,20 +129,23 @@ def test_connect_model_links_to_code_artifact(
     )
 
     mock_load_all.return_value = [code_artifact]
-    mock_load_by_fields.return_value = [code_artifact]
+    mock_lookup.return_value = {("code", "my-training-code"): code_artifact}
+    mock_load_by_fields.return_value = []
 
     connect_artifact(artifact)
 
     assert artifact.code_artifact_id == "code-123"
+    mock_lookup.assert_called_once_with({"code": "my-training-code"}, artifact_list=[code_artifact])
 
 
 @patch("src.artifacts.artifactory.connections.save_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
+@patch("src.artifacts.artifactory.connections.load_artifacts_by_names")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 @patch("src.artifacts.artifactory.connections._find_connected_artifact_names")
 def test_connect_model_links_to_dataset_artifact(
-    mock_find_names, mock_load_all, mock_load_by_fields, mock_load_meta, mock_save
+    mock_find_names, mock_load_all, mock_lookup, mock_load_by_fields, mock_load_meta, mock_save
 ):
     artifact = ModelArtifact(
         name="test-model",
@@ -125,7 +160,8 @@ def test_connect_model_links_to_dataset_artifact(
     )
 
     mock_load_all.return_value = [dataset_artifact]
-    mock_load_by_fields.side_effect = [[dataset_artifact], []]
+    mock_lookup.return_value = {("dataset", "wikitext-103"): dataset_artifact}
+    mock_load_by_fields.return_value = []
 
     connect_artifact(artifact)
 
@@ -135,10 +171,11 @@ def test_connect_model_links_to_dataset_artifact(
 @patch("src.artifacts.artifactory.connections.save_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
+@patch("src.artifacts.artifactory.connections.load_artifacts_by_names")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 @patch("src.artifacts.artifactory.connections._find_connected_artifact_names")
 def test_connect_model_links_to_parent_model(
-    mock_find_names, mock_load_all, mock_load_by_fields, mock_load_meta, mock_save
+    mock_find_names, mock_load_all, mock_lookup, mock_load_by_fields, mock_load_meta, mock_save
 ):
     artifact = ModelArtifact(
         name="fine-tuned-model",
@@ -153,7 +190,8 @@ def test_connect_model_links_to_parent_model(
     )
 
     mock_load_all.return_value = [parent_model]
-    mock_load_by_fields.side_effect = [[parent_model], []]
+    mock_lookup.return_value = {("model", "bert-base-uncased"): parent_model}
+    mock_load_by_fields.return_value = []
 
     connect_artifact(artifact)
 
@@ -163,10 +201,11 @@ def test_connect_model_links_to_parent_model(
 @patch("src.artifacts.artifactory.connections.save_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
+@patch("src.artifacts.artifactory.connections.load_artifacts_by_names")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 @patch("src.artifacts.artifactory.connections._find_connected_artifact_names")
 def test_connect_model_skips_already_connected_code(
-    mock_find_names, mock_load_all, mock_load_by_fields, mock_load_meta, mock_save
+    mock_find_names, mock_load_all, mock_lookup, mock_load_by_fields, mock_load_meta, mock_save
 ):
     artifact = ModelArtifact(
         name="test-model",
@@ -176,21 +215,23 @@ def test_connect_model_skips_already_connected_code(
     )
 
     mock_load_all.return_value = []
+    mock_lookup.return_value = {}
     mock_load_by_fields.return_value = []
 
     connect_artifact(artifact)
 
-    calls = [c for c in mock_load_by_fields.call_args_list if c[1].get("artifact_type") == "code"]
-    assert len(calls) == 0
+    assert "code" not in mock_lookup.call_args[0][0]
+    assert artifact.code_artifact_id == "already-connected"
 
 
 @patch("src.artifacts.artifactory.connections.save_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
+@patch("src.artifacts.artifactory.connections.load_artifacts_by_names")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 @patch("src.artifacts.artifactory.connections._find_connected_artifact_names")
 def test_connect_model_skips_when_no_code_name(
-    mock_find_names, mock_load_all, mock_load_by_fields, mock_load_meta, mock_save
+    mock_find_names, mock_load_all, mock_lookup, mock_load_by_fields, mock_load_meta, mock_save
 ):
     artifact = ModelArtifact(
         name="test-model",
@@ -198,12 +239,44 @@ def test_connect_model_skips_when_no_code_name(
     )
 
     mock_load_all.return_value = []
+    mock_lookup.return_value = {}
     mock_load_by_fields.return_value = []
 
     connect_artifact(artifact)
 
-    calls = [c for c in mock_load_by_fields.call_args_list if c[1].get("artifact_type") == "code"]
-    assert len(calls) == 0
+    assert "code" not in mock_lookup.call_args[0][0]
+    assert artifact.code_artifact_id is None
+
+
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.load_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
+@patch("src.artifacts.artifactory.connections.load_all_artifacts")
+@patch("src.artifacts.artifactory.connections._find_connected_artifact_names")
+def test_connect_model_skips_save_when_no_changes(
+    mock_find_names, mock_load_all, mock_load_by_fields, mock_load_meta, mock_save
+):
+    artifact = ModelArtifact(
+        artifact_id="parent-789",
+        name="base-model",
+        source_url="https://example.com",
+    )
+    child = ModelArtifact(
+        artifact_id="child-1",
+        name="fine-tuned",
+        source_url="https://example.com",
+        parent_model_name="base-model",
+        parent_model_id="parent-789",
+    )
+
+    mock_load_all.return_value = [child]
+    mock_load_by_fields.side_effect = [[child], []]
+
+    connect_artifact(artifact)
+
+    assert artifact.child_model_ids == ["child-1"]
+    mock_load_meta.assert_not_called()
+    mock_save.assert_not_called()
 
 
 # ================================
@@ -211,7 +284,7 @@ def test_connect_model_skips_when_no_code_name(
 # ================================
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 def test_connect_code_finds_models_by_name(mock_load_all, mock_load_by_fields, mock_save):
@@ -229,10 +302,13 @@ def test_connect_code_finds_models_by_name(mock_load_all, mock_load_by_fields, m
     assert mock_load_by_fields.call_count == 2
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.load_artifacts_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
-def test_connect_code_links_to_models(mock_load_all, mock_load_by_fields, mock_save):
+def test_connect_code_links_to_models(
+    mock_load_all, mock_load_by_fields, mock_save, mock_load_models
+):
     artifact = CodeArtifact(
         artifact_id="code-123",
         name="my-training-code",
@@ -255,6 +331,10 @@ def test_connect_code_links_to_models(mock_load_all, mock_load_by_fields, mock_s
 
     mock_load_all.return_value = [model1, model2]
     mock_load_by_fields.side_effect = [[model1, model2], []]  # regular, then rejected
+    # Matches are reloaded in full before being linked
+    mock_load_models.side_effect = lambda ids, rejected=False: [
+        m for m in (model1, model2) if m.artifact_id in ids
+    ]
 
     with patch("src.metrics.registry.CODE_METRICS", []):
         with patch.object(model1, "compute_scores"):
@@ -263,10 +343,13 @@ def test_connect_code_links_to_models(mock_load_all, mock_load_by_fields, mock_s
 
     assert model1.code_artifact_id == "code-123"
     assert model2.code_artifact_id == "code-123"
-    assert mock_save.call_count == 2
+    mock_save.assert_called_once_with([model1, model2], rejected=False)
+    # Catalog scans only read the fields needed for matching
+    assert all(c.kwargs.get("fields") for c in mock_load_all.call_args_list)
+    mock_load_models.assert_called_once_with(["model-1", "model-2"], rejected=False)
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 def test_connect_code_skips_already_linked_models(mock_load_all, mock_load_by_fields, mock_save):
@@ -292,10 +375,13 @@ def test_connect_code_skips_already_linked_models(mock_load_all, mock_load_by_fi
     mock_save.assert_not_called()
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.load_artifacts_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
-def test_connect_code_recomputes_metrics(mock_load_all, mock_load_by_fields, mock_save):
+def test_connect_code_recomputes_metrics(
+    mock_load_all, mock_load_by_fields, mock_save, mock_load_models
+):
     artifact = CodeArtifact(
         artifact_id="code-123",
         name="my-training-code",
@@ -311,6 +397,10 @@ def test_connect_code_recomputes_metrics(mock_load_all, mock_load_by_fields, moc
 
     mock_load_all.return_value = [model]
     mock_load_by_fields.side_effect = [[model], []]  # regular, then rejected
+    # Matches are reloaded in full before being linked
+    mock_load_models.side_effect = lambda ids, rejected=False: [
+        m for m in (model,) if m.artifact_id in ids
+    ]
     mock_metrics = [MagicMock()]
 
     with patch("src.metrics.registry.CODE_METRICS", mock_metrics):
@@ -319,12 +409,50 @@ def test_connect_code_recomputes_metrics(mock_load_all, mock_load_by_fields, moc
             mock_compute.assert_called_once_with(mock_metrics)
 
 
+@patch("src.artifacts.artifactory.connections.load_artifacts_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
+@patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
+@patch("src.artifacts.artifactory.connections.load_all_artifacts")
+def test_connect_code_rescores_linked_models_concurrently(
+    mock_load_all, mock_load_by_fields, mock_save, mock_load_models
+):
+    artifact = CodeArtifact(
+        artifact_id="code-123",
+        name="my-training-code",
+        source_url="https://github.com/test/repo",
+    )
+    models = [
+        ModelArtifact(
+            artifact_id=f"model-{i}",
+            name=f"model-{i}",
+            source_url="https://example.com",
+            code_name="my-training-code",
+        )
+        for i in range(2)
+    ]
+
+    mock_load_all.return_value = models
+    mock_load_by_fields.side_effect = [models, []]  # regular, then rejected
+    mock_load_models.return_value = models
+
+    # Each rescore only finishes once the other one is running too
+    both_scoring = threading.Barrier(2, timeout=5)
+    with patch("src.metrics.registry.CODE_METRICS", []):
+        with patch.object(models[0], "compute_scores", side_effect=lambda m: both_scoring.wait()):
+            with patch.object(
+                models[1], "compute_scores", side_effect=lambda m: both_scoring.wait()
+            ):
+                connect_artifact(artifact)
+
+    mock_save.assert_called_once_with(models, rejected=False)
+
+
 # ================================
 # DATASET ARTIFACT TESTS
 # ================================
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 def test_connect_dataset_finds_models_by_name(mock_load_all, mock_load_by_fields, mock_save):
@@ -342,10 +470,13 @@ def test_connect_dataset_finds_models_by_name(mock_load_all, mock_load_by_fields
     assert mock_load_by_fields.call_count == 2
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.load_artifacts_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
-def test_connect_dataset_links_to_models(mock_load_all, mock_load_by_fields, mock_save):
+def test_connect_dataset_links_to_models(
+    mock_load_all, mock_load_by_fields, mock_save, mock_load_models
+):
     artifact = DatasetArtifact(
         artifact_id="dataset-456",
         name="wikitext-103",
@@ -368,6 +499,10 @@ def test_connect_dataset_links_to_models(mock_load_all, mock_load_by_fields, moc
 
     mock_load_all.return_value = [model1, model2]
     mock_load_by_fields.side_effect = [[model1, model2], []]  # regular, then rejected
+    # Matches are reloaded in full before being linked
+    mock_load_models.side_effect = lambda ids, rejected=False: [
+        m for m in (model1, model2) if m.artifact_id in ids
+    ]
 
     with patch("src.metrics.registry.DATASET_METRICS", []):
         with patch.object(model1, "compute_scores"):
@@ -376,10 +511,10 @@ def test_connect_dataset_links_to_models(mock_load_all, mock_load_by_fields, moc
 
     assert model1.dataset_artifact_id == "dataset-456"
     assert model2.dataset_artifact_id == "dataset-456"
-    assert mock_save.call_count == 2
+    mock_save.assert_called_once_with([model1, model2], rejected=False)
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 def test_connect_dataset_skips_already_linked_models(mock_load_all, mock_load_by_fields, mock_save):
@@ -405,10 +540,13 @@ def test_connect_dataset_skips_already_linked_models(mock_load_all, mock_load_by
     mock_save.assert_not_called()
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.load_artifacts_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
-def test_connect_dataset_recomputes_metrics(mock_load_all, mock_load_by_fields, mock_save):
+def test_connect_dataset_recomputes_metrics(
+    mock_load_all, mock_load_by_fields, mock_save, mock_load_models
+):
     artifact = DatasetArtifact(
         artifact_id="dataset-456",
         name="wikitext-103",
@@ -424,6 +562,10 @@ def test_connect_dataset_recomputes_metrics(mock_load_all, mock_load_by_fields,
 
     mock_load_all.return_value = [model]
     mock_load_by_fields.side_effect = [[model], []]  # regular, then rejected
+    # Matches are reloaded in full before being linked
+    mock_load_models.side_effect = lambda ids, rejected=False: [
+        m for m in (model,) if m.artifact_id in ids
+    ]
     mock_metrics = [MagicMock()]
 
     with patch("src.metrics.registry.DATASET_METRICS", mock_metrics):
@@ -432,7 +574,7 @@ def test_connect_dataset_recomputes_metrics(mock_load_all, mock_load_by_fields,
             mock_compute.assert_called_once_with(mock_metrics)
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 def test_connect_dataset_handles_no_matches(mock_load_all, mock_load_by_fields, mock_save):
@@ -454,7 +596,7 @@ def test_connect_dataset_handles_no_matches(mock_load_all, mock_load_by_fields,
 # ================================
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 def test_connect_code_handles_non_model_artifacts(mock_load_all, mock_load_by_fields, mock_save):
@@ -477,7 +619,7 @@ def test_connect_code_handles_non_model_artifacts(mock_load_all, mock_load_by_fi
     mock_save.assert_not_called()
 
 
-@patch("src.artifacts.artifactory.connections.save_artifact_metadata")
+@patch("src.artifacts.artifactory.connections.save_artifact_metadata_bulk")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 def test_connect_dataset_handles_non_model_artifacts(mock_load_all, mock_load_by_fields, mock_save):
@@ -503,10 +645,11 @@ def test_connect_dataset_handles_non_model_artifacts(mock_load_all, mock_load_by
 @patch("src.artifacts.artifactory.connections.save_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_artifact_metadata")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts_by_fields")
+@patch("src.artifacts.artifactory.connections.load_artifacts_by_names")
 @patch("src.artifacts.artifactory.connections.load_all_artifacts")
 @patch("src.artifacts.artifactory.connections._find_connected_artifact_names")
 def test_connect_model_handles_multiple_connections(
-    mock_find_names, mock_load_all, mock_load_by_fields, mock_load_meta, mock_save
+    mock_find_names, mock_load_all, mock_lookup, mock_load_by_fields, mock_load_meta, mock_save
 ):
     artifact = ModelArtifact(
         name="test-model",
@@ -535,10 +678,21 @@ def test_connect_model_handles_multiple_connections(
     )
 
     mock_load_all.return_value = [code, dataset, parent]
-    mock_load_by_fields.side_effect = [[code], [dataset], [parent], []]
+    mock_lookup.side_effect = lambda names, artifact_list: {
+        ("code", "my-code"): code,
+        ("dataset", "my-dataset"): dataset,
+        ("model", "base-model"): parent,
+    }
+    mock_load_by_fields.return_value = []
 
     connect_artifact(artifact)
 
+    assert mock_lookup.call_count == 1
+    assert mock_lookup.call_args[0][0] == {
+        "code": "my-code",
+        "dataset": "my-dataset",
+        "model": "base-model",
+    }
     assert artifact.code_artifact_id == "code-123"
     assert artifact.dataset_artifact_id == "dataset-456"
     assert artifact.parent_model_id == "parent-789"
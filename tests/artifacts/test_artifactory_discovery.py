@@ -23,7 +23,7 @@ from src.artifacts.model_artifact import ModelArtifact
 
 
 @patch("src.artifacts.artifactory.discovery.extract_relevant_files")
-@patch("src.artifacts.artifactory.discovery.download_artifact_from_s3")
+@patch("src.artifacts.artifactory.discovery.stream_artifact_from_s3")
 def test_download_and_extract_files_calls_download(mock_download, mock_extract):
     """Test that S3 download is called with correct parameters."""
     artifact = ModelArtifact(
@@ -37,18 +37,12 @@ def test_download_and_extract_files_calls_download(mock_download, mock_extract):
 
     _download_and_extract_files(artifact)
 
-    # Verify download was called with correct artifact_id and s3_key
-    # The local_path is now a dynamically generated temp file
-    mock_download.assert_called_once()
-    call_kwargs = mock_download.call_args.kwargs
-    assert call_kwargs["artifact_id"] == "test-id"
-    assert call_kwargs["s3_key"] == "models/test-id"
-    assert call_kwargs["local_path"].startswith("/tmp/discovery_test-id_")
-    assert call_kwargs["local_path"].endswith(".tar.gz")
+    # Verify the S3 object was opened with correct artifact_id and s3_key
+    mock_download.assert_called_once_with(artifact_id="test-id", s3_key="models/test-id")
 
 
 @patch("src.artifacts.artifactory.discovery.extract_relevant_files")
-@patch("src.artifacts.artifactory.discovery.download_artifact_from_s3")
+@patch("src.artifacts.artifactory.discovery.stream_artifact_from_s3")
 def test_download_and_extract_files_calls_extract(mock_download, mock_extract):
     """Test that file extraction is called with correct parameters."""
     artifact = ModelArtifact(
@@ -62,20 +56,20 @@ def test_download_and_extract_files_calls_extract(mock_download, mock_extract):
 
     _download_and_extract_files(artifact)
 
-    # Verify extract was called with correct params (tar_path is dynamic)
+    # Verify extract reads straight from the S3 body and the body is closed afterwards
     mock_extract.assert_called_once()
     call_kwargs = mock_extract.call_args.kwargs
-    assert call_kwargs["tar_path"].startswith("/tmp/discovery_test-id_")
-    assert call_kwargs["tar_path"].endswith(".tar.gz")
+    assert call_kwargs["fileobj"] is mock_download.return_value
+    mock_download.return_value.close.assert_called_once()
     assert call_kwargs["include_ext"] == {".json", ".md", ".txt"}
     assert call_kwargs["max_files"] == 10
     assert call_kwargs["prioritize_readme"] is True
 
 
 @patch("src.artifacts.artifactory.discovery.extract_relevant_files")
-@patch("src.artifacts.artifactory.discovery.download_artifact_from_s3")
+@patch("src.artifacts.artifactory.discovery.stream_artifact_from_s3")
 def test_download_and_extract_files_returns_files_dict(mock_download, mock_extract):
-    """Test that extracted files dictionary is returned along with temp path."""
+    """Test that extracted files dictionary is returned."""
     artifact = ModelArtifact(
         artifact_id="test-id",
         name="test-model",
@@ -89,16 +83,13 @@ def test_download_and_extract_files_returns_files_dict(mock_download, mock_extra
     }
     mock_extract.return_value = expected_files
 
-    tmp_path, result = _download_and_extract_files(artifact)
+    result = _download_and_extract_files(artifact)
 
-    # Function now returns tuple of (tmp_path, files_dict)
-    assert tmp_path.startswith("/tmp/discovery_test-id_")
-    assert tmp_path.endswith(".tar.gz")
     assert result == expected_files
 
 
 @patch("src.artifacts.artifactory.discovery.extract_relevant_files")
-@patch("src.artifacts.artifactory.discovery.download_artifact_from_s3")
+@patch("src.artifacts.artifactory.discovery.stream_artifact_from_s3")
 def test_download_and_extract_files_download_before_extract(mock_download, mock_extract):
     """Test that download happens before extraction."""
     artifact = ModelArtifact(
@@ -123,7 +114,7 @@ def test_download_and_extract_files_download_before_extract(mock_download, mock_
 
 
 @patch("src.artifacts.artifactory.discovery.extract_relevant_files")
-@patch("src.artifacts.artifactory.discovery.download_artifact_from_s3")
+@patch("src.artifacts.artifactory.discovery.stream_artifact_from_s3")
 def test_download_and_extract_files_propagates_download_error(mock_download, mock_extract):
     """Test that download errors are propagated."""
     artifact = ModelArtifact(
@@ -140,7 +131,7 @@ def test_download_and_extract_files_propagates_download_error(mock_download, moc
 
 
 @patch("src.artifacts.artifactory.discovery.extract_relevant_files")
-@patch("src.artifacts.artifactory.discovery.download_artifact_from_s3")
+@patch("src.artifacts.artifactory.discovery.stream_artifact_from_s3")
 def test_download_and_extract_files_propagates_extract_error(mock_download, mock_extract):
     """Test that extraction errors are propagated."""
     artifact = ModelArtifact(
@@ -155,6 +146,8 @@ def test_download_and_extract_files_propagates_extract_error(mock_download, mock
     with pytest.raises(Exception, match="Extraction failed"):
         _download_and_extract_files(artifact)
 
+    mock_download.return_value.close.assert_called_once()
+
 
 # =============================================================================
 # Test: _llm_extract_fields() - LLM-based field extraction
@@ -429,8 +422,7 @@ def test_find_connected_artifact_names_full_flow(mock_download, mock_llm, mock_u
     """Test full discovery flow with successful extraction."""
     artifact = ModelArtifact(artifact_id="test-id", name="test", source_url="https://example.com")
 
-    # Mock successful flow - now returns tuple of (tmp_path, files)
-    mock_download.return_value = ("/tmp/test.tar.gz", {"README.md": "content"})
+    mock_download.return_value = {"README.md": "content"}
     mock_llm.return_value = {"code_name": "test-code"}
 
     _find_connected_artifact_names(artifact)
@@ -450,8 +442,7 @@ def test_find_connected_artifact_names_skips_update_when_llm_fails(
     """Test that field update is skipped when LLM extraction fails."""
     artifact = ModelArtifact(artifact_id="test-id", name="test", source_url="https://example.com")
 
-    # Now returns tuple of (tmp_path, files)
-    mock_download.return_value = ("/tmp/test.tar.gz", {"README.md": "content"})
+    mock_download.return_value = {"README.md": "content"}
     mock_llm.return_value = None  # LLM failed
 
     _find_connected_artifact_names(artifact)
@@ -487,8 +478,7 @@ def test_find_connected_artifact_names_handles_llm_error(mock_download, mock_llm
     """Test that LLM errors are caught and logged."""
     artifact = ModelArtifact(artifact_id="test-id", name="test", source_url="https://example.com")
 
-    # Now returns tuple of (tmp_path, files)
-    mock_download.return_value = ("/tmp/test.tar.gz", {"README.md": "content"})
+    mock_download.return_value = {"README.md": "content"}
     mock_llm.side_effect = Exception("LLM error")
 
     # Should not raise, but log error
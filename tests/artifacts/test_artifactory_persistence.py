@@ -11,9 +11,12 @@ from typing import List
 
 from src.artifacts.artifactory.persistence import (
     save_artifact_metadata,
+    save_artifact_metadata_bulk,
     load_artifact_metadata,
+    load_artifacts_metadata,
     load_all_artifacts,
     load_all_artifacts_by_fields,
+    load_artifacts_by_names,
     _filter_by_type,
     _filter_by_fields,
     _matches_all_fields,
@@ -353,6 +356,29 @@ def test_save_artifact_metadata_includes_all_fields(mock_save):
     assert artifact_dict["license"] == "Apache-2.0"
 
 
+@patch("src.artifacts.artifactory.persistence.batch_save_items")
+def test_save_artifact_metadata_bulk_issues_one_batch(mock_batch_save):
+    """Test bulk save hands every artifact dict to a single batched write."""
+    from src.settings import REJECTED_ARTIFACTS_TABLE
+
+    models = [ModelArtifact(name=f"model-{i}", source_url="https://example.com") for i in range(3)]
+
+    save_artifact_metadata_bulk(models, rejected=True)
+
+    mock_batch_save.assert_called_once()
+    table_name, items = mock_batch_save.call_args[0]
+    assert table_name == REJECTED_ARTIFACTS_TABLE
+    assert [item["name"] for item in items] == ["model-0", "model-1", "model-2"]
+
+
+@patch("src.artifacts.artifactory.persistence.batch_save_items")
+def test_save_artifact_metadata_bulk_skips_empty_list(mock_batch_save):
+    """Test bulk save with nothing to write does not touch DynamoDB."""
+    save_artifact_metadata_bulk([])
+
+    mock_batch_save.assert_not_called()
+
+
 # =============================================================================
 # Test: load_artifact_metadata() - DynamoDB load
 # =============================================================================
@@ -404,6 +430,36 @@ def test_load_artifact_metadata_raises_on_missing_type(mock_load):
         load_artifact_metadata("test-id")
 
 
+@patch("src.artifacts.artifactory.persistence.batch_get_items")
+def test_load_artifacts_metadata_keeps_requested_order(mock_batch_get):
+    """Test batched loads rebuild artifacts in id order and skip missing ids."""
+    from src.settings import REJECTED_ARTIFACTS_TABLE
+
+    mock_batch_get.return_value = [
+        {
+            "artifact_id": "b",
+            "artifact_type": "code",
+            "name": "code-b",
+            "source_url": "https://github.com/test/b",
+            "s3_key": "code/b",
+        },
+        {
+            "artifact_id": "a",
+            "artifact_type": "model",
+            "name": "model-a",
+            "source_url": "https://example.com/a",
+            "s3_key": "models/a",
+        },
+    ]
+
+    result = load_artifacts_metadata(["a", "missing", "b"], rejected=True)
+
+    assert [a.artifact_id for a in result] == ["a", "b"]
+    assert isinstance(result[0], ModelArtifact)
+    assert isinstance(result[1], CodeArtifact)
+    assert mock_batch_get.call_args[0][:2] == (REJECTED_ARTIFACTS_TABLE, "artifact_id")
+
+
 # =============================================================================
 # Test: load_all_artifacts() - Table scan
 # =============================================================================
@@ -478,6 +534,32 @@ def test_load_all_artifacts_skips_invalid_items(mock_scan):
     assert all(hasattr(a, "artifact_type") for a in artifacts)
 
 
+@patch("src.artifacts.artifactory.persistence.scan_table")
+def test_load_all_artifacts_with_fields_projects_index_attributes(mock_scan):
+    """Test a partial load only reads index fields plus the requested ones."""
+    from src.artifacts.artifactory.persistence import ARTIFACT_INDEX_FIELDS
+
+    mock_scan.return_value = [
+        {
+            "artifact_id": "model-1",
+            "artifact_type": "model",
+            "name": "child",
+            "source_url": "https://example.com",
+            "s3_key": "models/model-1",
+            "parent_model_name": "base",
+        }
+    ]
+
+    with patch("src.artifacts.artifactory.factory._initialize_new_artifact") as mock_init:
+        result = load_all_artifacts(fields=("parent_model_name",))
+
+    attributes = mock_scan.call_args.kwargs["attributes"]
+    assert set(attributes) == {*ARTIFACT_INDEX_FIELDS, "parent_model_name"}
+    assert isinstance(result[0], ModelArtifact)
+    assert result[0].parent_model_name == "base"
+    mock_init.assert_not_called()
+
+
 @patch("src.artifacts.artifactory.persistence.scan_table")
 def test_load_all_artifacts_returns_empty_for_empty_table(mock_scan):
     """Test loading from empty table returns empty list."""
@@ -524,6 +606,13 @@ def test_load_all_artifacts_by_fields_uses_provided_list():
         assert result[0].name == "test-1"
 
 
+@patch("src.artifacts.artifactory.persistence.load_all_artifacts")
+def test_load_all_artifacts_by_fields_searches_empty_list_without_scanning(mock_load_all):
+    """Test an empty pre-loaded list is searched as-is instead of scanning the table."""
+    assert load_all_artifacts_by_fields(fields={"code_name": "my-code"}, artifact_list=[]) == []
+    mock_load_all.assert_not_called()
+
+
 def test_load_all_artifacts_by_fields_filters_by_type():
     """Test filtering by artifact_type."""
     artifacts = [
@@ -569,3 +658,44 @@ def test_load_all_artifacts_by_fields_combines_type_and_field_filters():
     assert len(result) == 1
     assert result[0].name == "model-1"
     assert isinstance(result[0], ModelArtifact)
+
+
+# =============================================================================
+# Test: load_artifacts_by_names() - Single-pass name resolution
+# =============================================================================
+
+
+def test_load_artifacts_by_names_resolves_each_type_case_insensitively():
+    """Test each (type, name) pair resolves to the first artifact of that type."""
+    code = CodeArtifact(name="My-Code", source_url="https://github.com/test")
+    dataset = DatasetArtifact(name="wikitext", source_url="https://example.com")
+    same_name_model = ModelArtifact(name="my-code", source_url="https://example.com")
+    parent = ModelArtifact(name="bert-base", source_url="https://example.com")
+    duplicate_parent = ModelArtifact(name="BERT-BASE", source_url="https://example.com")
+
+    result = load_artifacts_by_names(
+        {"code": "my-code", "dataset": "WikiText", "model": "bert-base"},
+        artifact_list=[same_name_model, code, dataset, parent, duplicate_parent],
+    )
+
+    assert result == {
+        ("code", "my-code"): code,
+        ("dataset", "WikiText"): dataset,
+        ("model", "bert-base"): parent,
+    }
+
+
+def test_load_artifacts_by_names_omits_missing_and_empty_names():
+    """Test names without a match (or without a value) are left out."""
+    code = CodeArtifact(name="my-code", source_url="https://github.com/test")
+
+    result = load_artifacts_by_names({"code": "other-code", "dataset": None}, artifact_list=[code])
+
+    assert result == {}
+
+
+@patch("src.artifacts.artifactory.persistence.load_all_artifacts")
+def test_load_artifacts_by_names_searches_empty_list_without_scanning(mock_load_all):
+    """Test an empty pre-loaded list is searched as-is instead of rescanning the table."""
+    assert load_artifacts_by_names({"code": "my-code"}, artifact_list=[]) == {}
+    mock_load_all.assert_not_called()
@@ -11,7 +11,7 @@ def reset_caches():
     clients._dynamodb_resource = None
     clients._s3_client = None
     clients._cognito_client = None
-    clients._bedrock_runtime = None
+    clients._bedrock_runtimes.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -28,7 +28,9 @@ def reset_before_each_test(monkeypatch):
 
 def test_get_dynamodb_initializes_once(monkeypatch):
     mock_resource = MagicMock()
-    monkeypatch.setattr(clients.boto3, "resource", lambda svc, region_name=None: mock_resource)
+    monkeypatch.setattr(
+        clients.boto3, "resource", lambda svc, region_name=None, config=None: mock_resource
+    )
 
     r1 = clients.get_dynamodb()
     r2 = clients.get_dynamodb()
@@ -65,7 +67,12 @@ def test_get_ddb_table_returns_table(monkeypatch):
 
 def test_get_s3_initializes_once(monkeypatch):
     mock_s3 = MagicMock()
-    monkeypatch.setattr(clients.boto3, "client", lambda svc, region_name=None: mock_s3)
+    calls = []
+    monkeypatch.setattr(
+        clients.boto3,
+        "client",
+        lambda svc, region_name=None, config=None: calls.append(config) or mock_s3,
+    )
 
     s1 = clients.get_s3()
     s2 = clients.get_s3()
@@ -73,6 +80,7 @@ def test_get_s3_initializes_once(monkeypatch):
     assert s1 is mock_s3
     assert s2 is mock_s3
     assert clients._s3_client is mock_s3
+    assert calls == [clients.S3_CLIENT_CONFIG]
 
 
 def test_get_s3_runtime_error(monkeypatch):
@@ -92,7 +100,7 @@ def test_get_cognito_initializes_once(monkeypatch):
     monkeypatch.setattr(
         clients.boto3,
         "client",
-        lambda svc, region_name=None: mock_cognito,
+        lambda svc, region_name=None, config=None: mock_cognito,
     )
 
     c1 = clients.get_cognito()
@@ -103,6 +111,19 @@ def test_get_cognito_initializes_once(monkeypatch):
     assert clients._cognito_client is mock_cognito
 
 
+def test_client_configs_enable_keepalive_and_adaptive_retries():
+    for config in (
+        clients.DEFAULT_CLIENT_CONFIG,
+        clients.S3_CLIENT_CONFIG,
+        clients.BEDROCK_CLIENT_CONFIG,
+    ):
+        assert config.tcp_keepalive is True
+        # botocore rewrites max_attempts in place once a client is built, so only check mode
+        assert config.retries["mode"] == "adaptive"
+    assert clients.S3_CLIENT_CONFIG.max_pool_connections == 64
+    assert clients.BEDROCK_CLIENT_CONFIG.max_pool_connections == 32
+
+
 def test_get_cognito_runtime_error(monkeypatch):
     monkeypatch.setattr(clients, "boto3", None)
 
@@ -120,7 +141,7 @@ def test_get_bedrock_runtime_initializes_once(monkeypatch):
     monkeypatch.setattr(
         clients.boto3,
         "client",
-        lambda svc, region_name=None: mock_bedrock,
+        lambda svc, region_name=None, config=None: mock_bedrock,
     )
 
     b1 = clients.get_bedrock_runtime("us-west-2")
@@ -128,7 +149,25 @@ def test_get_bedrock_runtime_initializes_once(monkeypatch):
 
     assert b1 is mock_bedrock
     assert b2 is mock_bedrock
-    assert clients._bedrock_runtime is mock_bedrock
+    assert clients._bedrock_runtimes == {"us-west-2": mock_bedrock}
+
+
+def test_get_bedrock_runtime_caches_per_region(monkeypatch):
+    created = []
+
+    def fake_client(name, region_name=None, config=None):
+        created.append(region_name)
+        return MagicMock(name=region_name)
+
+    monkeypatch.setattr(clients.boto3, "client", fake_client)
+
+    east = clients.get_bedrock_runtime("us-east-1")
+    west = clients.get_bedrock_runtime("us-west-2")
+
+    assert east is not west
+    assert clients.get_bedrock_runtime("us-east-1") is east
+    assert clients.get_bedrock_runtime() is east  # defaults to AWS_REGION
+    assert created == ["us-east-1", "us-west-2"]
 
 
 def test_get_bedrock_runtime_default_region(monkeypatch):
@@ -137,8 +176,9 @@ def test_get_bedrock_runtime_default_region(monkeypatch):
     """
     mock_bedrock = MagicMock()
 
-    def fake_client(name, region_name=None):
+    def fake_client(name, region_name=None, config=None):
         assert region_name == "us-east-1"
+        assert config is clients.BEDROCK_CLIENT_CONFIG
         return mock_bedrock
 
     monkeypatch.setattr(clients.boto3, "client", fake_client)
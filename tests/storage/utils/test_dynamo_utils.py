@@ -1,6 +1,8 @@
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 import src.storage.dynamo_utils as dynamo_utils
 
 
@@ -15,6 +17,23 @@ def test_scan_table_returns_items():
     assert items == [{"id": 1}, {"id": 2}]
 
 
+def test_scan_table_projects_requested_attributes():
+    mock_table = MagicMock()
+    mock_table.scan.side_effect = [
+        {"Items": [{"name": "A"}], "LastEvaluatedKey": "k"},
+        {"Items": [{"name": "B"}]},
+    ]
+    with patch("src.storage.dynamo_utils.get_ddb_table", return_value=mock_table):
+        items = dynamo_utils.scan_table("table", attributes=["artifact_id", "name"])
+
+    assert items == [{"name": "A"}, {"name": "B"}]
+    first_call, second_call = mock_table.scan.call_args_list
+    assert first_call.kwargs["ProjectionExpression"] == "#a0, #a1"
+    assert first_call.kwargs["ExpressionAttributeNames"] == {"#a0": "artifact_id", "#a1": "name"}
+    assert second_call.kwargs["ExclusiveStartKey"] == "k"
+    assert second_call.kwargs["ProjectionExpression"] == "#a0, #a1"
+
+
 def test_search_table_by_fields_matches():
     items = [
         {"name": "A", "type": "model"},
@@ -33,13 +52,21 @@ def test_batch_delete_deletes_items():
     assert mock_table.batch_writer.return_value.__enter__.return_value.delete_item.call_count == 2
 
 
-def test_clear_table_calls_batch_delete():
-    with patch("src.storage.dynamo_utils.scan_table", return_value=[{"artifact_id": "1"}]), patch(
-        "src.storage.dynamo_utils.batch_delete", return_value=1
-    ) as mock_delete:
+def test_clear_table_streams_projected_keys_into_batch_delete():
+    mock_table = MagicMock()
+    mock_table.scan.side_effect = [
+        {"Items": [{"artifact_id": "1"}], "LastEvaluatedKey": {"artifact_id": "1"}},
+        {"Items": [{"artifact_id": "2"}]},
+    ]
+    with patch("src.storage.dynamo_utils.get_ddb_table", return_value=mock_table):
         count = dynamo_utils.clear_table("table", "artifact_id")
-    assert count == 1
-    mock_delete.assert_called_once()
+
+    assert count == 2
+    first_call, second_call = mock_table.scan.call_args_list
+    assert first_call.kwargs["ProjectionExpression"] == "#k"
+    assert first_call.kwargs["ExpressionAttributeNames"] == {"#k": "artifact_id"}
+    assert second_call.kwargs["ExclusiveStartKey"] == {"artifact_id": "1"}
+    assert mock_table.batch_writer.return_value.__enter__.return_value.delete_item.call_count == 2
 
 
 # =============================================================================
@@ -138,6 +165,69 @@ def test_save_item_converts_floats():
     assert saved_item["name"] == "test"
 
 
+def test_batch_save_items_puts_converted_items():
+    """Test that batch_save_items writes every item through the batch writer."""
+    mock_table = MagicMock()
+    items = [{"artifact_id": "1", "score": 0.5}, {"artifact_id": "2", "score": 0.25}]
+
+    with patch("src.storage.dynamo_utils.get_ddb_table", return_value=mock_table):
+        count = dynamo_utils.batch_save_items("table", items)
+
+    assert count == 2
+    batch = mock_table.batch_writer.return_value.__enter__.return_value
+    assert batch.put_item.call_count == 2
+    assert batch.put_item.call_args_list[0].kwargs["Item"]["score"] == Decimal("0.5")
+    mock_table.put_item.assert_not_called()
+
+
+def test_batch_get_items_chunks_and_retries_unprocessed_keys():
+    """Test batch_get_items splits keys into 100-key requests and retries leftovers."""
+    mock_dynamo = MagicMock()
+    keys = [str(i) for i in range(150)]
+    mock_dynamo.batch_get_item.side_effect = [
+        {
+            "Responses": {"table": [{"artifact_id": "0"}]},
+            "UnprocessedKeys": {"table": {"Keys": [{"artifact_id": "1"}]}},
+        },
+        {"Responses": {"table": [{"artifact_id": "1"}]}},
+        {"Responses": {"table": [{"artifact_id": "149"}]}},
+    ]
+
+    with (
+        patch("src.storage.dynamo_utils.get_dynamodb", return_value=mock_dynamo),
+        patch("src.storage.dynamo_utils.time.sleep") as mock_sleep,
+    ):
+        items = dynamo_utils.batch_get_items("table", "artifact_id", keys + ["0"])
+
+    assert items == [{"artifact_id": "0"}, {"artifact_id": "1"}, {"artifact_id": "149"}]
+    requests = [
+        c.kwargs["RequestItems"]["table"]["Keys"] for c in mock_dynamo.batch_get_item.call_args_list
+    ]
+    assert [len(r) for r in requests] == [100, 1, 50]
+    mock_sleep.assert_called_once_with(dynamo_utils.BATCH_GET_BASE_DELAY_SECONDS)
+
+
+def test_batch_get_items_raises_when_keys_stay_unprocessed():
+    """Test batch_get_items backs off exponentially and gives up after the retry limit."""
+    mock_dynamo = MagicMock()
+    mock_dynamo.batch_get_item.return_value = {
+        "Responses": {"table": []},
+        "UnprocessedKeys": {"table": {"Keys": [{"artifact_id": "1"}]}},
+    }
+
+    with (
+        patch("src.storage.dynamo_utils.get_dynamodb", return_value=mock_dynamo),
+        patch("src.storage.dynamo_utils.time.sleep") as mock_sleep,
+    ):
+        with pytest.raises(RuntimeError):
+            dynamo_utils.batch_get_items("table", "artifact_id", ["1"])
+
+    retries = dynamo_utils.BATCH_GET_MAX_RETRIES
+    assert mock_dynamo.batch_get_item.call_count == retries + 1
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert delays == [dynamo_utils.BATCH_GET_BASE_DELAY_SECONDS * 2**i for i in range(retries)]
+
+
 # =============================================================================
 # Load Item Tests
 # =============================================================================
@@ -272,3 +362,10 @@ def test_batch_delete_empty_list():
         count = dynamo_utils.batch_delete("table", [], "artifact_id")
 
     assert count == 0
+
+
+def test_search_table_by_fields_empty_criteria_matches_all():
+    """Test that an empty fields dict matches every row."""
+    items = [{"name": "A"}, {"name": "B"}]
+    result = dynamo_utils.search_table_by_fields("table", {}, item_list=items)
+    assert result == items
@@ -1,6 +1,10 @@
+import io
+import os
 import tarfile
 from pathlib import Path
 
+import pytest
+
 import src.storage.file_extraction as fx
 
 
@@ -82,6 +86,26 @@ def test_extract_files_from_tar_invalid_tar(monkeypatch):
     assert result == {}  # graceful fail
 
 
+class ForwardOnlyStream:
+    """Minimal non-seekable reader, like an S3 StreamingBody."""
+
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+
+    def read(self, size=None):
+        return self._buf.read(-1 if size is None else size)
+
+
+def test_extract_files_from_tar_streams_fileobj(tmp_path):
+    tar_path = create_tar(tmp_path, {"a.py": "print('hello')", "b.txt": "x" * 500})
+
+    result = fx.extract_files_from_tar(
+        fileobj=ForwardOnlyStream(Path(tar_path).read_bytes()), max_chars=100
+    )
+
+    assert result == {"a.py": "print('hello')", "b.txt": "x" * 100}
+
+
 # ============================================================
 # select_relevant_files()
 # ============================================================
@@ -202,3 +226,106 @@ def test_extract_relevant_files_integration(tmp_path):
 
     assert keys[0].lower().startswith("readme")
     assert len(result) == 2  # max_files enforced
+
+
+def test_extract_relevant_files_cached_by_content(tmp_path, monkeypatch):
+    """
+    A second call on an identical archive (different path) is served from cache.
+    """
+    fx.clear_extraction_cache()
+    files = {"a.py": "print('a')", "README.md": "readme content"}
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    first = create_tar(first_dir, files)
+    second = create_tar(second_dir, files)
+    # gzip headers embed mtimes; copy bytes so the archives are identical
+    Path(second).write_bytes(Path(first).read_bytes())
+
+    result = fx.extract_relevant_files(first, include_ext=[".py"])
+
+    calls = []
+    monkeypatch.setattr(fx, "extract_files_from_tar", lambda *a, **k: calls.append(a) or {})
+
+    cached = fx.extract_relevant_files(second, include_ext=[".py"])
+
+    assert cached == result
+    assert calls == []
+
+    # Extension order does not matter
+    assert fx.extract_relevant_files(second, include_ext={".py"}) == result
+    assert calls == []
+
+    # Different selection arguments miss the cache
+    fx.extract_relevant_files(second, include_ext=[".txt"])
+    assert len(calls) == 1
+    fx.clear_extraction_cache()
+
+
+def test_extract_relevant_files_fingerprint_covers_archive_tail(tmp_path, monkeypatch):
+    """
+    Archives that share a head but differ at the end are cached separately.
+    """
+    fx.clear_extraction_cache()
+    monkeypatch.setattr(fx, "_FINGERPRINT_EDGE_BYTES", 16)
+    first = tmp_path / "first.tar.gz"
+    second = tmp_path / "second.tar.gz"
+    first.write_bytes(b"h" * 64 + b"tail-one")
+    second.write_bytes(b"h" * 64 + b"tail-two")
+
+    assert fx._fingerprint_tar(str(first)) != fx._fingerprint_tar(str(second))
+
+    # A stream and a file with the same bytes share a fingerprint
+    reader = fx._FingerprintingReader(ForwardOnlyStream(first.read_bytes()))
+    reader.read(10)
+    assert reader.fingerprint() == fx._fingerprint_tar(str(first))
+
+
+def test_extract_relevant_files_stream_seeds_cache_for_path_callers(tmp_path, monkeypatch):
+    """
+    A streamed archive is extracted in one pass and its result is reused by a
+    later path-based call on the same bytes.
+    """
+    fx.clear_extraction_cache()
+    tar_path = create_tar(tmp_path, {"a.py": "print('a')", "README.md": "readme content"})
+
+    streamed = fx.extract_relevant_files(
+        fileobj=ForwardOnlyStream(Path(tar_path).read_bytes()), include_ext=[".py"]
+    )
+    assert set(streamed) == {"README.md", "a.py"}
+
+    calls = []
+    monkeypatch.setattr(fx, "extract_files_from_tar", lambda *a, **k: calls.append(a) or {})
+
+    assert fx.extract_relevant_files(tar_path, include_ext=[".py"]) == streamed
+    assert calls == []
+    fx.clear_extraction_cache()
+
+
+def test_extract_relevant_files_truncated_stream_raises_and_is_not_cached(tmp_path, monkeypatch):
+    """
+    A stream that breaks part-way raises instead of returning the members read so far.
+    """
+    fx.clear_extraction_cache()
+    files = {f"file{i}.txt": os.urandom(2000).hex() for i in range(5)}
+    tar_path = create_tar(tmp_path, files)
+    data = Path(tar_path).read_bytes()
+
+    with pytest.raises((tarfile.TarError, EOFError)):
+        fx.extract_relevant_files(
+            fileobj=ForwardOnlyStream(data[: len(data) // 2]), include_ext=[".txt"]
+        )
+
+    calls = []
+    monkeypatch.setattr(fx, "extract_files_from_tar", lambda *a, **k: calls.append(a) or {})
+    fx.extract_relevant_files(tar_path, include_ext=[".txt"])
+    assert len(calls) == 1
+    fx.clear_extraction_cache()
+
+
+def test_extract_relevant_files_requires_exactly_one_source(tmp_path):
+    with pytest.raises(ValueError):
+        fx.extract_relevant_files(include_ext=[".py"])
+    with pytest.raises(ValueError):
+        fx.extract_relevant_files("a.tar.gz", [".py"], fileobj=ForwardOnlyStream(b""))
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import MagicMock
 
 import pytest
@@ -13,6 +14,7 @@ def set_env(monkeypatch):
     monkeypatch.setenv("ARTIFACTS_BUCKET", "test-bucket")
     # s3_utils imported ARTIFACTS_BUCKET at import time:
     s3_utils.ARTIFACTS_BUCKET = "test-bucket"
+    s3_utils._cached_presigned_url.cache_clear()
 
 
 @pytest.fixture
@@ -54,9 +56,20 @@ def test_upload_file_success(mock_s3, tmp_path):
         str(local_file),
         "test-bucket",
         "path/key.txt",
+        Config=s3_utils.TRANSFER_CONFIG,
     )
 
 
+def test_upload_file_large_uses_large_parts(mock_s3, tmp_path, monkeypatch):
+    local_file = tmp_path / "weights.bin"
+    local_file.write_text("x")
+    monkeypatch.setattr(s3_utils.os.path, "getsize", lambda _: s3_utils.LARGE_UPLOAD_THRESHOLD)
+
+    s3_utils.upload_file("path/weights.bin", str(local_file))
+
+    assert mock_s3.upload_file.call_args.kwargs["Config"] is s3_utils.LARGE_TRANSFER_CONFIG
+
+
 def test_upload_file_client_error(mock_s3, tmp_path):
     from botocore.exceptions import ClientError
 
@@ -81,6 +94,7 @@ def test_download_file_success(mock_s3, tmp_path):
         "test-bucket",
         "path/key.bin",
         str(local_path),
+        Config=s3_utils.TRANSFER_CONFIG,
     )
 
 
@@ -120,6 +134,16 @@ def test_upload_artifact_to_s3_success(mock_s3, mock_download_artifact):
     mock_s3.upload_file.assert_called_once()
 
 
+def test_upload_artifact_to_s3_removes_temp_file(mock_s3, mock_download_artifact):
+    s3_utils.upload_artifact_to_s3("A1", "model", "models/A1.tar.gz", "http://example.com")
+
+    # Removed before the call returns
+    assert not os.path.exists(mock_download_artifact)
+
+    # Already gone: no error
+    s3_utils._remove_temp_file(mock_download_artifact)
+
+
 def test_upload_artifact_to_s3_missing_bucket(monkeypatch):
     monkeypatch.setattr(s3_utils, "ARTIFACTS_BUCKET", "")
 
@@ -155,6 +179,24 @@ def test_download_artifact_from_s3_missing_bucket(monkeypatch):
         s3_utils.download_artifact_from_s3("A1", "models/A1.tar.gz", "/tmp/x")
 
 
+# ---------------------------------------------------------------------
+# stream_artifact_from_s3()
+# ---------------------------------------------------------------------
+def test_stream_artifact_from_s3_returns_body(mock_s3):
+    body = MagicMock()
+    mock_s3.get_object.return_value = {"Body": body}
+
+    assert s3_utils.stream_artifact_from_s3("A1", "models/A1.tar.gz") is body
+    mock_s3.get_object.assert_called_once_with(Bucket="test-bucket", Key="models/A1.tar.gz")
+    mock_s3.download_file.assert_not_called()
+
+
+def test_stream_artifact_from_s3_missing_bucket(monkeypatch):
+    monkeypatch.setattr(s3_utils, "ARTIFACTS_BUCKET", "")
+    with pytest.raises(ValueError):
+        s3_utils.stream_artifact_from_s3("A1", "models/A1.tar.gz")
+
+
 # ---------------------------------------------------------------------
 # generate_s3_download_url()
 # ---------------------------------------------------------------------
@@ -166,6 +208,20 @@ def test_generate_s3_download_url(mock_s3):
     assert result == "https://signed-url"
 
 
+def test_generate_s3_download_url_reuses_url_within_window(mock_s3, monkeypatch):
+    mock_s3.generate_presigned_url.side_effect = ["https://first", "https://second"]
+    clock = iter([1000, 1200, 1800])
+    monkeypatch.setattr(s3_utils.time, "time", lambda: next(clock))
+
+    first = s3_utils.generate_s3_download_url("A1", "models/A1.tar.gz", expiration=1000)
+    again = s3_utils.generate_s3_download_url("A1", "models/A1.tar.gz", expiration=1000)
+    later = s3_utils.generate_s3_download_url("A1", "models/A1.tar.gz", expiration=1000)
+
+    assert first == again == "https://first"
+    assert later == "https://second"
+    assert mock_s3.generate_presigned_url.call_count == 2
+
+
 # ---------------------------------------------------------------------
 # clear_bucket()
 # ---------------------------------------------------------------------
@@ -174,16 +230,35 @@ def test_clear_bucket(mock_s3):
     mock_s3.get_paginator.return_value = paginator
 
     paginator.paginate.return_value = [
-        {"Contents": [{"Key": "a"}, {"Key": "b"}]},
-        {"Contents": [{"Key": "c"}]},
+        {"KeyCount": 2, "Contents": [{"Key": "a"}, {"Key": "b"}]},
+        {"KeyCount": 1, "Contents": [{"Key": "c"}]},
     ]
 
     deleted = s3_utils.clear_bucket("test-bucket")
     assert deleted == 3
+    paginator.paginate.assert_called_once_with(
+        Bucket="test-bucket", PaginationConfig={"PageSize": 1000}
+    )
 
     assert mock_s3.delete_objects.call_count == 2
 
 
+def test_clear_bucket_skips_empty_pages(mock_s3):
+    paginator = MagicMock()
+    mock_s3.get_paginator.return_value = paginator
+
+    paginator.paginate.return_value = [
+        {"KeyCount": 0},
+        {"KeyCount": 1, "Contents": [{"Key": "a"}]},
+        {"KeyCount": 0},
+    ]
+
+    deleted = s3_utils.clear_bucket("test-bucket")
+    assert deleted == 1
+
+    mock_s3.delete_objects.assert_called_once()
+
+
 # ---------------------------------------------------------------------
 # delete_prefix()
 # ---------------------------------------------------------------------
@@ -192,12 +267,16 @@ def test_delete_prefix(mock_s3):
     mock_s3.get_paginator.return_value = paginator
 
     paginator.paginate.return_value = [
-        {"Contents": [{"Key": "x/y/1"}, {"Key": "x/y/2"}]},
+        {"KeyCount": 2, "Contents": [{"Key": "x/y/1"}, {"Key": "x/y/2"}]},
     ]
 
     deleted = s3_utils.delete_prefix("test-bucket", "x/y/")
     assert deleted == 2
 
+    paginator.paginate.assert_called_once_with(
+        Bucket="test-bucket", Prefix="x/y/", PaginationConfig={"PageSize": 1000}
+    )
+
     mock_s3.delete_objects.assert_called_once()
 
 
@@ -215,3 +294,16 @@ def test_delete_objects_empty(mock_s3):
     deleted = s3_utils.delete_objects("test-bucket", [])
     assert deleted == 0
     mock_s3.delete_objects.assert_not_called()
+
+
+def test_delete_objects_chunks_to_api_limit(mock_s3):
+    keys = (f"k{i}" for i in range(2500))
+
+    deleted = s3_utils.delete_objects("test-bucket", keys)
+    assert deleted == 2500
+
+    batch_sizes = sorted(
+        len(call.kwargs["Delete"]["Objects"]) for call in mock_s3.delete_objects.call_args_list
+    )
+    assert batch_sizes == [500, 1000, 1000]
+    assert all(call.kwargs["Delete"]["Quiet"] for call in mock_s3.delete_objects.call_args_list)
@@ -72,7 +72,17 @@ def mock_tables(mocker):
         tokens_table = dynamodb.create_table(
             TableName=os.environ["TOKENS_TABLE"],
             KeySchema=[{"AttributeName": "token", "KeyType": "HASH"}],
-            AttributeDefinitions=[{"AttributeName": "token", "AttributeType": "S"}],
+            AttributeDefinitions=[
+                {"AttributeName": "token", "AttributeType": "S"},
+                {"AttributeName": "username", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "username-index",
+                    "KeySchema": [{"AttributeName": "username", "KeyType": "HASH"}],
+                    "Projection": {"ProjectionType": "KEYS_ONLY"},
+                }
+            ],
             BillingMode="PAY_PER_REQUEST",
         )
 
@@ -250,6 +260,24 @@ def test_invalidate_user_tokens_none(mock_tables):
     assert count == 0
 
 
+def test_invalidate_user_tokens_follows_pagination():
+    """Test that every query page is deleted through a single batch writer."""
+    table = MagicMock()
+    table.query.side_effect = [
+        {"Items": [{"token": "t1"}], "LastEvaluatedKey": {"token": "t1"}},
+        {"Items": [{"token": "t2"}]},
+    ]
+
+    with patch("src.users.user_service.get_ddb_table", return_value=table):
+        count = _invalidate_user_tokens("alice")
+
+    assert count == 2
+    assert table.query.call_args_list[1].kwargs["ExclusiveStartKey"] == {"token": "t1"}
+    assert table.query.call_args_list[0].kwargs["ProjectionExpression"] == "#t"
+    writer = table.batch_writer.return_value.__enter__.return_value
+    assert writer.delete_item.call_count == 2
+
+
 # =============================================================================
 # Test: get_user_info
 # =============================================================================
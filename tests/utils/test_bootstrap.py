@@ -42,10 +42,10 @@ def mock_secrets(monkeypatch):
 @pytest.fixture
 def mock_cognito(monkeypatch):
     """
-    Patch boto3.client("cognito-idp") to return a MagicMock client.
+    Patch get_cognito() to return a MagicMock client.
     """
     client = MagicMock()
-    monkeypatch.setattr(bootstrap.boto3, "client", lambda svc: client)
+    monkeypatch.setattr(bootstrap, "get_cognito", lambda: client)
     return client
 
 
@@ -32,6 +32,29 @@ def test_json_response_merges_custom_headers():
     assert resp["headers"]["Content-Type"] == "application/json"
 
 
+def test_json_response_does_not_leak_custom_headers_into_defaults():
+    http.json_response(200, {}, headers={"X-Test": "123"})
+    resp = http.json_response(200, {})
+
+    assert "X-Test" not in http.DEFAULT_HEADERS
+    assert resp["headers"] == http.DEFAULT_HEADERS
+
+
+def test_json_response_body_round_trips_nested_payload():
+    body = {"scores": {"net": 0.5, "size": {"aws": 1.0}}, 1: ["a", None, True], "u": "é"}
+    resp = http.json_response(200, body)
+
+    assert json.loads(resp["body"]) == json.loads(json.dumps(body))
+    assert isinstance(resp["body"], str)
+
+
+def test_json_response_falls_back_to_stdlib_when_orjson_missing(monkeypatch):
+    monkeypatch.setattr(http, "orjson", None)
+    resp = http.json_response(200, {"a": [1, 2]})
+
+    assert resp["body"] == json.dumps({"a": [1, 2]})
+
+
 def test_json_response_accepts_raw_string():
     resp = http.json_response(200, "raw text")
 
@@ -26,6 +26,7 @@ def mock_settings(monkeypatch):
     """
     monkeypatch.setattr(llm, "BEDROCK_MODEL_ID", "test-model")
     monkeypatch.setattr(llm, "BEDROCK_REGION", "us-east-1")
+    llm.clear_llm_response_cache()
 
 
 # =====================================================================
@@ -44,7 +45,7 @@ def test_ask_llm_returns_string(mock_bedrock):
     }
 
     mock_bedrock.invoke_model.return_value = {
-        "body": MagicMock(read=lambda: json.dumps(response_json).encode("utf-8"))
+        "body": MagicMock(read=lambda amt=None: json.dumps(response_json).encode("utf-8"))
     }
 
     result = llm.ask_llm("test prompt")
@@ -63,7 +64,7 @@ def test_ask_llm_returns_json_parsed(mock_bedrock):
     }
 
     mock_bedrock.invoke_model.return_value = {
-        "body": MagicMock(read=lambda: json.dumps(response_json).encode("utf-8"))
+        "body": MagicMock(read=lambda amt=None: json.dumps(response_json).encode("utf-8"))
     }
 
     result = llm.ask_llm("prompt", return_json=True)
@@ -79,7 +80,7 @@ def test_ask_llm_malformed_body(mock_bedrock):
     """
     ask_llm should handle json.JSONDecodeError on the outer response.
     """
-    mock_bedrock.invoke_model.return_value = {"body": MagicMock(read=lambda: b"{not json")}
+    mock_bedrock.invoke_model.return_value = {"body": MagicMock(read=lambda amt=None: b"{not json")}
 
     result = llm.ask_llm("prompt")
     assert result is None
@@ -90,7 +91,9 @@ def test_ask_llm_missing_keys(mock_bedrock):
     ask_llm should handle KeyError if the Bedrock response is missing expected fields.
     """
     mock_bedrock.invoke_model.return_value = {
-        "body": MagicMock(read=lambda: json.dumps({"stopReason": "end_turn"}).encode("utf-8"))
+        "body": MagicMock(
+            read=lambda amt=None: json.dumps({"stopReason": "end_turn"}).encode("utf-8")
+        )
     }
 
     result = llm.ask_llm("prompt")
@@ -139,6 +142,34 @@ def test_build_llm_prompt_without_sections():
 # =====================================================================
 
 
+def test_build_llm_prompt_section_layout():
+    prompt = llm.build_llm_prompt("Do it", sections={"A": "alpha", "B": "beta"})
+    assert prompt == "Do it\n\n\n=== A ===\nalpha\n\n=== B ===\nbeta\n"
+
+
+def test_assemble_sections_matches_formatted_sections():
+    items = [("FILE: a.py", "print(1)"), ("FILE: b.md", "")]
+    formatted = [llm._format_section(t, c) for t, c in items]
+
+    assert llm._assemble_sections("H\n\n", items) == llm._assemble_prompt("H\n\n", formatted)
+    assert all(
+        llm._SECTION_FRAME_CHARS == len(f) - len(t) - len(c) for f, (t, c) in zip(formatted, items)
+    )
+
+
+def test_build_llm_prompt_fitting_sections_skip_truncation(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("prompt within budget must not be truncated")
+
+    monkeypatch.setattr(llm, "_truncate_to_token_limit", fail)
+    sections = {f"FILE: {i}.py": "x = 1\n" * 50 for i in range(20)}
+
+    prompt = llm.build_llm_prompt("Score this", sections=sections)
+
+    assert llm._estimate_token_count(prompt) <= llm.MAX_INPUT_TOKENS
+    assert prompt.count("=== FILE:") == 20
+
+
 def test_build_file_analysis_prompt_basic():
     files = {"a.py": "print('a')", "README.md": "docs"}
 
@@ -174,6 +205,30 @@ def test_build_file_analysis_prompt_with_description():
 # =====================================================================
 
 
+def test_build_file_analysis_prompt_reuses_rendered_instructions():
+    llm._file_analysis_instructions.cache_clear()
+
+    llm.build_file_analysis_prompt("Code Quality", "code_quality", {"a.py": "x = 1"})
+    prompt = llm.build_file_analysis_prompt("Code Quality", "code_quality", {"b.py": "y = 2"})
+
+    assert llm._file_analysis_instructions.cache_info().hits == 1
+    assert "FILE: b.py" in prompt and "FILE: a.py" not in prompt
+
+
+def test_file_prompt_sections_put_readme_and_manifests_first():
+    files = {
+        "src/big.py": "x = 1\n" * 50,
+        "src/small.py": "y = 2",
+        "pyproject.toml": "[project]",
+        "docs/README.md": "# Demo",
+    }
+
+    prompt = llm.build_file_analysis_prompt("Code Quality", "code_quality", files)
+
+    order = [prompt.index(f"=== FILE: {name} ===") for name in files]
+    assert order[3] < order[2] < order[1] < order[0]
+
+
 def test_build_extract_fields_from_files_prompt_basic():
     """Should build prompt with fields and files."""
     fields = {"dataset_name": None, "license": None}
@@ -197,6 +252,22 @@ def test_build_extract_fields_from_files_prompt_with_values():
     assert "existing_value" in prompt
 
 
+def test_file_prompt_builders_are_memoized_by_content(monkeypatch):
+    calls = []
+    real_build = llm.build_llm_prompt
+    monkeypatch.setattr(llm, "build_llm_prompt", lambda **kw: calls.append(kw) or real_build(**kw))
+
+    first = llm.build_file_analysis_prompt("Code Quality", "code_quality", {"a.py": "x = 1"})
+    again = llm.build_file_analysis_prompt("Code Quality", "code_quality", {"a.py": "x = 1"})
+    changed = llm.build_file_analysis_prompt("Code Quality", "code_quality", {"a.py": "x = 2"})
+    llm.build_extract_fields_from_files_prompt({"license": None}, {"README.md": "MIT"})
+    llm.build_extract_fields_from_files_prompt({"license": None}, {"README.md": "MIT"})
+
+    assert again is first
+    assert "x = 2" in changed
+    assert len(calls) == 3
+
+
 # =====================================================================
 # extract_llm_score_field()
 # =====================================================================
@@ -243,6 +314,19 @@ def test_extract_llm_score_field_non_numeric_value():
     assert result is None
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [(" 0.75 ", 0.75), (".5", 0.5), ("-1e-2", -0.01), ("1.", 1.0)],
+)
+def test_extract_llm_score_field_numeric_string_forms(value, expected):
+    assert llm.extract_llm_score_field({"score": value}, "score") == expected
+
+
+@pytest.mark.parametrize("value", [None, [0.5], "0.5 out of 1", "nan", "", "1_0"])
+def test_extract_llm_score_field_rejects_non_numeric(value):
+    assert llm.extract_llm_score_field({"score": value}, "score") is None
+
+
 def test_extract_llm_score_field_from_json_string():
     """Should extract from JSON string response."""
     response = '{"score": 0.9}'
@@ -405,11 +489,21 @@ def test_truncate_to_token_limit_over_budget():
     """Text over limit should be truncated with ellipsis."""
     # Make a long text that exceeds the budget
     text = "x" * 100
-    result = llm._truncate_to_token_limit(text, max_tokens=10)
+    result = llm._truncate_to_token_limit(text, max_tokens=10, strategy="head")
     assert result.endswith("...")
     assert len(result) < len(text)
 
 
+def test_truncate_to_token_limit_keeps_head_and_tail_by_default():
+    text = "INSTRUCTIONS " + "filler " * 200 + "OUTPUT FORMAT"
+    result = llm._truncate_to_token_limit(text, max_tokens=20)
+
+    assert result.startswith("INSTRUCTIONS")
+    assert result.endswith("OUTPUT FORMAT")
+    assert "\n...\n" in result
+    assert len(result) < len(text)
+
+
 # =====================================================================
 # ask_llm() — additional edge cases
 # =====================================================================
@@ -417,11 +511,20 @@ def test_truncate_to_token_limit_over_budget():
 
 def test_ask_llm_empty_response_body(mock_bedrock):
     """ask_llm should handle empty response body."""
-    mock_bedrock.invoke_model.return_value = {"body": MagicMock(read=lambda: b"")}
+    mock_bedrock.invoke_model.return_value = {"body": MagicMock(read=lambda amt=None: b"")}
     result = llm.ask_llm("prompt")
     assert result is None
 
 
+def test_ask_llm_closes_response_body(mock_bedrock):
+    body = MagicMock()
+    body.read.return_value = b""
+    mock_bedrock.invoke_model.return_value = {"body": body}
+
+    assert llm.ask_llm("prompt") is None
+    body.close.assert_called_once()
+
+
 def test_ask_llm_return_json_invalid(mock_bedrock):
     """ask_llm(return_json=True) should return None for invalid JSON."""
     response_json = {
@@ -429,7 +532,7 @@ def test_ask_llm_return_json_invalid(mock_bedrock):
         "stopReason": "end_turn",
     }
     mock_bedrock.invoke_model.return_value = {
-        "body": MagicMock(read=lambda: json.dumps(response_json).encode("utf-8"))
+        "body": MagicMock(read=lambda amt=None: json.dumps(response_json).encode("utf-8"))
     }
     result = llm.ask_llm("prompt", return_json=True)
     assert result is None
@@ -447,7 +550,7 @@ def test_ask_llm_json_with_markdown(mock_bedrock):
         "stopReason": "end_turn",
     }
     mock_bedrock.invoke_model.return_value = {
-        "body": MagicMock(read=lambda: json.dumps(response_json).encode("utf-8"))
+        "body": MagicMock(read=lambda amt=None: json.dumps(response_json).encode("utf-8"))
     }
     result = llm.ask_llm("prompt", return_json=True)
     assert result == {"score": 0.7}
@@ -460,7 +563,7 @@ def test_ask_llm_short_response(mock_bedrock):
         "stopReason": "end_turn",
     }
     mock_bedrock.invoke_model.return_value = {
-        "body": MagicMock(read=lambda: json.dumps(response_json).encode("utf-8"))
+        "body": MagicMock(read=lambda amt=None: json.dumps(response_json).encode("utf-8"))
     }
     # Short response should still be returned
     result = llm.ask_llm("prompt")
@@ -526,6 +629,14 @@ def test_build_llm_prompt_multiple_large_sections():
 # =====================================================================
 
 
+def test_allocate_section_budgets_is_proportional_and_within_budget():
+    budgets = llm._allocate_section_budgets([3000, 1000, 5], remaining=400, min_floor=10)
+
+    assert budgets == [293, 97, 10]
+    assert sum(budgets) <= 400
+    assert all(isinstance(b, int) for b in budgets)
+
+
 def test_trim_section_under_budget():
     """Section under budget should not be trimmed."""
     text = "short text"
@@ -572,6 +683,22 @@ def test_trim_section_important_exceeds_budget():
     assert len(result) < len(text)
 
 
+@pytest.mark.parametrize(
+    "terms",
+    [["license", "^def "], ["(?i)license", "zz"], [r"(z)\1", "license"]],
+)
+def test_trim_section_matches_any_important_term(terms):
+    lines = [f"row {chr(97 + i % 26)}" for i in range(40)]
+    lines += ["LICENSE: MIT", "def main():", "zz marker"]
+    text = "\n".join(lines)
+
+    result = llm._trim_section_to_budget(text, token_budget=30, important_terms=terms)
+
+    kept = result.splitlines()
+    assert "LICENSE: MIT" in kept
+    assert kept == sorted(kept, key=lines.index)  # original order preserved
+
+
 # =====================================================================
 # _extract_json_from_response() - Additional cases
 # =====================================================================
@@ -598,3 +725,312 @@ def test_extract_json_invalid_embedded():
     content = "Here is result: {not: valid: json} and nothing else"
     result = llm._extract_json_from_response(content)
     assert result is None
+
+
+def test_extract_json_embedded_nested_object():
+    """Nested objects and braces inside strings are extracted whole."""
+    content = 'Result: {"scores": {"a": 0.5}, "note": "uses {braces}"} done'
+    result = llm._extract_json_from_response(content)
+    assert result == {"scores": {"a": 0.5}, "note": "uses {braces}"}
+
+
+def test_extract_json_skips_invalid_brace_before_valid_object():
+    content = 'Set {x} first, then {"score": 0.9}'
+    result = llm._extract_json_from_response(content)
+    assert result == {"score": 0.9}
+
+
+def test_extract_json_fenced_block_with_nested_objects():
+    content = 'Result:\n```json\n{"scores": {"a": 0.5}, "tags": ["x"]}\n```\nDone.'
+    result = llm._extract_json_from_response(content)
+    assert result == {"scores": {"a": 0.5}, "tags": ["x"]}
+
+
+def test_ask_llm_skips_request_body_log_when_debug_disabled(monkeypatch, mock_bedrock):
+    payload = {"output": {"message": {"content": [{"text": "a long enough answer"}]}}}
+    mock_bedrock.invoke_model.return_value = {
+        "body": MagicMock(read=lambda amt=None: json.dumps(payload).encode("utf-8"))
+    }
+    logged = []
+    monkeypatch.setattr(llm.clogger, "is_debug_enabled", lambda: False)
+    monkeypatch.setattr(llm.clogger, "debug", lambda msg, *a, **k: logged.append(msg))
+
+    assert llm.ask_llm("secret prompt") == "a long enough answer"
+    assert not any("secret prompt" in msg for msg in logged)
+
+
+# =====================================================================
+# BATCH
+# =====================================================================
+
+
+def test_ask_llm_batch_preserves_order(mock_bedrock):
+    def respond(modelId, body):
+        prompt = json.loads(body)["messages"][0]["content"][0]["text"]
+        return _nova_body(f'{{"echo": "{prompt}"}}')
+
+    mock_bedrock.invoke_model.side_effect = respond
+    prompts = [f"prompt-{i}" for i in range(12)]
+
+    results = llm.ask_llm_batch(prompts, return_json=True)
+
+    assert results == [{"echo": p} for p in prompts]
+
+
+def test_ask_llm_batch_empty(mock_bedrock):
+    assert llm.ask_llm_batch([]) == []
+    mock_bedrock.invoke_model.assert_not_called()
+
+
+# =====================================================================
+# RESPONSE CACHE
+# =====================================================================
+
+
+def _nova_body(text):
+    payload = {"output": {"message": {"content": [{"text": text}]}}, "stopReason": "end_turn"}
+    return {"body": MagicMock(read=lambda amt=None: json.dumps(payload).encode("utf-8"))}
+
+
+@pytest.fixture
+def llm_cache_enabled(monkeypatch):
+    """
+    Turn on the opt-in response cache (MODELGUARD_LLM_CACHE=1).
+    """
+    monkeypatch.setattr(llm, "LLM_RESPONSE_CACHE_ENABLED", True)
+
+
+def test_ask_llm_caches_identical_prompts(llm_cache_enabled, mock_bedrock):
+    mock_bedrock.invoke_model.side_effect = lambda **_: _nova_body('{"score": 0.7, "tags": ["a"]}')
+
+    first = llm.ask_llm("same prompt", return_json=True, temperature=0.0)
+    # callers mutating the result (nested values included) must not poison the cache
+    first["score"] = 0.0
+    first["tags"].append("b")
+    second = llm.ask_llm("same prompt", return_json=True, temperature=0.0)
+
+    assert second == {"score": 0.7, "tags": ["a"]}
+    assert mock_bedrock.invoke_model.call_count == 1
+
+    llm.ask_llm("same prompt", return_json=True, max_tokens=50, temperature=0.0)
+    assert mock_bedrock.invoke_model.call_count == 2
+
+
+def test_ask_llm_does_not_cache_sampled_responses(llm_cache_enabled, mock_bedrock):
+    mock_bedrock.invoke_model.side_effect = lambda **_: _nova_body('{"score": 0.7}')
+
+    llm.ask_llm("same prompt", return_json=True)
+    llm.ask_llm("same prompt", return_json=True)
+
+    assert mock_bedrock.invoke_model.call_count == 2
+
+
+def test_ask_llm_does_not_cache_failures(llm_cache_enabled, mock_bedrock):
+    mock_bedrock.invoke_model.side_effect = lambda **_: _nova_body("no json here at all")
+
+    assert llm.ask_llm("p", return_json=True, temperature=0.0) is None
+    assert llm.ask_llm("p", return_json=True, temperature=0.0) is None
+    assert mock_bedrock.invoke_model.call_count == 2
+
+
+def test_ask_llm_cache_is_off_by_default(mock_bedrock):
+    mock_bedrock.invoke_model.side_effect = lambda **_: _nova_body('{"score": 0.7}')
+
+    llm.ask_llm("same prompt", return_json=True, temperature=0.0)
+    llm.ask_llm("same prompt", return_json=True, temperature=0.0)
+
+    assert mock_bedrock.invoke_model.call_count == 2
+
+
+def test_response_cache_evicts_least_recently_used(llm_cache_enabled, monkeypatch, mock_bedrock):
+    monkeypatch.setattr(llm, "LLM_RESPONSE_CACHE_MAX_ENTRIES", 2)
+    mock_bedrock.invoke_model.side_effect = lambda **_: _nova_body("a long enough answer")
+
+    llm.ask_llm("a", temperature=0.0)
+    llm.ask_llm("b", temperature=0.0)
+    llm.ask_llm("a", temperature=0.0)  # refresh "a"
+    llm.ask_llm("c", temperature=0.0)  # evicts "b"
+    llm.ask_llm("a", temperature=0.0)
+    assert mock_bedrock.invoke_model.call_count == 3
+
+    llm.ask_llm("b", temperature=0.0)
+    assert mock_bedrock.invoke_model.call_count == 4
+
+
+# =====================================================================
+# STREAMING
+# =====================================================================
+
+
+def _stream_events(*payloads):
+    return [{"chunk": {"bytes": json.dumps(p).encode("utf-8")}} for p in payloads]
+
+
+def _delta(text):
+    return {"contentBlockDelta": {"delta": {"text": text}, "contentBlockIndex": 0}}
+
+
+def test_ask_llm_stream_returns_joined_text(mock_bedrock):
+    events = _stream_events(
+        {"messageStart": {"role": "assistant"}},
+        _delta("Hello "),
+        _delta("streaming world"),
+        {"messageStop": {"stopReason": "end_turn"}},
+    )
+    mock_bedrock.invoke_model_with_response_stream.return_value = {"body": iter(events)}
+
+    result = llm.ask_llm("hi", stream=True)
+
+    assert result == "Hello streaming world"
+    mock_bedrock.invoke_model.assert_not_called()
+
+
+def test_ask_llm_stream_stops_after_complete_json(mock_bedrock):
+    body = MagicMock()
+    body.__iter__.return_value = iter(
+        _stream_events(
+            _delta('{"score": {"value": 0.8'),
+            _delta("}}"),
+            _delta(" trailing commentary that should never be read"),
+        )
+    )
+    mock_bedrock.invoke_model_with_response_stream.return_value = {"body": body}
+
+    content, stop_reason = llm._read_response_stream({"body": body}, stop_at_json=True)
+
+    assert content == '{"score": {"value": 0.8}}'
+    assert stop_reason == "json_complete"
+    body.close.assert_called_once()
+
+    body.__iter__.return_value = iter(_stream_events(_delta('{"code_quality": 0.6}')))
+    assert llm.ask_llm("hi", return_json=True, stream=True) == {"code_quality": 0.6}
+
+
+def test_read_response_stream_does_not_stop_inside_think_block():
+    body = MagicMock()
+    body.__iter__.return_value = iter(
+        _stream_events(
+            _delta('<think>maybe {"score": 0.1}'),
+            _delta("? no.</think>\n"),
+            _delta('{"score": 0.9}'),
+            _delta(" trailing commentary"),
+        )
+    )
+
+    content, stop_reason = llm._read_response_stream({"body": body}, stop_at_json=True)
+
+    assert content == '<think>maybe {"score": 0.1}? no.</think>\n{"score": 0.9}'
+    assert stop_reason == "json_complete"
+    assert llm._extract_json_from_response(content) == {"score": 0.9}
+
+
+def test_extract_json_ignores_think_block():
+    content = '<think>maybe {"score": 0.1}?</think>\nFinal: {"score": 0.9}'
+    assert llm._extract_json_from_response(content) == {"score": 0.9}
+
+
+def test_extract_json_repairs_trailing_commas():
+    content = 'Answer: {"scores": [0.5, 0.7,], "ok": true,}'
+    assert llm._extract_json_from_response(content) == {"scores": [0.5, 0.7], "ok": True}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_extract_json_with_and_without_orjson(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(llm, "orjson", None)
+
+    assert llm._extract_json_from_response('{"a": 1}') == {"a": 1}
+    assert llm._extract_json_from_response('```json\n{"b": [2]}\n```') == {"b": [2]}
+    assert llm._extract_json_from_response("not json") is None
+
+
+# =====================================================================
+# REQUEST ENCODING
+# =====================================================================
+
+
+def test_encode_request_body_matches_nova_schema():
+    prompt = 'Say "hi"\n\t{braces} and unicode é'
+    body = json.loads(llm._encode_request_body(prompt, 321, 0.25))
+
+    assert body == {
+        "messages": [{"role": "user", "content": [{"text": prompt}]}],
+        "inferenceConfig": {"max_new_tokens": 321, "temperature": 0.25},
+    }
+
+
+# =====================================================================
+# JSON SCHEMA (TOOL USE)
+# =====================================================================
+
+_SCORE_SCHEMA = {"type": "object", "properties": {"score": {"type": "number"}}}
+
+
+def _tool_use_body(tool_input):
+    payload = {
+        "output": {
+            "message": {
+                "content": [
+                    {"toolUse": {"toolUseId": "t1", "name": "emit_json", "input": tool_input}}
+                ]
+            }
+        },
+        "stopReason": "tool_use",
+    }
+    return {"body": MagicMock(read=lambda amt=None: json.dumps(payload).encode("utf-8"))}
+
+
+def test_ask_llm_json_schema_returns_tool_input(mock_bedrock):
+    mock_bedrock.invoke_model.return_value = _tool_use_body({"score": 0.8, "note": "None"})
+
+    result = llm.ask_llm("prompt", json_schema=_SCORE_SCHEMA, stream=True)
+
+    assert result == {"score": 0.8, "note": None}
+    mock_bedrock.invoke_model_with_response_stream.assert_not_called()
+    body = json.loads(mock_bedrock.invoke_model.call_args.kwargs["body"])
+    tool_config = body["toolConfig"]
+    assert tool_config["toolChoice"] == {"tool": {"name": "emit_json"}}
+    assert tool_config["tools"][0]["toolSpec"]["inputSchema"] == {"json": _SCORE_SCHEMA}
+
+
+def test_ask_llm_json_schema_falls_back_to_text_extraction(mock_bedrock):
+    mock_bedrock.invoke_model.return_value = _nova_body('Here: {"score": 0.4}')
+
+    assert llm.ask_llm("prompt", json_schema=_SCORE_SCHEMA) == {"score": 0.4}
+
+
+def test_ask_llm_json_schema_is_part_of_cache_key(llm_cache_enabled, mock_bedrock):
+    mock_bedrock.invoke_model.side_effect = [
+        _tool_use_body({"score": 0.1}),
+        _tool_use_body({"score": 0.2}),
+    ]
+    other_schema = {"type": "object", "properties": {"score": {"type": "integer"}}}
+
+    assert llm.ask_llm("prompt", json_schema=_SCORE_SCHEMA, temperature=0.0) == {"score": 0.1}
+    assert llm.ask_llm("prompt", json_schema=other_schema, temperature=0.0) == {"score": 0.2}
+    assert llm.ask_llm("prompt", json_schema=_SCORE_SCHEMA, temperature=0.0) == {"score": 0.1}
+    assert mock_bedrock.invoke_model.call_count == 2
+
+
+# =====================================================================
+# CLIENT WARM-UP
+# =====================================================================
+
+
+def test_warm_bedrock_client_uses_configured_region(monkeypatch):
+    regions = []
+    monkeypatch.setattr(llm, "BEDROCK_REGION", "us-west-2")
+    monkeypatch.setattr(llm, "get_bedrock_runtime", lambda region=None: regions.append(region))
+
+    llm.warm_bedrock_client()
+
+    assert regions == ["us-west-2"]
+
+
+def test_warm_bedrock_client_swallows_errors(monkeypatch):
+    def boom(region=None):
+        raise RuntimeError("no credentials")
+
+    monkeypatch.setattr(llm, "get_bedrock_runtime", boom)
+
+    llm.warm_bedrock_client()  # must not raise at import time
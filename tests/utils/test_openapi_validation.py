@@ -4,6 +4,7 @@ Tests for OpenAPI validation utilities.
 
 from unittest.mock import patch
 
+import src.utils.openapi_validation as openapi_validation
 from src.utils.openapi_validation import (
     _normalize_path,
     validate_request,
@@ -88,6 +89,17 @@ def test_normalize_path_reset():
     assert result == "/reset"
 
 
+def test_normalize_path_is_memoized():
+    """Repeated paths are served from the cache."""
+    _normalize_path.cache_clear()
+
+    _normalize_path("/artifact/model/abc-123/rate")
+    result = _normalize_path("/artifact/model/abc-123/rate")
+
+    assert result == "/artifact/model/{id}/rate"
+    assert _normalize_path.cache_info().hits == 1
+
+
 # =============================================================================
 # Request Validation Tests
 # =============================================================================
@@ -364,3 +376,99 @@ def test_validate_response_normalized_path():
             body={},
         )
         assert is_valid is True
+
+
+# =============================================================================
+# Endpoint Index Tests
+# =============================================================================
+
+
+def test_endpoint_index_rebuilds_when_spec_changes():
+    """The index follows whichever spec object is currently loaded."""
+    first = {"paths": {"/health": {"get": {"responses": {"200": {}}}}}}
+    second = {"paths": {"/health": {"get": {"responses": {"503": {}}}}}}
+
+    with patch("src.utils.openapi_validation.OPENAPI_SPEC", first):
+        assert validate_response("/health", "GET", 200, None)[0] is True
+    with patch("src.utils.openapi_validation.OPENAPI_SPEC", second):
+        assert validate_response("/health", "GET", 200, None)[0] is False
+
+
+def test_validate_request_reports_violations_in_spec_order():
+    """Header and query violations keep the order of the spec's parameters."""
+    fake_spec = {
+        "paths": {
+            "/search": {
+                "get": {
+                    "parameters": [
+                        {"name": "q", "in": "query", "required": True},
+                        {"name": "X-Authorization", "in": "header", "required": True},
+                        {"name": "X-Trace", "in": "header", "required": True},
+                        {"name": "page", "in": "query", "required": False},
+                    ]
+                }
+            }
+        }
+    }
+    with patch("src.utils.openapi_validation.OPENAPI_SPEC", fake_spec):
+        is_valid, violations = validate_request(
+            endpoint="/search",
+            method="GET",
+            headers={"X-TRACE": "1"},
+            query_params={},
+            path_params={},
+            body=None,
+        )
+    assert is_valid is False
+    assert violations == [
+        "Missing required header: X-Authorization",
+        "Missing required query param: q",
+    ]
+
+
+# =============================================================================
+# Spec Loading Tests
+# =============================================================================
+
+
+def test_load_spec_prefers_rendered_json(tmp_path, monkeypatch):
+    """The rendered JSON is loaded instead of the YAML once it exists."""
+    yaml_path = tmp_path / "spec.yaml"
+    yaml_path.write_text("paths:\n  /health:\n    get:\n      responses:\n        200: {}\n")
+    monkeypatch.setattr(openapi_validation, "SPEC_PATH", yaml_path)
+    monkeypatch.setattr(openapi_validation, "SPEC_JSON_PATH", tmp_path / "spec.json")
+
+    from_yaml = openapi_validation._load_spec()
+    openapi_validation.render_spec_json()
+    yaml_path.unlink()
+
+    assert openapi_validation._load_spec() == {
+        "paths": {"/health": {"get": {"responses": {"200": {}}}}}
+    }
+    assert from_yaml["paths"]["/health"]["get"]["responses"] == {200: {}}
+
+
+def test_load_spec_missing_files_returns_empty(tmp_path, monkeypatch):
+    """Without either spec file, validation is disabled via an empty spec."""
+    monkeypatch.setattr(openapi_validation, "SPEC_PATH", tmp_path / "spec.yaml")
+    monkeypatch.setattr(openapi_validation, "SPEC_JSON_PATH", tmp_path / "spec.json")
+
+    assert openapi_validation._load_spec() == {}
+
+
+def test_validate_request_header_case_variants():
+    """Required headers match whether sent lower-case or mixed-case."""
+    fake_spec = {
+        "paths": {
+            "/secure": {
+                "get": {
+                    "parameters": [{"name": "X-Authorization", "in": "header", "required": True}]
+                }
+            }
+        }
+    }
+    with patch("src.utils.openapi_validation.OPENAPI_SPEC", fake_spec):
+        for headers in ({"x-authorization": "t"}, {"X-Authorization": "t"}):
+            is_valid, violations = validate_request("/secure", "GET", headers, {}, None)
+            assert is_valid is True
+            assert violations == []